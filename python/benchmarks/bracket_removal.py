@@ -0,0 +1,113 @@
+"""Benchmark of the bracket removal on the longest sessions of every term.
+
+The longest session of every electoral term in the session stores in data/01_raw/txt
+is used if the raw data has been split already, synthetic sessions otherwise.
+
+Run it with `uv run python benchmarks/bracket_removal.py`.
+"""
+
+import timeit
+from pathlib import Path
+
+import regex
+from sample_session import speeches
+
+from open_discourse.definitions import path
+from open_discourse.helper import clean_text
+from open_discourse.helper import extract_contributions as ec
+from open_discourse.helper.session_store import iter_sessions, store_files
+
+REPEAT = 3
+
+
+def remove_newlines_by_replacing(filetext):
+    # How remove_newlines_in_brackets worked before: every cleaned bracket was
+    # written back with a replace over the whole document.
+    for bracket in regex.finditer(r"\(([^(\)]*(\(([^(\)]*)\))*[^(\)]*)\)", filetext):
+        bracket_text = regex.sub(
+            r"(^((?<!Abg\.).)+|^.*\[.+)(-\n+)",
+            r"\1",
+            bracket.group(),
+            flags=regex.MULTILINE,
+        )
+        bracket_text = regex.sub(r"\n+", " ", bracket_text)
+        filetext = filetext.replace(bracket.group(), bracket_text)
+    return filetext
+
+
+def placeholders_by_slicing(speech_text):
+    # How extract rebuilt the speech text before: once per bracket.
+    brackets = list(ec.bracket_Pattern.finditer(speech_text))
+    for text_position, bracket in enumerate(reversed(brackets)):
+        start, end = bracket.span(1)
+        speech_text = (
+            speech_text[:start]
+            + "{"
+            + str(len(brackets) - 1 - text_position)
+            + "}"
+            + speech_text[end:]
+        )
+    return speech_text
+
+
+def placeholders_by_joining(speech_text):
+    return ec.extract_into(ec.Contributions(), speech_text, 19003, 0)[0]
+
+
+def longest_sessions(source_dir: Path) -> dict[str, str]:
+    """Returns the text of the longest session of every term store by name."""
+    sessions = {}
+    if not source_dir.exists():
+        return sessions
+    for store_path in store_files(source_dir).values():
+        longest = max(
+            iter_sessions(store_path, ["session", "session_content"]),
+            key=lambda session: len(session["session_content"]),
+            default=None,
+        )
+        if longest:
+            sessions[f"{store_path.stem}/{longest['session']}"] = longest[
+                "session_content"
+            ]
+    return sessions
+
+
+def synthetic_sessions() -> dict[str, str]:
+    return {
+        f"synthetic, {count} speeches": "\n".join(speeches(seed=count, count=count))
+        for count in (50, 200, 400)
+    }
+
+
+def best_of(func, *args):
+    return min(timeit.repeat(lambda: func(*args), number=1, repeat=REPEAT))
+
+
+def main():
+    sessions = longest_sessions(path.RAW_TXT) or synthetic_sessions()
+
+    for name, text in sessions.items():
+        brackets = len(ec.bracket_Pattern.findall(text))
+        print(f"{name}: {len(text):,} characters, {brackets:,} brackets")
+
+        assert placeholders_by_slicing(text) == placeholders_by_joining(text)
+        replacing = best_of(remove_newlines_by_replacing, text)
+        single_pass = best_of(clean_text.remove_newlines_in_brackets, text)
+        print("  remove_newlines_in_brackets:")
+        print(f"    replace per bracket: {replacing:8.3f} s")
+        print(
+            f"    single pass:         {single_pass:8.3f} s "
+            f"({replacing / single_pass:.1f}x)"
+        )
+
+        # extract_into also extracts the contributions, so the slicing alone is
+        # compared to the whole function.
+        slicing = best_of(placeholders_by_slicing, text)
+        extracting = best_of(placeholders_by_joining, text)
+        print("  placeholders:")
+        print(f"    slicing per bracket: {slicing:8.3f} s")
+        print(f"    extract_into:        {extracting:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark of helper/extract_contributions on a synthetic session.
+
+Run it with `uv run python benchmarks/extract_contributions.py`.
+"""
+
+import random
+import timeit
+
+import pandas as pd
+import regex
+from sample_session import bracket, speeches
+
+from open_discourse.helper import extract_contributions as ec
+
+SESSION = 19003
+REPEAT = 5
+
+
+def build_and_search(texts):
+    # How the extractors worked before the pattern registry: the patterns were
+    # built for every bracket and looked up in the cache of the regex module.
+    for text in texts:
+        applause_Pattern = (
+            ec.start_contributions_opening_bracket_Pattern.format("")
+            + ec.base_applause_Pattern
+            + ec.start_contributions_closing_bracket_Pattern.format("")
+        )
+        list(regex.finditer(applause_Pattern, text))
+        for faction in ec.parties:
+            regex.search(r"(?<!\[)(" + ec.parties[faction] + r")(?![^[\s]*\])", text)
+
+
+def search_compiled(texts):
+    for text in texts:
+        list(ec.contribution_Patterns["applause"].finditer(text))
+        for faction_Pattern in ec.faction_Patterns.values():
+            faction_Pattern.search(text)
+
+
+def extract_frames_per_speech(session_speeches):
+    # How the contributions step worked before the Contributions buffers
+    results = [
+        ec.extract(speech, SESSION, identity)
+        for identity, speech in enumerate(session_speeches)
+    ]
+    pd.concat([result[0] for result in results])
+    pd.concat([result[2] for result in results])
+
+
+def extract_into_session(session_speeches):
+    contributions = ec.Contributions()
+    for identity, speech in enumerate(session_speeches):
+        ec.extract_into(contributions, speech, SESSION, identity)
+    contributions.extended_frame()
+    contributions.simplified_frame()
+
+
+def best_of(func, *args):
+    return min(timeit.repeat(lambda: func(*args), number=1, repeat=REPEAT))
+
+
+def main():
+    rand = random.Random(0)
+    texts = [bracket(rand) for _ in range(2000)]
+    session_speeches = speeches()
+
+    built = best_of(build_and_search, texts)
+    compiled = best_of(search_compiled, texts)
+    print(f"pattern lookup, {len(texts)} brackets:")
+    print(f"  built per bracket: {built * 1000:8.1f} ms")
+    print(f"  compiled registry: {compiled * 1000:8.1f} ms ({built / compiled:.1f}x)")
+
+    brackets = sum(len(ec.bracket_Pattern.findall(s)) for s in session_speeches)
+    seconds = best_of(extract_into_session, session_speeches)
+    print(f"extract, {len(session_speeches)} speeches, {brackets} brackets:")
+    print(f"  {seconds:.2f} s ({brackets / seconds:,.0f} brackets/s)")
+
+    # Most speeches contain only a few contributions.
+    short_speeches = speeches(count=1000, brackets=(0, 1, 1, 2, 3, 5))
+    per_speech = best_of(extract_frames_per_speech, short_speeches)
+    accumulated = best_of(extract_into_session, short_speeches)
+    print(f"session of {len(short_speeches)} short speeches:")
+    print(f"  frames per speech: {per_speech:.2f} s")
+    print(f"  Contributions:     {accumulated:.2f} s ({per_speech / accumulated:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Synthetic plenary sessions for the benchmarks.
+
+The speeches mimic the contributions found in the protocols: applause, shouts,
+person interjections, laughter etc. with parties, members of parliament and
+their constituencies. They are generated from a seed, so every run of a
+benchmark works on the same text.
+"""
+
+import random
+
+NAMES = [
+    "Dr. Hans Müller",
+    "Anna Schmidt",
+    "Gregor Gysi",
+    "Dr. h. c. Peter Meyer",
+    "Katrin Göring-Eckardt",
+    "Wolfgang Schäuble",
+    "Cem Özdemir",
+    "Otto Graf Lambsdorff",
+]
+FACTIONS = [
+    "SPD",
+    "CDU/CSU",
+    "FDP",
+    "BÜNDNIS 90/DIE GRÜNEN",
+    "DIE LINKE",
+    "AfD",
+    "PDS/Linke Liste",
+    "fraktionslos",
+    "DP",
+    "KPD",
+    "GB/BHE",
+    "Zentrum",
+    "BP",
+]
+CONSTITUENCIES = ["Hamburg", "Berlin", "Bayreuth", "Köln"]
+PREFIXES = ["bei der", "im", "bei Abgeordneten der", "beim", "des", ""]
+SIDES = ["links", "rechts", "der Mitte"]
+CONTENTS = ["Das ist doch Unsinn!", "Hört! Hört!", "Quatsch!", "Wo denn?", "Na also!"]
+WORDS = (
+    "Meine Damen und Herren wir haben heute über den Haushalt zu beraten und die "
+    "Bundesregierung hat dazu einen Entwurf vorgelegt der nicht überzeugt"
+).split()
+
+
+def person(rand):
+    name = rand.choice(NAMES)
+    faction = rand.choice(FACTIONS)
+    variant = rand.random()
+    if variant < 0.3:
+        return f"Abg. {name} [{faction}]"
+    if variant < 0.5:
+        return f"Abg. {name} ({faction})"
+    if variant < 0.6:
+        return f"Abg. {name} ({rand.choice(CONSTITUENCIES)}) [{faction}]"
+    if variant < 0.8:
+        return f"des Abg. {name} [{faction}]"
+    return f"{name} [{faction}]"
+
+
+def initiators(rand):
+    parts = []
+    for _ in range(rand.randint(1, 3)):
+        variant = rand.random()
+        if variant < 0.5:
+            parts.append(f"{rand.choice(PREFIXES)} {rand.choice(FACTIONS)}".strip())
+        elif variant < 0.75:
+            parts.append(person(rand))
+        elif variant < 0.9:
+            parts.append(rand.choice(SIDES))
+        else:
+            parts.append("bei den Regierungsparteien")
+    return rand.choice([" und ", ", ", " sowie ", " sowie des "]).join(parts)
+
+
+def contribution(rand):
+    variant = rand.random()
+    if variant < 0.25:
+        return f"{rand.choice(['', 'Lebhafter ', 'Anhaltender '])}Beifall {initiators(rand)}"
+    if variant < 0.35:
+        return f"{person(rand)}: {rand.choice(CONTENTS)}"
+    if variant < 0.5:
+        return (
+            f"{rand.choice(['Zuruf', 'Zurufe', 'Gegenruf'])} von der "
+            f"{rand.choice(FACTIONS)}: {rand.choice(CONTENTS)}"
+        )
+    if variant < 0.55:
+        return f"Zuruf des {person(rand)}: {rand.choice(CONTENTS)}"
+    if variant < 0.65:
+        return f"Heiterkeit {initiators(rand)}"
+    if variant < 0.7:
+        return f"Widerspruch {initiators(rand)}"
+    if variant < 0.8:
+        return f"Lachen {initiators(rand)}"
+    if variant < 0.9:
+        return f"{rand.choice(['Sehr richtig!', 'Zustimmung', 'Bravo!'])} {initiators(rand)}"
+    if variant < 0.95:
+        return f"{rand.choice(FACTIONS)}: {rand.choice(CONTENTS)}"
+    return f"Unruhe {initiators(rand)}"
+
+
+def bracket(rand):
+    text = " – ".join(contribution(rand) for _ in range(rand.choice([1, 1, 1, 2, 3])))
+    if rand.random() < 0.15:
+        text = text.replace(" ", "\n", 2)
+    return "(" + text + ")"
+
+
+def words(rand, low, high):
+    return " ".join(rand.choice(WORDS) for _ in range(rand.randint(low, high)))
+
+
+def speech(rand, brackets):
+    parts = []
+    for _ in range(brackets):
+        parts.extend((words(rand, 5, 60), bracket(rand)))
+    parts.append(words(rand, 5, 40) + ".")
+    return ("\n" if rand.random() < 0.3 else " ").join(parts)
+
+
+def speeches(seed=0, count=200, brackets=(0, 1, 3, 8, 20, 60)):
+    """Returns count speeches with a random number of contributions each."""
+    rand = random.Random(seed)
+    return [speech(rand, rand.choice(brackets)) for _ in range(count)]
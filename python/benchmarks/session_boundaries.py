@@ -0,0 +1,110 @@
+"""Benchmark of the session boundaries of the first two electoral terms.
+
+get_session_content finds the begin and the end of the spoken content of a term 1
+or 2 protocol. Every protocol of these terms is used if the XML files have been
+downloaded, synthetic protocols otherwise. The benchmark reports the median and
+the worst time per protocol.
+
+Run it with `uv run python benchmarks/session_boundaries.py`.
+"""
+
+import random
+import statistics
+import timeit
+
+from sample_session import speeches
+
+from open_discourse.helper import parser
+from open_discourse.helper.archive import xml_source_dir
+from open_discourse.helper.clean_text import clean
+from open_discourse.helper.session_index import session_index
+from open_discourse.steps.preprocessing.split_xml import split_single_session_xml_data
+
+REPEAT = 3
+BOUNDARIES = {
+    "begin": (parser.BEGIN_PATTERN, parser.BEGIN_ANCHOR, parser.BEGIN_WORDS),
+    "appendix": (
+        parser.APPENDIX_PATTERN,
+        parser.APPENDIX_ANCHOR,
+        parser.APPENDIX_WORDS,
+    ),
+}
+
+
+def protocols() -> dict[str, str]:
+    """Returns the text of every protocol of terms 1 and 2 by name, as split_xml
+    passes it to get_session_content."""
+    source_dir = xml_source_dir()
+    texts = {}
+    if not source_dir.exists():
+        return texts
+    for term_number, xml_file_paths in session_index(source_dir, "*.xml").items():
+        if term_number > 2:
+            continue
+        for xml_file_path in xml_file_paths:
+            _, text_corpus = split_single_session_xml_data(xml_file_path)
+            texts[xml_file_path.stem] = clean(text_corpus) + "\n\nEND OF FILE"
+    return texts
+
+
+def synthetic_protocols(count: int = 20) -> dict[str, str]:
+    # The table of content of a protocol lists many items with "Sitzung", "wird"
+    # and times, that's where the lazy wildcards backtrack the most.
+    rand = random.Random(0)
+    texts = {}
+    for seed in range(count):
+        toc = "\n".join(
+            f"Die {rand.randint(1, 300)}. Sitzung des Ausschusses wird auf "
+            f"{rand.randint(1, 24)} Uhr verlegt, Antrag der Fraktion der "
+            f"{rand.choice(['SPD', 'CDU/CSU', 'FDP', 'DP', 'KPD'])} betreffend die "
+            f"Sitzung {rand.randint(1, 99)} {' '.join(['und die Sitzung'] * 20)}"
+            for _ in range(rand.randint(100, 400))
+        )
+        texts[f"synthetic {seed:02}"] = (
+            f"{toc}\nDie Sitzung wird um 9 Uhr 2 Minuten durch den Präsidenten "
+            "Dr. Köhler eröffnet.\n"
+            + "\n".join(speeches(seed=seed, count=100))
+            + "\n(Schluß der Sitzung: 19 Uhr 43 Minuten.)\n\nEND OF FILE"
+        )
+    return texts
+
+
+def best_of(func, *args):
+    return min(timeit.repeat(lambda: func(*args), number=1, repeat=REPEAT))
+
+
+def finditer(pattern, text, anchor, words):
+    # How get_session_content searched before: the pattern over the whole text.
+    return list(pattern.finditer(text))
+
+
+def report(name: str, times: dict[str, float]):
+    worst = max(times, key=times.get)
+    print(
+        f"    {name:<13} median {statistics.median(times.values()) * 1000:8.2f} ms"
+        f"  worst {times[worst] * 1000:8.2f} ms ({worst})"
+    )
+
+
+def main():
+    texts = protocols() or synthetic_protocols()
+    print(f"{len(texts)} protocols, {sum(map(len, texts.values())):,} characters")
+
+    for boundary, (pattern, anchor, words) in BOUNDARIES.items():
+        whole_text = {}
+        lines = {}
+        for name, text in texts.items():
+            expected = [match.span() for match in pattern.finditer(text)]
+            found = parser.find_in_lines(pattern, text, anchor, words)
+            assert [match.span() for match in found] == expected, name
+
+            whole_text[name] = best_of(finditer, pattern, text, anchor, words)
+            lines[name] = best_of(parser.find_in_lines, pattern, text, anchor, words)
+
+        print(f"  {boundary} pattern:")
+        report("whole text:", whole_text)
+        report("anchor lines:", lines)
+
+
+if __name__ == "__main__":
+    main()
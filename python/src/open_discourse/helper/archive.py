@@ -0,0 +1,97 @@
+import os
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+
+from open_discourse.definitions.path import RAW_XML, RAW_ZIP
+
+
+def open_archive(archive_path: Path) -> zipfile.ZipFile:
+    """
+    Returns an opened ZIP archive, shared by all readers of a process.
+
+    The central directory of an archive is read once per process and version of
+    the archive, i.e. until its size or modification time changes. A forked worker
+    process opens the archive again, as the file offset of an inherited file is
+    shared with the parent and the other workers.
+
+    Args:
+        archive_path (Path):    path of the ZIP archive
+
+    Returns:
+        zipfile.ZipFile: archive opened for reading
+    """
+    stat = os.stat(archive_path)
+    return _open_archive(str(archive_path), stat.st_mtime_ns, stat.st_size, os.getpid())
+
+
+@lru_cache(maxsize=32)
+def _open_archive(
+    archive_path: str, mtime_ns: int, size: int, pid: int
+) -> zipfile.ZipFile:
+    return zipfile.ZipFile(archive_path)
+
+
+def archive_members(archive_path: Path, suffix: str) -> list[str]:
+    """Returns the names of the files with suffix at the top level of an archive."""
+    return [
+        name
+        for name in open_archive(archive_path).namelist()
+        if name.endswith(suffix) and "/" not in name
+    ]
+
+
+def archive_member(archive_path: Path, member: str) -> zipfile.Path:
+    """
+    Returns a member of an archive as path.
+
+    Like a pathlib.Path of an extracted file, the path has a name, stem, suffix
+    and parent and is read with open or read_bytes, straight from the archive.
+
+    Args:
+        archive_path (Path):    path of the ZIP archive
+        member (str):           name of the member, e.g. "05001.xml"
+
+    Returns:
+        zipfile.Path: path of the member
+    """
+    return zipfile.Path(open_archive(archive_path), at=member)
+
+
+def xml_source_dir() -> Path:
+    """
+    Returns the directory the XML protocols of terms 1 to 19 are read from.
+
+    These are the downloaded archives in RAW_ZIP. The extracted protocols in
+    RAW_XML are only used if there are no archives, e.g. from an older download.
+    """
+    if RAW_ZIP.exists() and any(RAW_ZIP.glob("electoral_term_pp*.zip")):
+        return RAW_ZIP
+    return RAW_XML
+
+
+def path_reference(file_path: Path | zipfile.Path) -> tuple[str, str | None]:
+    """
+    Returns a picklable reference to a file or a member of an archive.
+
+    A zipfile.Path holds an opened archive and can't be sent to a worker process,
+    so the workers get the reference and open the member with resolve_reference.
+
+    Args:
+        file_path (Path | zipfile.Path):    file or member of an archive
+
+    Returns:
+        tuple[str, str | None]: path of the file resp. archive and the name of the
+                                member, None for a file
+    """
+    if isinstance(file_path, zipfile.Path):
+        return file_path.root.filename, file_path.at
+    return str(file_path), None
+
+
+def resolve_reference(reference: tuple[str, str | None]) -> Path | zipfile.Path:
+    """Returns the file or member of an archive of a path_reference."""
+    file_path, member = reference
+    if member is None:
+        return Path(file_path)
+    return archive_member(Path(file_path), member)
@@ -1,28 +1,53 @@
+import functools
+
 import numpy as np
 import regex
 
+# Characters misrecognized in the protocols and their replacement, applied in this
+# order. Tabs become spaces, so runs of spaces and tabs collapse in one pass.
+# Chained str.replace is much faster than str.translate on texts with umlauts.
+misrecognized_characters = [
+    ("\uf020", "-"),
+    ("\x96", "-"),
+    ("—", "-"),
+    ("–", "-"),
+    ("•", ""),
+    ("\t", " "),
+]
+spaces_pattern = regex.compile(r"  +")
+pdf_header_pattern = regex.compile(
+    r"(?:Deutscher\s?Bundestag\s?-(?:\s?\d{1,2}\s?[,.]\s?Wahlperiode\s?-)?)?\s?\d{1,3}\s?[,.]\s?Sitzung\s?[,.]\s?(?:(?:Bonn|Berlin)[,.])?\s?[^,.]+,\s?den\s?\d{1,2}\s?[,.]\s?[^\d]+\d{4}.*"
+)
+# Markers of the four sections of a pdf page, (A) to (D)
+margin_marker_pattern = regex.compile(r"\([A-D]\)")
+# All characters matched by \s
+whitespace = (
+    "\t\n\x0b\x0c\r \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006"
+    "\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+delimiter_pattern = regex.compile(r"-\n+(?![^(]*\))")
+# Finds all text within parentheses, including nested parentheses
+brackets_pattern = regex.compile(r"\(([^(\)]*(\(([^(\)]*)\))*[^(\)]*)\)")
+bracket_hyphen_pattern = regex.compile(
+    r"(^((?<!Abg\.).)+|^.*\[.+)(-\n+)", flags=regex.MULTILINE
+)
+newlines_pattern = regex.compile(r"\n+")
+page_number_pattern = regex.compile(r"\n\d+ *\n")
+
 
 def clean(filetext: str, remove_pdf_header: bool = True) -> str:
-    # Replaces all the misrecognized characters
-    filetext = filetext.replace(r"", "-")
-    filetext = filetext.replace(r"", "-")
-    filetext = filetext.replace("—", "-")
-    filetext = filetext.replace("–", "-")
-    filetext = filetext.replace("•", "")
-    filetext = regex.sub(r"\t+", " ", filetext)
-    filetext = regex.sub(r"  +", " ", filetext)
+    # Replaces all the misrecognized characters and tabs
+    for character, replacement in misrecognized_characters:
+        filetext = filetext.replace(character, replacement)
+    filetext = spaces_pattern.sub(" ", filetext)
 
     # Remove pdf artifact
     if remove_pdf_header:
-        filetext = regex.sub(
-            r"(?:Deutscher\s?Bundestag\s?-(?:\s?\d{1,2}\s?[,.]\s?Wahlperiode\s?-)?)?\s?\d{1,3}\s?[,.]\s?Sitzung\s?[,.]\s?(?:(?:Bonn|Berlin)[,.])?\s?[^,.]+,\s?den\s?\d{1,2}\s?[,.]\s?[^\d]+\d{4}.*",
-            r"\n",
-            filetext,
-        )
-        filetext = regex.sub(r"\s*(\(A\)|\(B\)|\(C\)|\(D\))", "", filetext)
+        filetext = pdf_header_pattern.sub(r"\n", filetext)
+        filetext = remove_margin_markers(filetext)
 
     # Remove delimeter
-    filetext = regex.sub(r"-\n+(?![^(]*\))", "", filetext)
+    filetext = delimiter_pattern.sub("", filetext)
 
     # Deletes all the newlines in brackets
     filetext = remove_newlines_in_brackets(filetext)
@@ -30,26 +55,32 @@ def clean(filetext: str, remove_pdf_header: bool = True) -> str:
     return filetext
 
 
+def remove_margin_markers(filetext: str) -> str:
+    # Same as regex.sub(r"\s*\([A-D]\)", "", filetext), but only the markers are
+    # searched instead of trying a match at every whitespace.
+    segments = []
+    segment_start = 0
+    for marker in margin_marker_pattern.finditer(filetext):
+        segments.append(filetext[segment_start : marker.start()].rstrip(whitespace))
+        segment_start = marker.end()
+    segments.append(filetext[segment_start:])
+    return "".join(segments)
+
+
 def remove_newlines_in_brackets(filetext: str) -> str:
-    # Finds all text within parentheses, including nested parentheses
-    bracket_text = regex.finditer(r"\(([^(\)]*(\(([^(\)]*)\))*[^(\)]*)\)", filetext)
-
-    for bracket in bracket_text:
-        bracket_text = bracket.group()
-
-        # Remove hyphen followed by newline if not preceded by "Abg." or if it is part of a text within square brackets
-        bracket_text = regex.sub(
-            r"(^((?<!Abg\.).)+|^.*\[.+)(-\n+)",
-            r"\1",
-            bracket_text,
-            flags=regex.MULTILINE,
-        )
-        # Replace newline with spaces
-        bracket_text = regex.sub(r"\n+", " ", bracket_text)
-        # Replace the original text with the cleaned text
-        filetext = filetext.replace(bracket.group(), bracket_text)
+    # Every bracket is replaced by its cleaned text in a single pass over filetext.
+    return brackets_pattern.sub(_remove_newlines_in_bracket, filetext)
 
-    return filetext
+
+def _remove_newlines_in_bracket(bracket: regex.Match) -> str:
+    bracket_text = bracket.group()
+    if "\n" not in bracket_text:
+        return bracket_text
+
+    # Remove hyphen followed by newline if not preceded by "Abg." or if it is part of a text within square brackets
+    bracket_text = bracket_hyphen_pattern.sub(r"\1", bracket_text)
+    # Replace newline with spaces
+    return newlines_pattern.sub(" ", bracket_text)
 
 
 def clean_name_headers(
@@ -59,21 +90,50 @@ def clean_name_headers(
     Usually something like: "Präsident Dr. Lammert"
     Keep in mind this also deletes lines from voting lists.
     """
+    return remove_name_headers(
+        filetext, get_name_headers_pattern(names, contributions_extended_filter)
+    )
+
+
+def get_name_headers_pattern(
+    names: list[str], contributions_extended_filter: bool = False
+) -> regex.Pattern:
+    """
+    Returns the compiled pattern of clean_name_headers for the names of a session.
+
+    The pattern is compiled once per set of names and cached, so all speeches of a
+    session share it, see remove_name_headers.
+
+    Args:
+        names (list[str]):                      raw names of the speakers, e.g. the
+                                                name_raw column
+        contributions_extended_filter (bool):   remove brackets from the names
+
+    Returns:
+        regex.Pattern: pattern matching the header lines with one of the names
+    """
+    return _compile_name_headers_pattern(tuple(names), contributions_extended_filter)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_name_headers_pattern(
+    names: tuple[str, ...], contributions_extended_filter: bool
+) -> regex.Pattern:
     if contributions_extended_filter:
         table = {ord(c): "" for c in "()[]{}"}
         names = np.unique([name.translate(table) for name in names])
 
+    # The names are part of the pattern, e.g. the "." of "Dr." matches any character.
     table = {ord("+"): "\\+", ord("*"): "\\*", ord("?"): "\\?"}
     names_to_clean = ("(" + "|".join(names) + ")").translate(table)
-    pattern = (
+    return regex.compile(
         r"\n((?:Parl\s?\.\s)?Staatssekretär(?:in)?|Bundeskanzler(?:in)?|Bundesminister(?:in)?|Staatsminister(:?in)?)?\s?"
         + names_to_clean
         + r" *\n"
     )
-    filetext = regex.sub(pattern, "\n", filetext)
 
-    pattern = r"\n\d+ *\n"
 
-    filetext = regex.sub(pattern, "\n", filetext)
-
-    return filetext
+def remove_name_headers(filetext: str, name_headers_pattern: regex.Pattern) -> str:
+    """Removes the lines matched by get_name_headers_pattern and page numbers."""
+    filetext = name_headers_pattern.sub("\n", filetext)
+    return page_number_pattern.sub("\n", filetext)
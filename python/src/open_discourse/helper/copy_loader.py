@@ -0,0 +1,266 @@
+import io
+import time
+from collections.abc import Iterable
+from contextlib import contextmanager
+from typing import NamedTuple
+
+import pandas as pd
+from psycopg2 import sql
+
+# Schema of the open discourse tables, see database/src/model/open_discourse.
+SCHEMA = "open_discourse"
+# Rows sent with one COPY statement.
+CHUNK_SIZE = 50_000
+
+# COPY text format: columns are separated by tabs, NULL is \N and backslashes,
+# tabs and line breaks inside values are escaped with a backslash.
+NULL = "\\N"
+ESCAPES = [("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r")]
+INTEGER_TYPES = {"smallint", "integer", "bigint"}
+
+
+class LoadResult(NamedTuple):
+    table: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.rows:,} rows in {self.seconds:.1f}s "
+            f"({self.rows_per_second:,.0f} rows/s)"
+        )
+
+
+def copy_frames(
+    connection,
+    frames: Iterable[pd.DataFrame] | pd.DataFrame,
+    table: str,
+    schema: str = SCHEMA,
+    chunk_size: int = CHUNK_SIZE,
+    staging: bool = False,
+    defer_indexes: bool = True,
+) -> LoadResult:
+    """
+    Streams data frames into a table with COPY ... FROM STDIN.
+
+    The frames are sent in chunks of chunk_size rows, so they can come from a
+    generator, e.g. one Parquet row group at a time. Secondary indexes and stored
+    generated columns like the tsvector of speeches are dropped before the load and
+    rebuilt once afterwards, which is much cheaper than updating them for every
+    row. With staging, the rows are first copied into an unlogged staging table
+    without indexes and constraints and then moved into the table with a single
+    INSERT ... SELECT. Everything runs in one transaction, so on an error the table
+    is left as it was.
+
+    Args:
+        connection:                 psycopg2 connection
+        frames (Iterable[pd.DataFrame]): data frames with the columns to load, all
+                                    with the same columns
+        table (str):                name of the target table
+        schema (str):               schema of the target table
+        chunk_size (int):           rows per COPY statement
+        staging (bool):             load via an unlogged staging table
+        defer_indexes (bool):       rebuild indexes and generated columns after the
+                                    load
+
+    Returns:
+        LoadResult: number of rows loaded and the time it took
+    """
+    if isinstance(frames, pd.DataFrame):
+        frames = [frames]
+
+    start = time.perf_counter()
+    rows = 0
+    try:
+        with connection.cursor() as cursor:
+            column_types = get_column_types(cursor, schema, table)
+            target = sql.Identifier(schema, table)
+
+            with _deferred(cursor, schema, table, defer_indexes):
+                load_target = target
+                if staging:
+                    load_target = sql.Identifier(schema, f"{table}_staging")
+                    cursor.execute(
+                        sql.SQL(
+                            "CREATE UNLOGGED TABLE {} (LIKE {} INCLUDING DEFAULTS)"
+                        ).format(load_target, target)
+                    )
+
+                columns = None
+                for frame in frames:
+                    if columns is None:
+                        columns = list(frame.columns)
+                    for chunk_start in range(0, len(frame), chunk_size):
+                        chunk = frame.iloc[chunk_start : chunk_start + chunk_size]
+                        copy_chunk(cursor, chunk, load_target, columns, column_types)
+                        rows += len(chunk)
+
+                if staging:
+                    if columns:
+                        column_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+                        cursor.execute(
+                            sql.SQL("INSERT INTO {} ({}) SELECT {} FROM {}").format(
+                                target, column_list, column_list, load_target
+                            )
+                        )
+                    cursor.execute(sql.SQL("DROP TABLE {}").format(load_target))
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+
+    return LoadResult(table, rows, time.perf_counter() - start)
+
+
+def copy_chunk(
+    cursor,
+    chunk: pd.DataFrame,
+    table: sql.Composable,
+    columns: list[str],
+    column_types: dict[str, str],
+):
+    """Sends one chunk of rows with a single COPY statement."""
+    text = to_copy_text(chunk.loc[:, columns], column_types)
+    cursor.copy_expert(
+        sql.SQL("COPY {} ({}) FROM STDIN WITH (ENCODING 'UTF8')").format(
+            table, sql.SQL(", ").join(map(sql.Identifier, columns))
+        ),
+        io.BytesIO(text.encode("utf-8")),
+    )
+
+
+def to_copy_text(df: pd.DataFrame, column_types: dict[str, str] | None = None) -> str:
+    """
+    Formats a data frame in the text format of COPY.
+
+    Float columns loaded into integer columns, e.g. politician_id after a
+    np.where, are written without the decimal point.
+
+    Args:
+        df (pd.DataFrame):              rows to format
+        column_types (dict[str, str]):  data types of the target columns by name,
+                                        see get_column_types
+
+    Returns:
+        str: one line per row, terminated by a line break
+    """
+    if df.empty:
+        return ""
+    column_types = column_types or {}
+
+    # Every line is joined once, the long speech texts are not copied per column.
+    columns = [
+        format_column(df[column], column_types.get(column)).tolist()
+        for column in df.columns
+    ]
+    return "\n".join(map("\t".join, zip(*columns))) + "\n"
+
+
+def format_column(series: pd.Series, column_type: str | None = None) -> pd.Series:
+    """Formats the values of one column for COPY, missing values become NULL."""
+    null = series.isna()
+    if column_type in INTEGER_TYPES:
+        series = pd.to_numeric(series.where(~null, None)).astype("Int64")
+    if pd.api.types.is_bool_dtype(series):
+        values = series.map({True: "t", False: "f"})
+    elif pd.api.types.is_numeric_dtype(series):
+        values = series.astype(str)
+    else:
+        values = series.astype(str).map(escape)
+    return values.mask(null, NULL)
+
+
+def escape(value: str) -> str:
+    """Escapes backslashes, tabs and line breaks for the COPY text format."""
+    for char, escaped in ESCAPES:
+        if char in value:
+            value = value.replace(char, escaped)
+    return value
+
+
+def get_column_types(cursor, schema: str, table: str) -> dict[str, str]:
+    """Returns the data types of all columns of a table by column name."""
+    cursor.execute(
+        "SELECT column_name, data_type FROM information_schema.columns "
+        "WHERE table_schema = %s AND table_name = %s",
+        (schema, table),
+    )
+    column_types = dict(cursor.fetchall())
+    if not column_types:
+        raise ValueError(f"Invalid arg: table {schema}.{table} does not exist.")
+    return column_types
+
+
+def get_secondary_indexes(cursor, schema: str, table: str) -> list[tuple[str, str]]:
+    """Returns name and definition of all indexes not backing a constraint."""
+    cursor.execute(
+        "SELECT i.relname, pg_get_indexdef(i.oid) "
+        "FROM pg_index x "
+        "JOIN pg_class i ON i.oid = x.indexrelid "
+        "JOIN pg_class t ON t.oid = x.indrelid "
+        "JOIN pg_namespace n ON n.oid = t.relnamespace "
+        "WHERE n.nspname = %s AND t.relname = %s "
+        "AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.oid) "
+        "ORDER BY i.relname",
+        (schema, table),
+    )
+    return cursor.fetchall()
+
+
+def get_generated_columns(
+    cursor, schema: str, table: str
+) -> list[tuple[str, str, str]]:
+    """Returns name, type and expression of all stored generated columns."""
+    cursor.execute(
+        "SELECT a.attname, format_type(a.atttypid, a.atttypmod), "
+        "pg_get_expr(d.adbin, d.adrelid) "
+        "FROM pg_attribute a "
+        "JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum "
+        "WHERE a.attrelid = %s::regclass AND a.attgenerated = 's' "
+        "AND NOT a.attisdropped "
+        "ORDER BY a.attnum",
+        (f"{schema}.{table}",),
+    )
+    return cursor.fetchall()
+
+
+@contextmanager
+def _deferred(cursor, schema: str, table: str, defer: bool):
+    """Drops secondary indexes and generated columns and rebuilds them on exit."""
+    if not defer:
+        yield
+        return
+
+    target = sql.Identifier(schema, table)
+    indexes = get_secondary_indexes(cursor, schema, table)
+    generated_columns = get_generated_columns(cursor, schema, table)
+
+    for name, _ in indexes:
+        cursor.execute(sql.SQL("DROP INDEX {}").format(sql.Identifier(schema, name)))
+    for name, _, _ in generated_columns:
+        cursor.execute(
+            sql.SQL("ALTER TABLE {} DROP COLUMN {}").format(
+                target, sql.Identifier(name)
+            )
+        )
+
+    yield
+
+    # Adding a stored generated column computes it for all rows in one pass.
+    for name, column_type, expression in generated_columns:
+        cursor.execute(
+            sql.SQL(
+                "ALTER TABLE {} ADD COLUMN {} {} GENERATED ALWAYS AS ({}) STORED"
+            ).format(
+                target,
+                sql.Identifier(name),
+                sql.SQL(column_type),
+                sql.SQL(expression),
+            )
+        )
+    for _, definition in indexes:
+        cursor.execute(definition)
@@ -0,0 +1,260 @@
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+import requests
+from tqdm import tqdm
+
+# Name of the file the validators of the downloads are stored in.
+DOWNLOADS_NAME = "downloads.json"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+CHUNK_SIZE = 1024**2  # 1MB chunks
+
+# Status of a DownloadResult.
+DOWNLOADED = "downloaded"
+NOT_MODIFIED = "not_modified"
+FAILED = "failed"
+
+
+class Download(NamedTuple):
+    url: str
+    path: Path
+
+
+class DownloadResult(NamedTuple):
+    url: str
+    path: Path
+    status: str
+    error: str | None = None
+
+
+class RateLimiter:
+    """Spaces the requests to the same host by at least min_interval seconds.
+
+    Args:
+        min_interval (float):   seconds between the starts of two requests
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_start = {}
+
+    def wait(self, url: str):
+        """Blocks until the next request to the host of url may start."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class DownloadManifest:
+    """Stores the ETag and Last-Modified header of every downloaded file.
+
+    A file that was downloaded before is only requested conditionally, so the
+    server answers 304 Not Modified if it did not change. The validators of an
+    incomplete download are stored as well, so it can be resumed with a range
+    request. The manifest is written after every change, so an interrupted run
+    keeps the state of all finished and started downloads.
+
+    Args:
+        manifest_path (Path):   path of the manifest json file
+    """
+
+    def __init__(self, manifest_path: Path):
+        self.manifest_path = Path(manifest_path)
+        self._lock = threading.Lock()
+        self._files = {}
+        if self.manifest_path.exists():
+            with open(self.manifest_path) as file:
+                self._files = json.load(file)
+
+    def get(self, file_path: Path) -> dict:
+        with self._lock:
+            return dict(self._files.get(self._key(file_path), {}))
+
+    def set(self, file_path: Path, **validators):
+        with self._lock:
+            self._files[self._key(file_path)] = validators
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as file:
+                json.dump(self._files, file, indent=1)
+            os.replace(tmp_path, self.manifest_path)
+
+    def _key(self, file_path: Path) -> str:
+        return os.path.relpath(file_path, self.manifest_path.parent)
+
+
+def download_files(
+    downloads: Iterable[Download],
+    manifest_path: Path,
+    max_workers: int = 4,
+    min_interval: float = 1.0,
+    attempts: int = 5,
+    backoff: float = 2.0,
+    headers: dict | None = None,
+    desc: str | None = None,
+) -> list[DownloadResult]:
+    """
+    Downloads files concurrently, only files that changed since the last run.
+
+    Every file is streamed to a .part file next to its path and moved to its path
+    once it is complete. An interrupted download is resumed with a range request
+    if the file did not change in the meantime. Files downloaded before are
+    requested with If-None-Match and If-Modified-Since, so unchanged files are not
+    downloaded again. The requests to a host are spaced by min_interval seconds,
+    whatever the number of workers, retries included.
+
+    Args:
+        downloads (Iterable[Download]): url and target path of every file
+        manifest_path (Path):           path of the DownloadManifest
+        max_workers (int):              number of concurrent downloads
+        min_interval (float):           seconds between two requests to a host
+        attempts (int):                 attempts per file, a broken download is
+                                        resumed by the next attempt
+        backoff (float):                seconds before the second attempt, doubled
+                                        for every further attempt
+        headers (dict, optional):       request headers, HEADERS by default
+        desc (str, optional):           description of the progress bar
+
+    Returns:
+        list[DownloadResult]: result of every download in the order of downloads
+    """
+    downloads = [Download(url, Path(file_path)) for url, file_path in downloads]
+    manifest = DownloadManifest(manifest_path)
+    rate_limiter = RateLimiter(min_interval)
+    sessions = threading.local()
+
+    def download(item: Download) -> DownloadResult:
+        if not hasattr(sessions, "session"):
+            sessions.session = create_session(headers or HEADERS)
+        error = None
+        for attempt in range(attempts):
+            if attempt:
+                time.sleep(backoff * 2 ** (attempt - 1))
+            try:
+                return download_file(
+                    sessions.session, item.url, item.path, manifest, rate_limiter
+                )
+            except (requests.exceptions.RequestException, OSError) as e:
+                error = str(e)
+                if _is_client_error(e):
+                    break
+        return DownloadResult(item.url, item.path, FAILED, error)
+
+    results = [None] * len(downloads)
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        futures = {
+            executor.submit(download, item): position
+            for position, item in enumerate(downloads)
+        }
+        for future in tqdm(as_completed(futures), total=len(futures), desc=desc):
+            results[futures[future]] = future.result()
+    return results
+
+
+def create_session(headers: dict) -> requests.Session:
+    """Returns a session for the downloads of a worker thread.
+
+    The session doesn't retry failed requests itself, download_files retries them
+    with a backoff and through the rate limiter.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    # Range requests count bytes of the file as stored, not of a compressed transfer.
+    session.headers["Accept-Encoding"] = "identity"
+    return session
+
+
+def download_file(
+    session: requests.Session,
+    url: str,
+    file_path: Path,
+    manifest: DownloadManifest,
+    rate_limiter: RateLimiter,
+) -> DownloadResult:
+    """
+    Downloads a single file, see download_files.
+
+    Raises:
+        requests.exceptions.RequestException: if the request or the transfer fails
+    """
+    part_path = file_path.with_name(file_path.name + ".part")
+    validators = manifest.get(file_path)
+    request_headers = {}
+
+    if file_path.exists() and validators.get("complete"):
+        if validators.get("etag"):
+            request_headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            request_headers["If-Modified-Since"] = validators["last_modified"]
+    elif part_path.exists() and not validators.get("complete"):
+        # Resume only if the file is still the one the .part file belongs to.
+        validator = validators.get("etag") or validators.get("last_modified")
+        if validator:
+            request_headers["Range"] = f"bytes={part_path.stat().st_size}-"
+            request_headers["If-Range"] = validator
+
+    rate_limiter.wait(url)
+    with session.get(url, headers=request_headers, stream=True, timeout=30) as r:
+        if r.status_code == 304:
+            return DownloadResult(url, file_path, NOT_MODIFIED)
+        if r.status_code == 416:
+            # The .part file does not fit the file anymore, start over next time.
+            part_path.unlink(missing_ok=True)
+        r.raise_for_status()
+
+        resume = r.status_code == 206
+        manifest.set(
+            file_path,
+            etag=r.headers.get("ETag"),
+            last_modified=r.headers.get("Last-Modified"),
+            complete=False,
+        )
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(part_path, "ab" if resume else "wb") as file:
+            file.writelines(r.iter_content(chunk_size=CHUNK_SIZE))
+
+        expected_size = _expected_size(r)
+        if expected_size is not None and part_path.stat().st_size != expected_size:
+            raise requests.exceptions.ContentDecodingError(
+                f"Incomplete download of {url}: {part_path.stat().st_size} of "
+                f"{expected_size} bytes"
+            )
+
+    os.replace(part_path, file_path)
+    manifest.set(file_path, **{**manifest.get(file_path), "complete": True})
+    return DownloadResult(url, file_path, DOWNLOADED)
+
+
+def _expected_size(response: requests.Response) -> int | None:
+    """Returns the size of the whole file according to the response headers."""
+    content_range = response.headers.get("Content-Range")
+    if response.status_code == 206 and content_range:
+        total = content_range.rsplit("/", 1)[-1]
+        return int(total) if total.isdigit() else None
+    content_length = response.headers.get("Content-Length")
+    if content_length and "Content-Encoding" not in response.headers:
+        return int(content_length)
+    return None
+
+
+def _is_client_error(error: Exception) -> bool:
+    """Returns True for errors like 404 Not Found that a new attempt won't fix."""
+    response = getattr(error, "response", None)
+    return (
+        response is not None
+        and 400 <= response.status_code < 500
+        and response.status_code != 416
+    )
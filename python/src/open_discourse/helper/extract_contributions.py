@@ -1,8 +1,23 @@
 import copy
+from array import array
 
+import numpy as np
 import pandas as pd
 import regex
 
+# Columns of the data frames returned by extract
+EXTENDED_COLUMNS = [
+    "id",
+    "type",
+    "name_raw",
+    "faction",
+    "constituency",
+    "content",
+    "text_position",
+]
+SIMPLIFIED_COLUMNS = ["text_position", "content", "speech_id"]
+INTEGER_COLUMNS = {"id", "text_position", "speech_id"}
+
 # Party Patterns:
 parties = {
     "AfD": r"Alternative für Deutschland|AfD",
@@ -117,6 +132,149 @@ name_Pattern = {
     + r"+{1})*",
 }
 
+# Extension of the opening_bracket_Pattern for shouts
+shout_opening_extension_Pattern = r"|(?<=[Hh]eiterkeit\s)|(?<=[Ll]achen\s)|(?<=[Ww]eiterer\s)|(?<=[Ww]eitere\s)|(?<=[Ee]rneuter\s)|(?<=[Ee]rneute\s)|(?<=[Ff]ortgesetzte\s)|(?<=[Ll]ebhafte\s)|(?<=[Ww]eitere\s[Ll]ebhafte\s|(?<=Andauernde\s)|(?<=Fortdauernde\s))"
+
+
+def get_name_Pattern_id(session):
+    """Sessions before 7115 use the second name pattern (second row in name_Pattern)"""
+    return 1 if session < 7115 else 0
+
+
+def compile_contribution_Pattern(
+    base_Pattern, opening_extension="", closing_extension=""
+):
+    """Surrounds a base pattern with the bracket patterns and compiles it"""
+    return regex.compile(
+        start_contributions_opening_bracket_Pattern.format(opening_extension)
+        + base_Pattern
+        + start_contributions_closing_bracket_Pattern.format(closing_extension)
+    )
+
+
+# Compiled Patterns, built once at import:
+# Patterns that do not depend on the name pattern, by contribution type
+contribution_Patterns = {
+    "applause": compile_contribution_Pattern(base_applause_Pattern),
+    "cheerfulness": compile_contribution_Pattern(base_cheerfulness_Pattern),
+    "objection": compile_contribution_Pattern(base_objection_Pattern),
+    "laughter": compile_contribution_Pattern(
+        base_laughter_Pattern, closing_extension=r"|\sund\sZurufe\)"
+    ),
+    "approval": compile_contribution_Pattern(base_approval_Pattern),
+    "interruption": compile_contribution_Pattern(base_interruption_Pattern),
+    "disturbance": compile_contribution_Pattern(base_disturbance_Pattern),
+    "faction_shout": compile_contribution_Pattern(
+        r"(?P<delete>(?P<initiator>"
+        + text_Pattern.format("").replace("{}", "{{}}")
+        + r"+):\s*(?P<content>"
+        + text_Pattern
+        + r"+))",
+        opening_extension=shout_opening_extension_Pattern,
+    ),
+}
+
+
+def compile_person_Patterns(name_Pattern_id):
+    """Compiles the patterns containing a person name for a row of name_Pattern"""
+    person_name_Pattern = name_Pattern[name_Pattern_id].format(
+        opening_bracket_Pattern, closing_bracket_Pattern
+    )
+    return {
+        # Looking for key Abg.
+        "first_person": regex.compile(
+            rf"Abg\s?\.\s?{person_name_Pattern}(?:(?<=!:)|(?!:))"
+        ),
+        # Looking for key und
+        "second_person": regex.compile(
+            rf"(?:\sund|sowie\sdes)\s+(?:des|der)?{person_name_Pattern}(?:(?<=!:)|(?!:))"
+        ),
+        "person_interjection": compile_contribution_Pattern(
+            base_person_interjection_Pattern.format(
+                (r"(?:Abg\s?\.\s?)" if name_Pattern_id == 1 else "")
+                + person_name_Pattern
+            )
+        ),
+        "shout": compile_contribution_Pattern(
+            base_shout_Pattern.format(
+                rf"\s*Abg\s?\.\s?{person_name_Pattern}",
+                text_Pattern.format("").replace("{}", "{{}}"),
+            ),
+            opening_extension=shout_opening_extension_Pattern,
+        ),
+    }
+
+
+# Patterns containing a person name, by name pattern id and contribution type
+person_Patterns = {
+    name_Pattern_id: compile_person_Patterns(name_Pattern_id)
+    for name_Pattern_id in name_Pattern
+}
+
+# Patterns of the parties, by faction
+faction_Patterns = {
+    faction: regex.compile(r"(?<!\[)(" + faction_Pattern + r")(?![^[\s]*\])")
+    for faction, faction_Pattern in parties.items()
+}
+
+left_right_search_Pattern = regex.compile(left_right_Pattern)
+other_contributions_Pattern = regex.compile(
+    r"(?P<type>[Bb]eifall|[Zz]uruf|[Gg]egenruf|[Rr]uf|[Hh]eiterkeit|[Ww]iderspruch|[Ll]achen|[Zz]ustimmung|[Uu]nterbrechung|[Uu]nruhe)(?P<initiators>(?:(?!\s[-––]\s).)*)\s*"
+)
+interim_question_Pattern = regex.compile("[Zz]wischenfrage")
+government_Pattern = regex.compile(r"[Rr]egierungspar[^\s]+")
+bracket_Pattern = regex.compile(r"\(([^(\)]*(\(([^(\)]*)\))*[^(\)]*)\)")
+newlines_Pattern = regex.compile(r"\n+")
+whitespaces_Pattern = regex.compile(r"\s+")
+
+# Name cleaning Patterns
+name_newline_Pattern = regex.compile(r"\n")
+name_shout_Pattern = regex.compile(
+    r"(Gegenrufe?\sdes\s|Gegenrufe?\sder\s|Zurufe?\sdes\s|Zurufe?\sder\s)(Abg\s?\.\s)*"
+)
+name_abg_Pattern = regex.compile(r"(Abg\s?\.\s?|Abgeordneten\s)")
+name_pronoun_Pattern = regex.compile(r"(^\s?der\s?|^\s?die\s?|^\s?das\s?|^\s?von\s?)")
+
+
+class Contributions:
+    """Append-only column buffers for the contributions of many speeches.
+
+    extract_into appends the contributions of every speech to the same buffers,
+    so the data frames of e.g. a whole session are only built once.
+    """
+
+    def __init__(self):
+        self.extended = {
+            column: array("q") if column in INTEGER_COLUMNS else []
+            for column in EXTENDED_COLUMNS
+        }
+        self.simplified = {
+            column: array("q") if column in INTEGER_COLUMNS else []
+            for column in SIMPLIFIED_COLUMNS
+        }
+
+    def __len__(self):
+        return len(self.simplified["content"])
+
+    def extended_frame(self):
+        """Returns the contributions_extended collected so far"""
+        return self._to_frame(self.extended)
+
+    def simplified_frame(self):
+        """Returns the contributions_simplified collected so far"""
+        return self._to_frame(self.simplified)
+
+    @staticmethod
+    def _to_frame(columns):
+        return pd.DataFrame(
+            {
+                column: np.array(values, dtype="int64")
+                if column in INTEGER_COLUMNS
+                else pd.Series(values, dtype="object")
+                for column, values in columns.items()
+            }
+        )
+
 
 def get_government_factions(electoral_term):
     """Get the government factions for the given electoral_term"""
@@ -153,16 +311,12 @@ def convert_to_string(string):
 def clean_person_name(name_raw):
     """cleans the person name_raw"""
     # Remove any newlines from the name_raw
-    name_raw = regex.sub(r"\n", " ", convert_to_string(name_raw))
+    name_raw = name_newline_Pattern.sub(" ", convert_to_string(name_raw))
     # Remove any Additional stuff
-    name_raw = regex.sub(
-        r"(Gegenrufe?\sdes\s|Gegenrufe?\sder\s|Zurufe?\sdes\s|Zurufe?\sder\s)(Abg\s?\.\s)*",
-        "",
-        name_raw,
-    )
-    name_raw = regex.sub(r"(Abg\s?\.\s?|Abgeordneten\s)", "", name_raw)
+    name_raw = name_shout_Pattern.sub("", name_raw)
+    name_raw = name_abg_Pattern.sub("", name_raw)
     # Remove any Pronouns
-    name_raw = regex.sub(r"(^\s?der\s?|^\s?die\s?|^\s?das\s?|^\s?von\s?)", "", name_raw)
+    name_raw = name_pronoun_Pattern.sub("", name_raw)
     # Remove whitespaces at the beginning and at the end
     name_raw = name_raw.lstrip(" ").rstrip(" ")
 
@@ -194,10 +348,7 @@ def extract_initiators(
 
     initiators_not_removed = copy.copy(initiators)
     # Remove wrongly placed contributions from initiators and pass them recursively
-    other_contributions = regex.search(
-        r"(?P<type>[Bb]eifall|[Zz]uruf|[Gg]egenruf|[Rr]uf|[Hh]eiterkeit|[Ww]iderspruch|[Ll]achen|[Zz]ustimmung|[Uu]nterbrechung|[Uu]nruhe)(?P<initiators>(?:(?!\s[-––]\s).)*)\s*",
-        initiators,
-    )
+    other_contributions = other_contributions_Pattern.search(initiators)
     if other_contributions:
         frame, _ = methods[other_contributions.group("type").lower()](
             "(" + other_contributions.group() + ")",
@@ -209,30 +360,16 @@ def extract_initiators(
         )
         initiators = initiators.replace(other_contributions.group(), "")
 
-    if session < 7115:
-        # Set name pattern to the second name pattern (second row in name_Pattern)
-        name_Pattern_id = 1
-    else:
-        # Set name pattern to the first name pattern (first row in name_Pattern)
-        name_Pattern_id = 0
-
-    # Create the first_person_search_Pattern (looking for key Abg.)
-    first_person_search_Pattern = r"Abg\s?\.\s?{}(?:(?<=!:)|(?!:))".format(
-        name_Pattern[name_Pattern_id].format(
-            opening_bracket_Pattern,
-            closing_bracket_Pattern,
-        )
-    )
-    # Find match
-    first_person_match = regex.search(
-        first_person_search_Pattern,
-        initiators,
-    )
+    name_Patterns = person_Patterns[get_name_Pattern_id(session)]
+
+    # Find match (looking for key Abg.)
+    first_person_search_Pattern = name_Patterns["first_person"]
+    first_person_match = first_person_search_Pattern.search(initiators)
     if first_person_match:
         # Remove name_raw from the search text
         initiators = initiators.replace(first_person_match.group(), "")
         # Check if the person was just asking a "Zwischenfrage"
-        if not regex.search("[Zz]wischenfrage", initiators):
+        if not interim_question_Pattern.search(initiators):
             # Get the persons name_raw
             name_raw = first_person_match.group("name_raw")
             # Try to get the persons faction
@@ -257,26 +394,13 @@ def extract_initiators(
                 text_position,
             )
 
-    # Create the first_person_search_Pattern (looking for key und)
-    second_person_search_Pattern = (
-        r"(?:\sund|sowie\sdes)\s+(?:des|der)?{}(?:(?<=!:)|(?!:))".format(
-            name_Pattern[name_Pattern_id].format(
-                opening_bracket_Pattern,
-                closing_bracket_Pattern,
-            )
-        )
-    )
-
-    # Find match
-    second_person_match = regex.search(
-        second_person_search_Pattern,
-        initiators,
-    )
+    # Find match (looking for key und)
+    second_person_match = name_Patterns["second_person"].search(initiators)
     if second_person_match:
         # Remove the person name_raw from the search text
         initiators = initiators.replace(second_person_match.group(), "")
         # Check if the person was just asking a "Zwischenfrage"
-        if not regex.search("[Zz]wischenfrage", initiators):
+        if not interim_question_Pattern.search(initiators):
             # Get the persons name_raw
             name_raw = second_person_match.group("name_raw")
             # Try to get the persons faction
@@ -302,11 +426,9 @@ def extract_initiators(
             )
 
     # Iterate over all parties
-    for faction in parties:
-        # Create the faction_search_Pattern
-        faction_search_Pattern = r"(?<!\[)(" + parties[faction] + r")(?![^[\s]*\])"
+    for faction, faction_search_Pattern in faction_Patterns.items():
         # Find match for faction
-        faction_match = regex.search(faction_search_Pattern, initiators)
+        faction_match = faction_search_Pattern.search(initiators)
         # Check if there is a match
         if faction_match:
             # Remove the faction from the search text
@@ -314,10 +436,8 @@ def extract_initiators(
             # Add an entry to the frame
             frame = add_entry(frame, identity, type, "", faction, "", "", text_position)
 
-    # Create the left_right_search_Pattern
-    left_right_search_Pattern = left_right_Pattern
     # Find matches
-    left_right_matches = list(regex.finditer(left_right_search_Pattern, initiators))
+    left_right_matches = list(left_right_search_Pattern.finditer(initiators))
     for direction in left_right_matches:
         # Remove the direction from the search text
         initiators = initiators.replace(direction.group(), "")
@@ -327,7 +447,7 @@ def extract_initiators(
         )
 
     # Search for Regierungsparteien in the initiators
-    government_matches = regex.search(r"[Rr]egierungspar[^\s]+", initiators)
+    government_matches = government_Pattern.search(initiators)
     if government_matches:
         initiators = initiators.replace(government_matches.group(), "")
         # iterate over every faction get_government_factions returns
@@ -348,7 +468,7 @@ def extract_initiators(
             print(
                 initiators_not_removed,
                 session,
-                first_person_search_Pattern,
+                first_person_search_Pattern.pattern,
             )
     # Return the frame
     return frame, initiators
@@ -357,23 +477,7 @@ def extract_initiators(
 def extract_applause(text, electoral_term, session, identity, text_position, frame):
     """Extracts applause from the given text"""
 
-    # creates the Pattern modularly
-    applause_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_applause_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
-    matches = list(
-        regex.finditer(
-            applause_Pattern,
-            text,
-        )
-    )
+    matches = list(contribution_Patterns["applause"].finditer(text))
 
     for match in matches:
         # replace everything except the delimeters
@@ -398,32 +502,13 @@ def extract_person_interjection(
 ):
     """Extracts person interjections from the given text"""
 
-    # Check if session is under 7115
-    if session < 7115:
-        # Set name pattern to the second name pattern (second row in name_Pattern)
-        name_Pattern_id = 1
-        extra_Pattern = r"(?:Abg\s?\.\s?)"
-    else:
-        # Set name pattern to the first name pattern (first row in name_Pattern)
-        name_Pattern_id = 0
-        extra_Pattern = ""
-
-    # creates the Pattern "very" modularly
-    person_interjection_Pattern = (
-        start_contributions_opening_bracket_Pattern.format("")
-        + base_person_interjection_Pattern.format(
-            extra_Pattern
-            + name_Pattern[name_Pattern_id].format(
-                opening_bracket_Pattern,
-                closing_bracket_Pattern,
-            )
+    # Match person interjections
+    matches = list(
+        person_Patterns[get_name_Pattern_id(session)]["person_interjection"].finditer(
+            text
         )
-        + start_contributions_closing_bracket_Pattern.format("")
     )
 
-    # Match person interjections
-    matches = list(regex.finditer(person_interjection_Pattern, text))
-
     # Iterate over matches
     for match in matches:
         # replace everything except the delimeters
@@ -459,38 +544,8 @@ def extract_person_interjection(
 def extract_shout(text, electoral_term, session, identity, text_position, frame):
     """Extracts shouts from the given text"""
 
-    # Check if session is under 7115
-    if session < 7115:
-        # Set name pattern to the second name pattern (second row in name_Pattern)
-        name_Pattern_id = 1
-    else:
-        # Set name pattern to the first name pattern (first row in name_Pattern)
-        name_Pattern_id = 0
-
-    # creates the Pattern modularly
-    shout_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            r"|(?<=[Hh]eiterkeit\s)|(?<=[Ll]achen\s)|(?<=[Ww]eiterer\s)|(?<=[Ww]eitere\s)|(?<=[Ee]rneuter\s)|(?<=[Ee]rneute\s)|(?<=[Ff]ortgesetzte\s)|(?<=[Ll]ebhafte\s)|(?<=[Ww]eitere\s[Ll]ebhafte\s|(?<=Andauernde\s)|(?<=Fortdauernde\s))"  # Extending the opening_bracket_Pattern
-        )
-        + base_shout_Pattern.format(
-            r"\s*Abg\s?\.\s?{}".format(
-                name_Pattern[name_Pattern_id].format(
-                    opening_bracket_Pattern,
-                    closing_bracket_Pattern,
-                )
-            ),
-            text_Pattern.format("").replace("{}", "{{}}"),
-        )
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
     matches = list(
-        regex.finditer(
-            shout_Pattern,
-            text,
-        )
+        person_Patterns[get_name_Pattern_id(session)]["shout"].finditer(text)
     )
     for match in matches:
         if match.group("initiator"):
@@ -539,27 +594,7 @@ def extract_shout(text, electoral_term, session, identity, text_position, frame)
             )
 
     # Extract faction shouts
-    # creates the Pattern modularly
-    faction_shout_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            r"|(?<=[Hh]eiterkeit\s)|(?<=[Ll]achen\s)|(?<=[Ww]eiterer\s)|(?<=[Ww]eitere\s)|(?<=[Ee]rneuter\s)|(?<=[Ee]rneute\s)|(?<=[Ff]ortgesetzte\s)|(?<=[Ll]ebhafte\s)|(?<=[Ww]eitere\s[Ll]ebhafte\s|(?<=Andauernde\s)|(?<=Fortdauernde\s))"  # Extending the opening_bracket_Pattern
-        )
-        + r"(?P<delete>(?P<initiator>"
-        + text_Pattern.format("").replace("{}", "{{}}")
-        + r"+):\s*(?P<content>"
-        + text_Pattern
-        + r"+))"
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
-    matches = list(
-        regex.finditer(
-            faction_shout_Pattern,
-            text,
-        )
-    )
+    matches = list(contribution_Patterns["faction_shout"].finditer(text))
     for match in matches:
         # replace everything except the delimeters
         text = text.replace(match.group("delete"), " ")
@@ -567,11 +602,9 @@ def extract_shout(text, electoral_term, session, identity, text_position, frame)
         initiators = match.group("initiator")
 
         # Iterate over all parties
-        for faction in parties:
-            # Create the faction_search_Pattern
-            faction_search_Pattern = r"(?<!\[)(" + parties[faction] + r")(?![^[\s]*\])"
+        for faction, faction_search_Pattern in faction_Patterns.items():
             # Find match for faction
-            faction_match = regex.search(faction_search_Pattern, initiators)
+            faction_match = faction_search_Pattern.search(initiators)
             # Check if there is a match
             if faction_match:
                 # Remove the faction from the search text
@@ -588,23 +621,7 @@ def extract_shout(text, electoral_term, session, identity, text_position, frame)
 def extract_cheerfulness(text, electoral_term, session, identity, text_position, frame):
     """Extracts cheerfulness from the given text"""
 
-    # creates the Pattern modularly
-    cheerfulness_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_cheerfulness_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
-    matches = list(
-        regex.finditer(
-            cheerfulness_Pattern,
-            text,
-        )
-    )
+    matches = list(contribution_Patterns["cheerfulness"].finditer(text))
     for match in matches:
         # replace everything except the delimeters
         text = text.replace(match.group("delete"), " ")
@@ -626,23 +643,7 @@ def extract_cheerfulness(text, electoral_term, session, identity, text_position,
 def extract_objection(text, electoral_term, session, identity, text_position, frame):
     """Extracts objection from the given text"""
 
-    # creates the Pattern modularly
-    objection_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_objection_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
-    matches = list(
-        regex.finditer(
-            objection_Pattern,
-            text,
-        )
-    )
+    matches = list(contribution_Patterns["objection"].finditer(text))
     for match in matches:
         # replace everything except the delimeters
         text = text.replace(match.group("delete"), " ")
@@ -664,23 +665,7 @@ def extract_objection(text, electoral_term, session, identity, text_position, fr
 def extract_laughter(text, electoral_term, session, identity, text_position, frame):
     """Extracts laughter from the given text"""
 
-    # creates the Pattern modularly
-    laughter_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_laughter_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            r"|\sund\sZurufe\)"  # Extending the closing_bracket_Pattern
-        )
-    )
-
-    matches = list(
-        regex.finditer(
-            laughter_Pattern,
-            text,
-        )
-    )
+    matches = list(contribution_Patterns["laughter"].finditer(text))
     for match in matches:
         # replace everything except the delimeters
         text = text.replace(match.group("delete"), " ")
@@ -702,23 +687,7 @@ def extract_laughter(text, electoral_term, session, identity, text_position, fra
 def extract_approval(text, electoral_term, session, identity, text_position, frame):
     """Extracts approval from the given text"""
 
-    # creates the Pattern modularly
-    approval_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_approval_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
-    matches = list(
-        regex.finditer(
-            approval_Pattern,
-            text,
-        )
-    )
+    matches = list(contribution_Patterns["approval"].finditer(text))
     for match in matches:
         # replace everything except the delimeters
         text = text.replace(match.group("delete"), " ")
@@ -740,19 +709,8 @@ def extract_approval(text, electoral_term, session, identity, text_position, fra
 def extract_interruption(text, electoral_term, session, identity, text_position, frame):
     """Extracts interruptions from the given text"""
 
-    # Creates the Pattern modularly
-    interruption_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_interruption_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
     # Find matches
-    matches = list(regex.finditer(interruption_Pattern, text))
+    matches = list(contribution_Patterns["interruption"].finditer(text))
 
     # Iterate over matches
     for match in matches:
@@ -776,23 +734,7 @@ def extract_interruption(text, electoral_term, session, identity, text_position,
 def extract_disturbance(text, electoral_term, session, identity, text_position, frame):
     """Extracts disturbance from the given text"""
 
-    # creates the Pattern modularly
-    disturbance_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_disturbance_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
-    matches = list(
-        regex.finditer(
-            disturbance_Pattern,
-            text,
-        )
-    )
+    matches = list(contribution_Patterns["disturbance"].finditer(text))
 
     for match in matches:
         # replace everything except the delimeters
@@ -815,83 +757,112 @@ def extract_disturbance(text, electoral_term, session, identity, text_position,
 def extract(
     speech_text, session, identity, text_position=0, text_position_reversed=True
 ):
+    """
+    Extracts the contributions of a single speech into new data frames.
+
+    See extract_into for collecting the contributions of many speeches.
+
+    Returns:
+        tuple: contributions_extended, speech_text with placeholders,
+               contributions_simplified and the next text_position
+    """
+    contributions = Contributions()
+    speech_text, text_position = extract_into(
+        contributions,
+        speech_text,
+        session,
+        identity,
+        text_position,
+        text_position_reversed,
+    )
+    return (
+        contributions.extended_frame(),
+        speech_text,
+        contributions.simplified_frame(),
+        text_position,
+    )
+
+
+def extract_into(
+    contributions,
+    speech_text,
+    session,
+    identity,
+    text_position=0,
+    text_position_reversed=True,
+):
+    """
+    Extracts the contributions of a single speech into the given Contributions.
+
+    Every bracket in the speech is replaced by a placeholder with its text_position,
+    e.g. "({0})".
+
+    Args:
+        contributions (Contributions):  buffers the contributions are appended to
+        speech_text (str):              text of the speech
+        session (int):                  session number, e.g. 19003
+        identity (int):                 speech id of the speech
+        text_position (int):            text_position of the first bracket
+        text_position_reversed (bool):  number the brackets from the end
+
+    Returns:
+        tuple[str, int]: speech_text with placeholders and the next text_position
+    """
     electoral_term = session // 1000
 
     # Match all brackets
-    brackets = list(
-        regex.finditer(r"\(([^(\)]*(\(([^(\)]*)\))*[^(\)]*)\)", speech_text)
-    )
+    brackets = list(bracket_Pattern.finditer(speech_text))
 
-    # Create an empty frame for the normal contributions
-    frame = {
-        "id": [],
-        "type": [],
-        "name_raw": [],
-        "faction": [],
-        "constituency": [],
-        "content": [],
-        "text_position": [],
-    }
+    # The frame for the normal contributions
+    frame = contributions.extended
+    contributions_simplified = contributions.simplified
 
-    contributions_simplified = {"text_position": [], "content": [], "speech_id": []}
+    # The speech text is rebuilt once from the text between the brackets and the
+    # placeholders, collected from the end of the speech.
+    segments = []
+    segment_end = len(speech_text)
 
     # Iterate over all brackets
     for bracket in reversed(brackets):
         # calculate reversed text_position
         reversed_text_position = len(brackets) - 1 - text_position
+        position = reversed_text_position if text_position_reversed else text_position
         # Make sure to remove all newlines
-        speech_text_no_newline = regex.sub(r"\n+", " ", bracket.group())
-        speech_text_no_newline = regex.sub(r"\s+", " ", speech_text_no_newline)
+        speech_text_no_newline = newlines_Pattern.sub(" ", bracket.group())
+        speech_text_no_newline = whitespaces_Pattern.sub(" ", speech_text_no_newline)
         # Save the bracket text
         bracket_text = bracket.group()
         # Save deleted text to DataFrame
-        contributions_simplified["text_position"].append(
-            reversed_text_position if text_position_reversed else text_position
-        )
+        contributions_simplified["text_position"].append(position)
         contributions_simplified["content"].append(bracket_text)
         contributions_simplified["speech_id"].append(identity)
 
         deletion_span = bracket.span(1)
 
-        # Remove the bracket text from the speech_text and replace it with the text_position
-        speech_text = (
-            speech_text[: deletion_span[0]]
-            + "{"
-            + str(reversed_text_position if text_position_reversed else text_position)
-            + "}"
-            + speech_text[deletion_span[1] :]
+        # Replace the bracket text with the text_position
+        segments.extend(
+            (speech_text[deletion_span[1] : segment_end], f"{{{position}}}")
         )
+        segment_end = deletion_span[0]
 
-        contribution_methods = [
-            extract_applause,
-            extract_person_interjection,
-            extract_shout,
-            extract_cheerfulness,
-            extract_objection,
-            extract_laughter,
-            extract_approval,
-            extract_interruption,
-            extract_disturbance,
-        ]
-
-        for method in contribution_methods:
+        # Only the extractors that can find something in the bracket are called
+        for method in get_contribution_methods(speech_text_no_newline):
             frame, speech_text_no_newline = method(
                 speech_text_no_newline,
                 electoral_term,
                 session,
                 identity,
-                reversed_text_position if text_position_reversed else text_position,
+                position,
                 frame,
             )
 
         text_position += 1
 
-    return (
-        pd.DataFrame(frame),
-        speech_text,
-        pd.DataFrame(contributions_simplified),
-        text_position,
-    )
+    if segments:
+        segments.append(speech_text[:segment_end])
+        speech_text = "".join(reversed(segments))
+
+    return speech_text, text_position
 
 
 # Method Dictionary:
@@ -908,3 +879,28 @@ methods = {
     "unterbrechung": extract_interruption,
     "unruhe": extract_disturbance,
 }
+
+# Contribution Methods of extract() in the order they are applied to a bracket,
+# together with the keywords one of which every match of the method contains.
+# Replacing a match with a space never creates a keyword, so the methods are
+# selected once per bracket. extract_approval returns an empty text, so
+# extract_interruption and extract_disturbance never find anything in extract()
+# and are only used for contributions in the initiators (see methods).
+contribution_methods = {
+    extract_applause: ("Beifall",),
+    extract_person_interjection: (":",),
+    extract_shout: ("Zuruf", "Gegenruf", "Ruf", ":"),
+    extract_cheerfulness: ("Heiterkeit",),
+    extract_objection: ("Widerspruch",),
+    extract_laughter: ("Lachen",),
+    extract_approval: ("Sehr", "Zustimmung", "Bravo"),
+}
+
+
+def get_contribution_methods(text):
+    """Returns the contribution methods that can find a contribution in the text"""
+    return [
+        method
+        for method, keywords in contribution_methods.items()
+        if any(keyword in text for keyword in keywords)
+    ]
@@ -0,0 +1,86 @@
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import NamedTuple
+
+import numpy as np
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the memoized queries, like functools.lru_cache reports them."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class FuzzyNameIndex:
+    """Fuzzy lookup of names against the (last) names of one electoral term.
+
+    Scores are identical to `Levenshtein.ratio`, but unknown query names are scored
+    in one batched `rapidfuzz.process.cdist` call instead of one Python call per
+    politician and query. As the same misspelled OCR names recur in many sessions,
+    results are memoized in a bounded LRU cache.
+
+    Args:
+        names (Iterable[str]):  names to search in, e.g. politicians["last_name"]
+        maxsize (int):          maximum number of memoized queries
+    """
+
+    def __init__(self, names: Iterable[str], maxsize: int = 4096):
+        self.choices = list(dict.fromkeys(n for n in names if isinstance(n, str)))
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, name: str, fuzzy_threshold: float = 0.7) -> list[str]:
+        """Returns all names with a similarity ratio >= fuzzy_threshold."""
+        return self.lookup_many([name], fuzzy_threshold)[name]
+
+    def lookup_many(
+        self, names: Iterable[str], fuzzy_threshold: float = 0.7
+    ) -> dict[str, list[str]]:
+        """Looks up many names at once, scoring all cache misses in a single pass."""
+        names = list(dict.fromkeys(names))
+        missing = [name for name in names if (name, fuzzy_threshold) not in self._cache]
+        self._hits += len(names) - len(missing)
+        self._misses += len(missing)
+
+        # Levenshtein.ratio never exceeds 1, some callers pass percentages though.
+        if missing and self.choices and fuzzy_threshold <= 1:
+            scores = process.cdist(
+                missing,
+                self.choices,
+                scorer=Indel.normalized_similarity,
+                score_cutoff=fuzzy_threshold,
+                dtype=np.float64,
+            )
+            for name, row in zip(missing, scores >= fuzzy_threshold):
+                self._store((name, fuzzy_threshold), row.nonzero()[0].tolist())
+        else:
+            for name in missing:
+                self._store((name, fuzzy_threshold), [])
+
+        result = {}
+        for name in names:
+            key = (name, fuzzy_threshold)
+            if key not in self._cache:
+                # Evicted again while storing a large batch of misses.
+                result[name] = self.lookup_many([name], fuzzy_threshold)[name]
+                continue
+            self._cache.move_to_end(key)
+            result[name] = [self.choices[position] for position in self._cache[key]]
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the hits, misses, maximum and current size of the query cache."""
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+    def _store(self, key: tuple[str, float], positions: list[int]):
+        self._cache[key] = positions
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from types import ModuleType
+
+MANIFEST_NAME = "manifest.json"
+
+
+def file_digest(file_path: Path) -> str:
+    """Returns the sha256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def code_version(*parts: ModuleType | Path | str) -> str:
+    """
+    Builds a version string for the code and config a stage depends on.
+
+    Args:
+        *parts: modules (their source file is hashed), paths of shared input
+                files like factions.pkl (their content is hashed) or plain
+                strings, e.g. a config value
+
+    Returns:
+        str: sha256 hex digest over all parts
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, ModuleType):
+            part = Path(part.__file__)
+        if isinstance(part, Path):
+            part = file_digest(part) if part.exists() else f"missing:{part.name}"
+        digest.update(str(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class SessionManifest:
+    """Records which session inputs a stage has already processed.
+
+    The manifest lives next to the outputs of a stage and stores, for every input
+    file, its content digest together with the version of the stage's code and
+    config. A session only has to be processed again if its input changed, one of
+    its outputs is missing or the version changed. Deleting the manifest forces a
+    full rebuild. The outputs of inputs that were removed since the last run are
+    deleted on save.
+
+    Digests are computed lazily: if size and modification time of an input are
+    unchanged, the recorded digest is reused instead of reading the file.
+
+    Args:
+        manifest_path (Path):   path of the manifest json file
+        version (str):          version of code and config, see code_version
+    """
+
+    def __init__(self, manifest_path: Path, version: str):
+        self.manifest_path = Path(manifest_path)
+        self.version = version
+        self._previous = {}
+        self._current = {}
+        # Outputs of the last run by input, also if the version changed since.
+        self._previous_outputs = {}
+
+        if self.manifest_path.exists():
+            with open(self.manifest_path) as file:
+                manifest = json.load(file)
+            sessions = manifest.get("sessions", {})
+            self._previous_outputs = {
+                key: session.get("outputs", []) for key, session in sessions.items()
+            }
+            if manifest.get("version") == version:
+                self._previous = sessions
+
+    def is_up_to_date(
+        self, input_path: Path, output_paths: Iterable[Path] = ()
+    ) -> bool:
+        """
+        Checks an input and registers it for the next save.
+
+        Args:
+            input_path (Path):      input file of the session
+            output_paths (Iterable[Path]): files the stage writes for the session
+
+        Returns:
+            bool: True, if the input was processed before with the same version and
+                  all outputs exist
+        """
+        key = self._key(input_path)
+        previous = self._previous.get(key)
+        stat = os.stat(input_path)
+
+        if (
+            previous is not None
+            and previous["size"] == stat.st_size
+            and previous["mtime_ns"] == stat.st_mtime_ns
+        ):
+            digest = previous["digest"]
+        else:
+            digest = file_digest(input_path)
+
+        unchanged = previous is not None and previous["digest"] == digest
+        self._current[key] = {
+            "digest": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "info": previous.get("info", {}) if unchanged else {},
+            "outputs": [self._key(path) for path in output_paths],
+        }
+        return unchanged and all(Path(path).exists() for path in output_paths)
+
+    def info(self, input_path: Path) -> dict:
+        """Returns the additional information stored with an unchanged input."""
+        return self._current[self._key(input_path)]["info"]
+
+    def set_info(self, input_path: Path, **info):
+        """Stores additional information with an input, e.g. the number of rows."""
+        self._current[self._key(input_path)]["info"].update(info)
+
+    def removed_inputs(self) -> list[str]:
+        """Returns the inputs of the last run that were not checked since loading."""
+        return [key for key in self._previous_outputs if key not in self._current]
+
+    def save(self):
+        """Writes all inputs checked since loading, so removed inputs are dropped.
+
+        The outputs of removed inputs are deleted, unless they are an output of a
+        checked input as well, e.g. a file shared by all sessions. Call this only
+        after all sessions were processed successfully.
+        """
+        current_outputs = {
+            output
+            for session in self._current.values()
+            for output in session["outputs"]
+        }
+        for key in self.removed_inputs():
+            for output in self._previous_outputs[key]:
+                if output not in current_outputs:
+                    (self.manifest_path.parent / output).unlink(missing_ok=True)
+
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as file:
+            json.dump(
+                {"version": self.version, "sessions": self._current}, file, indent=1
+            )
+        os.replace(tmp_path, self.manifest_path)
+
+    def _key(self, input_path: Path) -> str:
+        return os.path.relpath(input_path, self.manifest_path.parent)
@@ -1,14 +1,20 @@
 import Levenshtein
 import numpy as np
 import pandas as pd
-import regex
+
+from open_discourse.helper.fuzzy_names import FuzzyNameIndex
+from open_discourse.helper.politician_matcher import PoliticianMatcher
 
 # Note: This matching script is a total mess, I know. But it works quite fine and has
 # some optimization logic already included. Would still be nice to clean this up
 # a little together with the preceeding scripts.
 
 
-def get_fuzzy_names(df, name_to_check, fuzzy_threshold=0.7):
+def get_fuzzy_names(df, name_to_check, fuzzy_threshold=0.7, fuzzy_index=None):
+    if fuzzy_index is not None:
+        fuzzy_names = fuzzy_index.lookup(name_to_check, fuzzy_threshold)
+        return df.loc[df["last_name"].isin(fuzzy_names)]
+
     return df.loc[
         df["last_name"].apply(Levenshtein.ratio, args=[name_to_check])
         >= fuzzy_threshold
@@ -93,111 +99,6 @@ def check_location_info(df, index, possible_matches, constituency, fuzzy_thresho
         return False, possible_matches
 
 
-def check_name_and_profession(
-    df, index, last_name, profession_regex, politicians_df, fuzzy_threshold=75
-):
-    possible_matches = get_possible_matches(politicians_df, last_name=last_name)
-
-    if len(possible_matches) == 0:
-        possible_matches = get_fuzzy_names(
-            politicians_df, name_to_check=last_name, fuzzy_threshold=fuzzy_threshold
-        )
-
-    if check_unique(possible_matches):
-        set_id(df, index, possible_matches, col_set="politician_id", col_check="ui")
-        return True, possible_matches
-    else:
-        boolean_indexer = possible_matches["profession"].str.contains(
-            profession_regex, regex=True, na=False
-        )
-        possible_matches = possible_matches[boolean_indexer]
-
-        if check_unique(possible_matches):
-            set_id(df, index, possible_matches, col_set="politician_id", col_check="ui")
-            return True, possible_matches
-        else:
-            return False, possible_matches
-
-
-def check_government(df, index, last_name, mgs_electoral_term, fuzzy_threshold=80):
-    possible_matches = get_possible_matches(mgs_electoral_term, last_name=last_name)
-
-    if len(possible_matches) == 0:
-        possible_matches = get_fuzzy_names(
-            mgs_electoral_term, name_to_check=last_name, fuzzy_threshold=fuzzy_threshold
-        )
-
-    if check_unique(possible_matches):
-        set_id(df, index, possible_matches, col_set="politician_id", col_check="ui")
-        return True, possible_matches
-    else:
-        return False, possible_matches
-
-
-def check_member_of_parliament(
-    df,
-    index,
-    first_name,
-    last_name,
-    politicians,
-    faction_id,
-    constituency,
-    acad_title,
-    fuzzy_threshold=80,
-):
-    # Check Last Name.
-    found, possible_matches = check_last_name(df, index, politicians, last_name)
-    if found:
-        return True, possible_matches
-
-    # Fuzzy search, if last_name can't be found.
-    if len(possible_matches) == 0:
-        possible_matches = get_fuzzy_names(politicians, name_to_check=last_name)
-
-    if len(possible_matches) == 0:
-        return False, possible_matches
-
-    # Check Faction ID.
-    if faction_id >= 0:
-        found, possible_matches = check_faction_id(
-            df, index, possible_matches, faction_id
-        )
-        if found:
-            return found, possible_matches
-
-    # Check First Name.
-    if first_name:
-        found, possible_matches = check_first_name(
-            df, index, possible_matches, first_name
-        )
-        if found:
-            return found, possible_matches
-
-    # Match with location info.
-    if constituency:
-        found, possible_matches = check_location_info(
-            df, index, possible_matches, constituency
-        )
-        if found:
-            return found, possible_matches
-    elif constituency == "":
-        # Probably someone joined during the period, e.g. there
-        # is an entry in STAMMDATEN for the correct person
-        # without the location info, as there was only one
-        # person with the last name before.
-        possible_matches = get_possible_matches(possible_matches, constituency="")
-        if check_unique(possible_matches, col="ui"):
-            set_id(df, index, possible_matches, col_set="politician_id", col_check="ui")
-            return True, possible_matches
-
-    # Check Gender.
-    found, possible_matches = check_woman(df, index, acad_title, possible_matches)
-    if found:
-        return True, possible_matches
-    else:
-        return False, possible_matches
-
-
 def check_woman(df, index, acad_title, possible_matches):
     if "Frau" in acad_title:
         possible_matches = possible_matches.loc[
@@ -211,17 +112,22 @@ def check_woman(df, index, acad_title, possible_matches):
 
 
 def insert_politician_id_into_speech_content(
-    df, politicians_electoral_term, mgs_electoral_term, politicians
+    df, politicians_electoral_term, mgs_electoral_term, politicians, matcher=None
 ):
-    "Appends a politician id column with matched IDs"
+    """Appends a politician id column with matched IDs.
+
+    The matching itself is done by a PoliticianMatcher, which should be built once
+    per electoral term and passed in via `matcher`, so its indexes and memoized
+    results are shared by all sessions of the term.
+    """
+    if matcher is None:
+        matcher = PoliticianMatcher(politicians_electoral_term, mgs_electoral_term)
 
     df = df.fillna("")
 
     last_name_copy = df["last_name"].copy()
     first_name_copy = df["first_name"].copy()
 
-    problem_df = []
-
     # Lower case to ease up matching. Note: first_name is a list of strings.
     df["first_name"] = df["first_name"].apply(
         lambda first: [str.lower(string) for string in first]
@@ -234,227 +140,38 @@ def insert_politician_id_into_speech_content(
     df.insert(4, "politician_id", -1)
     df["position_long"] = df["position_long"].str.lower()
 
-    for index, row in df.iterrows():
-        # ##################################################################
-        # ######## Start Matching ##########################################
-        # ##################################################################
-
-        if row["position_short"] == "Presidium of Parliament":
-            if row["position_long"] in [
-                "präsident",
-                "präsidentin",
-                "vizepräsident",
-                "vizepräsidentin",
-            ]:
-                if row["last_name"] == "jäger":
-                    # The president of the Bundestag is saves as "jaeger" in the "politicians" data
-                    # Maybe manually changing last name as below would work. But must be checked
-                    # if this does maybe change also other politicians which should not be changed.
-                    # row["last_name"] = "jaeger"
-                    pass
-                elif row["last_name"] == "bläss":
-                    row["last_name"] = "bläss-rafajlovski"
-
-                profession_pattern = "präsident dbt|präsidentin dbt|vizepräsident dbt|vizepräsidentin dbt|vizeprä. dbt"
-                found, possible_matches = check_name_and_profession(
-                    df,
-                    index,
-                    row["last_name"],
-                    profession_pattern,
-                    politicians_electoral_term,
-                )
-
-                if found:
-                    continue
-                else:
-                    found, possible_matches = check_member_of_parliament(
-                        df,
-                        index,
-                        row["first_name"],
-                        row["last_name"],
-                        politicians_electoral_term,
-                        row["faction_id"],
-                        row["constituency"],
-                        row["acad_title"],
-                        fuzzy_threshold=80,
-                    )
-
-                    if found:
-                        continue
-                    else:
-                        problem_df.append(row)
-
-            elif regex.search("schriftführer", row["position_long"]):
-                profession_pattern = "schriftführer"
-                found, possible_matches = check_name_and_profession(
-                    df,
-                    index,
-                    row["last_name"],
-                    profession_pattern,
-                    politicians_electoral_term,
-                )
-
-                if found:
-                    continue
-                else:
-                    found, possible_matches = check_member_of_parliament(
-                        df,
-                        index,
-                        row["first_name"],
-                        row["last_name"],
-                        politicians_electoral_term,
-                        row["faction_id"],
-                        row["constituency"],
-                        row["acad_title"],
-                        fuzzy_threshold=80,
-                    )
-
-                    if found:
-                        continue
-                    else:
-                        problem_df.append(row)
-
-            else:
-                found, possible_matches = check_member_of_parliament(
-                    df,
-                    index,
-                    row["first_name"],
-                    row["last_name"],
-                    politicians_electoral_term,
-                    row["faction_id"],
-                    row["constituency"],
-                    row["acad_title"],
-                    fuzzy_threshold=80,
-                )
-
-                if found:
-                    continue
-                else:
-                    problem_df.append(row)
-
-        elif row["position_short"] == "Minister":
-            found, possible_matches = check_government(
-                df, index, row["last_name"], mgs_electoral_term, fuzzy_threshold=75
-            )
-
-            if found:
-                continue
-            else:
-                found, possible_matches = check_member_of_parliament(
-                    df,
-                    index,
-                    row["first_name"],
-                    row["last_name"],
-                    politicians_electoral_term,
-                    row["faction_id"],
-                    row["constituency"],
-                    row["acad_title"],
-                    fuzzy_threshold=80,
-                )
-
-                if found:
-                    continue
-                else:
-                    problem_df.append(row)
-
-        elif row["position_short"] == "Chancellor":
-            found, possible_matches = check_government(
-                df, index, row["last_name"], mgs_electoral_term
-            )
-
-            if found:
-                continue
-            else:
-                problem_df.append(row)
-
-        elif row["position_short"] == "Secretary of State":
-            # Look for "Parlamentarische Staatsekretäre"
-            if regex.search("parl", row["position_long"]):
-                profession_pattern = (
-                    "Parl. Staatssekretär|Parlamentarischer Staatssekretär"
-                )
-
-                found, possible_matches = check_name_and_profession(
-                    df,
-                    index,
-                    row["last_name"],
-                    profession_pattern,
-                    politicians_electoral_term,
-                )
-
-                if found:
-                    continue
-                else:
-                    found, possible_matches = check_member_of_parliament(
-                        df,
-                        index,
-                        row["first_name"],
-                        row["last_name"],
-                        politicians_electoral_term,
-                        row["faction_id"],
-                        row["constituency"],
-                        row["acad_title"],
-                        fuzzy_threshold=80,
-                    )
-
-                    if found:
-                        continue
-                    else:
-                        problem_df.append(row)
-
-            # "Beamtete Staatsekretäre" are not included in "politicians" data.
-            elif regex.search("staatssekretär", row["position_long"]):
-                problem_df.append(row)
-                continue
-
-            else:
-                problem_df.append(row)
-                continue
-
-        elif row["position_short"] == "Member of Parliament":
-            found, possible_matches = check_member_of_parliament(
-                df,
-                index,
-                row["first_name"],
-                row["last_name"],
-                politicians_electoral_term,
-                row["faction_id"],
-                row["constituency"],
-                row["acad_title"],
-                fuzzy_threshold=80,
-            )
-
-            if found:
-                continue
-            else:
-                problem_df.append(row)
-
-        else:
-            # Some other notes
-            # Example: Meyer in 01033. Have the same last name and
-            # are in the same faction at same period. In this
-            # particular case the location information in the toc
-            # "Westhagen", does not match with the two possible
-            # location informations "Hagen", "Bremen"
-            # probably "Hagen" == "Westfalen" is meant.
-            # Other things: "Cornelia <Nachname>" ist in dem spoken content
-            # mit "Conny <Nachname>" abgespeichert. Findet Vornamen natürlich
-            # nicht.
+    results = matcher.match_speeches(df)
+
+    # Some notes on speeches which can't be matched:
+    # Example: Meyer in 01033. Have the same last name and are in the same faction
+    # at same period. In this particular case the location information in the toc
+    # "Westhagen", does not match with the two possible location informations
+    # "Hagen", "Bremen" probably "Hagen" == "Westfalen" is meant.
+    # Other things: "Cornelia <Nachname>" ist in dem spoken content mit
+    # "Conny <Nachname>" abgespeichert. Findet Vornamen natürlich nicht.
+    not_found = [not result.found for result in results]
+    problem_df = df.loc[not_found].copy()
+    problem_df["last_name"] = [
+        result.last_name for result in results if not result.found
+    ]
 
-            problem_df.append(row)
+    df["politician_id"] = [result.politician_id for result in results]
 
+    if any(result.restore_names for result in results):
         df["first_name"] = first_name_copy
         df["last_name"] = last_name_copy
 
-    problem_df = pd.DataFrame(problem_df)
-
     return df, problem_df
 
 
 def insert_politician_id_into_contributions_extended(
-    df, politicians_electoral_term, mgs_electoral_term
+    df, politicians_electoral_term, mgs_electoral_term, fuzzy_index=None
 ):
-    "Appends a politician id column with matched IDs"
+    """Appends a politician id column with matched IDs.
+
+    Fuzzy last name lookups go through `fuzzy_index`, which should be built once per
+    electoral term, so recurring misspelled names are only scored once.
+    """
 
     assert {
         "last_name",
@@ -464,6 +181,8 @@ def insert_politician_id_into_contributions_extended(
         "constituency",
     }.issubset(df.columns)
 
+    # Sessions without contributions need the column as well, see concat.
+    df.insert(4, "politician_id", -1)
     if len(df) == 0:
         return df, pd.DataFrame()
 
@@ -480,7 +199,14 @@ def insert_politician_id_into_contributions_extended(
     df["constituency"] = df["constituency"].str.lower()
     df["last_name"] = df["last_name"].str.lower()
     df["last_name"] = df["last_name"].str.replace("ß", "ss", regex=False)
-    df.insert(4, "politician_id", -1)
+
+    if fuzzy_index is None:
+        fuzzy_index = FuzzyNameIndex(politicians_electoral_term["last_name"])
+    # Score all names without an exact match in one batch.
+    known_names = set(politicians_electoral_term["last_name"])
+    fuzzy_index.lookup_many(
+        name for name in df["last_name"] if name and name not in known_names
+    )
 
     for index, row in df.iterrows():
         # Start Matching
@@ -509,7 +235,7 @@ def insert_politician_id_into_contributions_extended(
         # Fuzzy search, if last_name can't be found.
         if len(possible_matches) == 0:
             possible_matches = get_fuzzy_names(
-                politicians_electoral_term, row["last_name"]
+                politicians_electoral_term, row["last_name"], fuzzy_index=fuzzy_index
             )
 
         if len(possible_matches) == 0:
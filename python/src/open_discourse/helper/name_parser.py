@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+# Graf has to be checked again, as this is also a last_name.
+# Titles have to be added: Like e.c. or when mistakes occur like b.c.
+# Deleted "Graf" for now.
+TITLES = [
+    "Dr",
+    "Frau",
+    "D",
+    "-Ing",
+    "von",
+    "und",
+    "zu",
+    "van",
+    "de",
+    "Baron",
+    "Freiherr",
+    "Prinz",
+    "h",
+    "c",
+]
+
+
+def split_names(names: pd.Series, titles: list[str] = TITLES) -> pd.DataFrame:
+    """
+    Splits names into academic titles, first names and last name.
+
+    A name is split at whitespace. Parts in titles are academic titles, the last of
+    the remaining parts is the last name and all parts before it are first names.
+    All names are split at once: the parts of all names are classified with one
+    membership test and grouped back into one list per name.
+
+    Args:
+        names (pd.Series):      names with the non alphabetical characters
+                                removed, e.g. "Dr h c Hans Müller"
+        titles (list[str]):     parts that are academic titles
+
+    Returns:
+        pd.DataFrame: with the index of names and the columns acad_title
+                      (list[str]), first_name (list[str]), last_name (str, "" if
+                      the name has no parts besides titles) and name_count (int,
+                      number of parts besides titles)
+    """
+    length = len(names)
+    parts = names.astype(object).str.split().set_axis(pd.RangeIndex(length)).explode()
+    parts = parts[parts.notna()]
+    is_title = parts.isin(titles).to_numpy()
+
+    name_parts = parts[~is_title]
+    rows = name_parts.index.to_numpy()
+    # The last part of every name, parts are in the order of the names.
+    is_last = np.ones(len(rows), dtype=bool)
+    is_last[:-1] = rows[:-1] != rows[1:]
+
+    last_name = np.full(length, "", dtype=object)
+    last_name[rows[is_last]] = name_parts.to_numpy()[is_last]
+
+    return pd.DataFrame(
+        {
+            "acad_title": _group_parts(parts[is_title], length),
+            "first_name": _group_parts(name_parts[~is_last], length),
+            "last_name": last_name,
+            "name_count": np.bincount(rows, minlength=length),
+        },
+        index=names.index,
+    )
+
+
+def split_name(name: str, titles: list[str] = TITLES) -> tuple[list, list, str]:
+    """
+    Splits a single name like split_names.
+
+    Args:
+        name (str):             name, e.g. "Dr h c Hans Müller"
+        titles (list[str]):     parts that are academic titles
+
+    Returns:
+        tuple[list[str], list[str], str]: academic titles, first names and last
+                                          name, "" if the name has no parts
+                                          besides titles
+    """
+    parts = name.split()
+    acad_title = [part for part in parts if part in titles]
+    name_parts = [part for part in parts if part not in titles]
+    if not name_parts:
+        return acad_title, [], ""
+    return acad_title, name_parts[:-1], name_parts[-1]
+
+
+def _group_parts(parts: pd.Series, length: int) -> list[list[str]]:
+    """Returns the parts of every name as list, parts is indexed by name position."""
+    if not length:
+        return []
+    counts = np.bincount(parts.index.to_numpy(dtype=np.intp), minlength=length)
+    return [
+        chunk.tolist()
+        for chunk in np.split(parts.to_numpy(dtype=object), np.cumsum(counts)[:-1])
+    ]
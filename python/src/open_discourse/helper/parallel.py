@@ -0,0 +1,118 @@
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from tqdm import tqdm
+
+# Number of worker processes, e.g. OPEN_DISCOURSE_WORKERS=1 for a serial run.
+WORKERS_ENV_VAR = "OPEN_DISCOURSE_WORKERS"
+
+
+def get_worker_count(workers: int | None = None) -> int:
+    """
+    Determine the number of worker processes.
+
+    Args:
+        workers (int, optional):    explicit number of workers; if None, the
+                                    environment variable OPEN_DISCOURSE_WORKERS is
+                                    used and, if that is not set, all cpu cores.
+
+    Returns:
+        int: number of workers, at least 1
+    """
+    if workers is None:
+        workers = os.environ.get(WORKERS_ENV_VAR) or os.cpu_count() or 1
+    workers = int(workers)
+    if workers < 1:
+        raise ValueError(f"Invalid arg: workers {workers} less than 1.")
+    return workers
+
+
+def get_chunksize(item_count: int, workers: int) -> int:
+    """
+    Determine the number of items sent to a worker at once.
+
+    Like multiprocessing.Pool.map, the items are split into about four chunks per
+    worker, so few items are pickled and sent one by one while the workers are
+    still balanced.
+
+    Args:
+        item_count (int):   number of work items
+        workers (int):      number of worker processes
+
+    Returns:
+        int: chunksize, at least 1
+    """
+    chunksize, extra = divmod(item_count, workers * 4)
+    return max(chunksize + bool(extra), 1)
+
+
+def run_parallel(
+    func: Callable[..., Any],
+    items: Iterable,
+    workers: int | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+    chunksize: int | None = None,
+    desc: str | None = None,
+) -> list:
+    """
+    Apply func to every item in a pool of worker processes.
+
+    Results are returned in the order of items, so a parallel run yields the same
+    results as a serial one. initializer is called once per worker process and is
+    meant for loading shared read-only data like factions.pkl or politicians.csv.
+    With a single worker everything runs in the current process, which is useful
+    for debugging.
+
+    Args:
+        func (Callable):            picklable (module-level) function taking one item
+        items (Iterable):           work items, e.g. session file paths
+        workers (int, optional):    number of worker processes, see get_worker_count
+        initializer (Callable):     called once per worker with initargs
+        initargs (tuple):           arguments for initializer
+        chunksize (int, optional):  number of items sent to a worker at once, see
+                                    get_chunksize by default
+        desc (str, optional):       description of the progress bar
+
+    Returns:
+        list: results of func in the order of items
+    """
+    return list(
+        iter_parallel(func, items, workers, initializer, initargs, chunksize, desc)
+    )
+
+
+def iter_parallel(
+    func: Callable[..., Any],
+    items: Iterable,
+    workers: int | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+    chunksize: int | None = None,
+    desc: str | None = None,
+) -> Iterator:
+    """
+    Like run_parallel, but yields the results in the order of items as they are
+    done, e.g. to write them without keeping all of them in memory.
+    """
+    items = list(items)
+    workers = min(get_worker_count(workers), max(len(items), 1))
+
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from (func(item) for item in tqdm(items, desc=desc))
+        return
+
+    if chunksize is None:
+        chunksize = get_chunksize(len(items), workers)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        yield from tqdm(
+            executor.map(func, items, chunksize=chunksize),
+            total=len(items),
+            desc=desc,
+        )
@@ -9,6 +9,14 @@ BEGIN_PATTERN = regex.compile(
 
 APPENDIX_PATTERN = regex.compile(r"\(Schluß.*?Sitzung.*?Uhr.*?\)")
 
+# The patterns don't match a newline, so every match lies on a single line. Only
+# lines with the anchor, the rarest word of a pattern, and the other words of the
+# pattern can contain a match.
+BEGIN_ANCHOR = "eröffnet"
+BEGIN_WORDS = ("Die", "Sitzung", "wird", "Uhr")
+APPENDIX_ANCHOR = "(Schluß"
+APPENDIX_WORDS = ("Sitzung", "Uhr")
+
 
 class Metadata(BaseModel):
     document_number: str
@@ -29,8 +37,12 @@ def get_session_content(text_corpus: str) -> str:
     Returns:
         str: The spoken content if it could be extracted. Otherwise, an empty string.
     """
-    find_beginnings = list(BEGIN_PATTERN.finditer(text_corpus))
-    find_endings = list(APPENDIX_PATTERN.finditer(text_corpus))
+    find_beginnings = find_in_lines(
+        BEGIN_PATTERN, text_corpus, BEGIN_ANCHOR, BEGIN_WORDS
+    )
+    find_endings = find_in_lines(
+        APPENDIX_PATTERN, text_corpus, APPENDIX_ANCHOR, APPENDIX_WORDS
+    )
 
     # Just extract spoken parts between the matching of the
     # beginning and the ending pattern. TOC and APPENDIX is
@@ -54,6 +66,42 @@ def get_session_content(text_corpus: str) -> str:
     return session_content
 
 
+def find_in_lines(
+    pattern: regex.Pattern, text: str, anchor: str, words: tuple[str, ...] = ()
+) -> list[regex.Match]:
+    """
+    Finds the matches of a single line pattern in the lines around an anchor.
+
+    The text is searched for the anchor with str.find and the pattern only runs on
+    the lines that contain the anchor and all words, instead of being tried at
+    every position of the whole text. For a pattern that can't match a newline,
+    whose matches all contain the anchor and the words, the matches are the same
+    as of pattern.finditer(text).
+
+    Args:
+        pattern (regex.Pattern):    pattern without DOTALL, newlines or anchors
+                                    like ^ and lookbehinds
+        text (str):                 text to search
+        anchor (str):               literal every match contains
+        words (tuple[str, ...]):    other literals every match contains
+
+    Returns:
+        list[regex.Match]: matches with their spans in text
+    """
+    matches = []
+    position = text.find(anchor)
+    while position != -1:
+        line_start = text.rfind("\n", 0, position) + 1
+        line_end = text.find("\n", position)
+        if line_end == -1:
+            line_end = len(text)
+        line = text[line_start:line_end]
+        if all(word in line for word in words):
+            matches.extend(pattern.finditer(text, line_start, line_end))
+        position = text.find(anchor, line_end)
+    return matches
+
+
 def get_doc_metadata(tree: ElementTree) -> Metadata:
     """
     Extracts the document number and the date of the session from the XML tree.
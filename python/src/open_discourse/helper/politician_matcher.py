@@ -0,0 +1,303 @@
+from typing import NamedTuple
+
+import Levenshtein
+import pandas as pd
+import regex
+
+from open_discourse.helper.fuzzy_names import FuzzyNameIndex
+
+PRESIDENT_POSITIONS = ["präsident", "präsidentin", "vizepräsident", "vizepräsidentin"]
+PRESIDENT_PROFESSION = (
+    "präsident dbt|präsidentin dbt|vizepräsident dbt|vizepräsidentin dbt|vizeprä. dbt"
+)
+SECRETARY_PROFESSION = "schriftführer"
+STATE_SECRETARY_PROFESSION = "Parl. Staatssekretär|Parlamentarischer Staatssekretär"
+
+
+class MatchResult(NamedTuple):
+    politician_id: int
+    found: bool
+    # The legacy matcher restored the original name columns of the whole frame
+    # whenever an unmatched speech reached the end of its loop body. The flag keeps
+    # that behaviour reproducible.
+    restore_names: bool
+    last_name: str
+
+
+class PoliticianTable:
+    """Hash indexes over the politicians of one electoral term.
+
+    The rows of the given frame are stored column wise in plain lists and are
+    referenced by their position. Candidates are looked up via dictionaries keyed by
+    last name, (last name, faction_id) and first name tokens instead of filtering the
+    whole frame with boolean masks for every speech.
+    """
+
+    def __init__(self, politicians: pd.DataFrame):
+        self.ui = politicians["ui"].tolist()
+        self.last_name = politicians["last_name"].tolist()
+        self.faction_id = politicians["faction_id"].tolist()
+        self.first_name = [set(first) for first in politicians["first_name"]]
+        self.constituency = politicians["constituency"].tolist()
+        self.gender = _column_or_default(politicians, "gender")
+        self.profession = _column_or_default(politicians, "profession")
+
+        self.by_last_name = {}
+        self.by_last_name_and_faction = {}
+        self.by_first_name = {}
+        for position, (last_name, faction_id, first_name) in enumerate(
+            zip(self.last_name, self.faction_id, self.first_name)
+        ):
+            self.by_last_name.setdefault(last_name, []).append(position)
+            self.by_last_name_and_faction.setdefault(
+                (last_name, faction_id), []
+            ).append(position)
+            for token in first_name:
+                self.by_first_name.setdefault(token, set()).add(position)
+
+        self.fuzzy_last_name = FuzzyNameIndex(self.by_last_name)
+        self._profession_patterns = {}
+
+    def unique_ui(self, candidates: list[int]) -> int | None:
+        """Returns the ui if all candidates refer to the same politician."""
+        uis = {self.ui[position] for position in candidates}
+        if len(uis) == 1:
+            return int(self.ui[candidates[0]])
+        return None
+
+    def with_last_name(self, last_name: str) -> list[int]:
+        return self.by_last_name.get(last_name, [])
+
+    def with_fuzzy_last_name(self, last_name: str, fuzzy_threshold: float) -> list[int]:
+        candidates = []
+        for name in self.fuzzy_last_name.lookup(last_name, fuzzy_threshold):
+            candidates += self.by_last_name[name]
+        return sorted(candidates)
+
+    def with_faction_id(
+        self, candidates: list[int], faction_id: int, last_name: str | None = None
+    ) -> list[int]:
+        if last_name is not None:
+            return self.by_last_name_and_faction.get((last_name, faction_id), [])
+        return [p for p in candidates if self.faction_id[p] == faction_id]
+
+    def with_first_name(
+        self, candidates: list[int], first_name: list[str]
+    ) -> list[int]:
+        matches = set()
+        for token in first_name:
+            matches |= self.by_first_name.get(token, set())
+        return [p for p in candidates if p in matches]
+
+    def with_constituency(
+        self, candidates: list[int], constituency: str, fuzzy_threshold: float = 0.7
+    ) -> list[int]:
+        return [
+            p
+            for p in candidates
+            if Levenshtein.ratio(self.constituency[p], constituency) > fuzzy_threshold
+        ]
+
+    def without_constituency(self, candidates: list[int]) -> list[int]:
+        return [p for p in candidates if self.constituency[p] == ""]
+
+    def with_gender(self, candidates: list[int], gender: str) -> list[int]:
+        return [p for p in candidates if self.gender[p] == gender]
+
+    def with_profession(self, candidates: list[int], profession: str) -> list[int]:
+        if profession not in self._profession_patterns:
+            self._profession_patterns[profession] = regex.compile(profession)
+        profession_pattern = self._profession_patterns[profession]
+        return [
+            p
+            for p in candidates
+            if isinstance(self.profession[p], str)
+            and profession_pattern.search(self.profession[p])
+        ]
+
+
+class PoliticianMatcher:
+    """Resolves speakers of one electoral term to politician ids.
+
+    Applies the same cascade as the original row wise matching in
+    `helper/match_names.py` (profession -> last name -> faction -> first name ->
+    constituency -> gender), but on dictionary based indexes which are built once
+    per electoral term. Results are memoized, as the same speaker usually holds
+    many speeches in a term.
+    """
+
+    def __init__(
+        self,
+        politicians_electoral_term: pd.DataFrame,
+        mgs_electoral_term: pd.DataFrame,
+    ):
+        self.members = PoliticianTable(politicians_electoral_term)
+        self.government = PoliticianTable(mgs_electoral_term)
+        self._cache = {}
+
+    def match_speeches(self, df: pd.DataFrame) -> list[MatchResult]:
+        """Matches every speech of an already normalized speech_content frame.
+
+        Expects lower case names (first_name as list of tokens), a lower case
+        constituency and position_long and no missing values.
+        """
+        # Score all last names without an exact match in one batch.
+        self.members.fuzzy_last_name.lookup_many(
+            name for name in df["last_name"] if name not in self.members.by_last_name
+        )
+
+        results = []
+        for key in zip(
+            df["position_short"],
+            df["position_long"],
+            df["first_name"].apply(tuple),
+            df["last_name"],
+            df["faction_id"],
+            df["constituency"],
+            df["acad_title"].apply(lambda acad_title: "Frau" in acad_title),
+        ):
+            if key not in self._cache:
+                self._cache[key] = self.match_speaker(*key)
+            results.append(self._cache[key])
+        return results
+
+    def match_speaker(
+        self,
+        position_short: str,
+        position_long: str,
+        first_name: tuple[str, ...],
+        last_name: str,
+        faction_id: int,
+        constituency: str,
+        is_woman: bool,
+    ) -> MatchResult:
+        def member_of_parliament(last_name):
+            ui = self.match_member_of_parliament(
+                first_name, last_name, faction_id, constituency, is_woman
+            )
+            return _result(ui, last_name)
+
+        if position_short == "Presidium of Parliament":
+            if position_long in PRESIDENT_POSITIONS:
+                if last_name == "bläss":
+                    last_name = "bläss-rafajlovski"
+                profession = PRESIDENT_PROFESSION
+            elif SECRETARY_PROFESSION in position_long:
+                profession = SECRETARY_PROFESSION
+            else:
+                return member_of_parliament(last_name)
+
+            ui = self.match_name_and_profession(last_name, profession)
+            if ui is not None:
+                return _result(ui, last_name)
+            return member_of_parliament(last_name)
+
+        elif position_short == "Minister":
+            ui = self.match_government(last_name)
+            if ui is not None:
+                return _result(ui, last_name)
+            return member_of_parliament(last_name)
+
+        elif position_short == "Chancellor":
+            return _result(self.match_government(last_name), last_name)
+
+        elif position_short == "Secretary of State":
+            # "Beamtete Staatssekretäre" are not included in "politicians" data.
+            if "parl" not in position_long:
+                return MatchResult(-1, False, False, last_name)
+
+            ui = self.match_name_and_profession(last_name, STATE_SECRETARY_PROFESSION)
+            if ui is not None:
+                return _result(ui, last_name)
+            return member_of_parliament(last_name)
+
+        elif position_short == "Member of Parliament":
+            return member_of_parliament(last_name)
+
+        return _result(None, last_name)
+
+    def match_name_and_profession(self, last_name: str, profession: str) -> int | None:
+        # The legacy fuzzy search used a threshold of 75, which no ratio can reach.
+        candidates = self.members.with_last_name(last_name)
+        ui = self.members.unique_ui(candidates)
+        if ui is not None:
+            return ui
+        return self.members.unique_ui(
+            self.members.with_profession(candidates, profession)
+        )
+
+    def match_government(self, last_name: str) -> int | None:
+        return self.government.unique_ui(self.government.with_last_name(last_name))
+
+    def match_member_of_parliament(
+        self,
+        first_name: tuple[str, ...],
+        last_name: str,
+        faction_id: int,
+        constituency: str,
+        is_woman: bool,
+    ) -> int | None:
+        members = self.members
+
+        # Check Last Name.
+        candidates = members.with_last_name(last_name)
+        ui = members.unique_ui(candidates)
+        if ui is not None:
+            return ui
+
+        exact_last_name = last_name
+        # Fuzzy search, if last_name can't be found.
+        if len(candidates) == 0:
+            candidates = members.with_fuzzy_last_name(last_name, 0.7)
+            exact_last_name = None
+
+        if len(candidates) == 0:
+            return None
+
+        # Check Faction ID.
+        if faction_id >= 0:
+            candidates = members.with_faction_id(
+                candidates, faction_id, last_name=exact_last_name
+            )
+            ui = members.unique_ui(candidates)
+            if ui is not None:
+                return ui
+
+        # Check First Name.
+        if first_name:
+            candidates = members.with_first_name(candidates, first_name)
+            ui = members.unique_ui(candidates)
+            if ui is not None:
+                return ui
+
+        # Match with location info.
+        if constituency:
+            candidates = members.with_constituency(candidates, constituency)
+            ui = members.unique_ui(candidates)
+            if ui is not None:
+                return ui
+        elif constituency == "":
+            # Probably someone joined during the period, e.g. there is an entry in
+            # STAMMDATEN for the correct person without the location info.
+            candidates = members.without_constituency(candidates)
+            ui = members.unique_ui(candidates)
+            if ui is not None:
+                return ui
+
+        # Check Gender.
+        if is_woman:
+            return members.unique_ui(members.with_gender(candidates, "weiblich"))
+
+        return None
+
+
+def _result(ui: int | None, last_name: str) -> MatchResult:
+    if ui is None:
+        return MatchResult(-1, False, True, last_name)
+    return MatchResult(ui, True, False, last_name)
+
+
+def _column_or_default(df: pd.DataFrame, column: str, default=None) -> list:
+    if column in df.columns:
+        return df[column].tolist()
+    return [default] * len(df)
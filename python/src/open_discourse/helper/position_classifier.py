@@ -0,0 +1,153 @@
+import functools
+from typing import NamedTuple
+
+import pandas as pd
+import regex
+
+from open_discourse.definitions import pattern
+
+# Positions are matched at the start of the raw position, a title may be followed
+# by any character, e.g. "Bundesminister der Finanzen".
+member_pattern = regex.compile(r"[Bb]erichterstatter(in)?(\s|$|,|.)")
+presidium_pattern = regex.compile(
+    r"[Bb]undestagspräsident(in)?(\s|$|,|.)"
+    r"|[Aa]lterspräsident(in)?(\s|$|,|.)"
+    r"|[Vv]izebundestagspräsident(in)?(\s|$|,|.)"
+    r"|[Ss]chriftführer(in)?(\s|$|,|.)"
+)
+presidium_positions = {
+    "präsidentin",
+    "präsident",
+    "präsident des deutschen bundestages",
+    "präsidentin des deutschen bundestages",
+    "vizepräsidentin",
+    "vizepräsident",
+}
+guest_pattern = regex.compile(
+    r"[Bb]undespräsident(in)?(\s|$|,|.)"
+    r"|[Ss]taatsminister(in)?(\s|$|,|.)"
+    r"|[Ss]enator(in)?(\s|$|,|.)"
+    r"|[Pp]räsident(in)?(\s|$|,|.)"
+    r"|[Gg]ast"
+)
+# The protocols of electoral term 20 also name the Ministerpräsidenten of the states.
+guest_electoral_term_20_pattern = regex.compile(
+    r"[Bb]undespräsident(in)?(\s|$|,|.)"
+    r"|[Mm]inisterpräsident(in)?(\s|$|,|.)"
+    r"|[Ss]taatsminister(in)?(\s|$|,|.)"
+    r"|[Ss]enator(in)?(\s|$|,|.)"
+    r"|[Pp]räsident(in)?(\s|$|,|.)"
+    r"|[Gg]ast"
+)
+chancellor_pattern = regex.compile(r"[Bb]undeskanzler(in)?(\s|$|,|.)")
+minister_pattern = regex.compile(r"(Bundes)?[Mm]inister(in)?(\s|$|,|.)")
+secretary_pattern = regex.compile(r"([Pp]arl\s*\.\s+)?[Ss]taatssekretär(in)?(\s|$|,|.)")
+newlines_pattern = regex.compile(r"\n+")
+
+
+class Position(NamedTuple):
+    faction_abbrev: str | None
+    faction_id: int
+    position_short: str
+    position_long: str | None
+
+
+def get_faction_abbrev(
+    faction: str, faction_patterns: dict[str, regex.Pattern] = pattern.FACTIONS
+) -> str | None:
+    """Returns the abbreviation of the first faction whose pattern is found."""
+    for faction_abbrev, faction_pattern in faction_patterns.items():
+        if faction_pattern.search(faction):
+            return faction_abbrev
+    return None
+
+
+def get_position_short_and_long(
+    position: str, guest_pattern: regex.Pattern = guest_pattern
+) -> tuple[str, str | None]:
+    """matches the given position and returns the long and short version"""
+    if position in pattern.FACTIONS:
+        return "Member of Parliament", None
+    elif member_pattern.match(position):
+        return "Member of Parliament", position
+    elif presidium_pattern.match(position) or position.lower() in presidium_positions:
+        return "Presidium of Parliament", position
+    elif guest_pattern.match(position):
+        return "Guest", position
+    elif chancellor_pattern.match(position):
+        return "Chancellor", None
+    elif minister_pattern.match(position):
+        return "Minister", position
+    elif secretary_pattern.match(position):
+        return "Secretary of State", position
+    else:
+        return "Not found", None
+
+
+class PositionClassifier:
+    """Classifies raw positions like "SPD" or "Bundesminister der Finanzen".
+
+    A raw position is classified by faction and, if it is no faction, by position.
+    As the same few thousand raw positions recur in all sessions, the results are
+    memoized in a bounded LRU cache. The faction ids are looked up in a dict, the
+    first id of an abbreviation in factions wins.
+
+    Args:
+        factions (pd.DataFrame):        factions with the columns abbreviation and id
+        faction_patterns (dict):        patterns of the factions by abbreviation,
+                                        the first pattern found wins
+        guest_pattern (regex.Pattern):  pattern of the guest positions
+        maxsize (int):                  maximum number of memoized raw positions
+    """
+
+    def __init__(
+        self,
+        factions: pd.DataFrame,
+        faction_patterns: dict[str, regex.Pattern] = pattern.FACTIONS,
+        guest_pattern: regex.Pattern = guest_pattern,
+        maxsize: int = 8192,
+    ):
+        factions = factions.drop_duplicates(subset="abbreviation", keep="first")
+        self.faction_ids = {
+            faction_abbrev: int(faction_id)
+            for faction_abbrev, faction_id in zip(
+                factions["abbreviation"], factions["id"]
+            )
+        }
+        self.faction_patterns = faction_patterns
+        self.guest_pattern = guest_pattern
+        self.classify = functools.lru_cache(maxsize=maxsize)(self._classify)
+
+    def _classify(self, position_raw: str) -> Position:
+        position_raw = str(position_raw)
+        faction_abbrev = get_faction_abbrev(position_raw, self.faction_patterns)
+        position_short, position_long = get_position_short_and_long(
+            faction_abbrev or newlines_pattern.sub(" ", position_raw),
+            self.guest_pattern,
+        )
+        return Position(
+            faction_abbrev,
+            self.faction_ids.get(faction_abbrev, -1),
+            position_short,
+            position_long,
+        )
+
+    def classify_many(self, positions_raw: pd.Series) -> pd.DataFrame:
+        """
+        Classifies a whole column, every distinct raw position only once.
+
+        Args:
+            positions_raw (pd.Series):  raw positions, e.g. position_raw
+
+        Returns:
+            pd.DataFrame: with the index of positions_raw and the fields of Position
+                          as columns
+        """
+        unique = pd.Index(pd.unique(positions_raw))
+        classified = pd.DataFrame(
+            [self.classify(position_raw) for position_raw in unique],
+            columns=list(Position._fields),
+        ).astype({"faction_id": "int64"})
+        return classified.iloc[unique.get_indexer(positions_raw)].set_axis(
+            positions_raw.index
+        )
@@ -0,0 +1,100 @@
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import regex
+from bs4 import BeautifulSoup
+
+# Name of the catalog file in the folder of the downloaded protocols.
+CATALOG_NAME = "catalog.json"
+
+xml_link_pattern = regex.compile("xml$")
+session_pattern = regex.compile(r"\d{5}(?=\.xml)")
+
+
+def parse_listing(page: str) -> list[tuple[str, str]]:
+    """
+    Returns the protocols linked on a page of the Bundestag filterlist.
+
+    Args:
+        page (str): html of a listing page
+
+    Returns:
+        list[tuple[str, str]]: session, e.g. "20001", and url of every linked XML
+                               file in the order of the page
+    """
+    soup = BeautifulSoup(page, "html.parser")
+    protocols = []
+    for link in soup.find_all("a", attrs={"href": xml_link_pattern}):
+        url = link.get("href")
+        session = session_pattern.search(url)
+        if session is not None:
+            protocols.append((session.group(0), url))
+    return protocols
+
+
+class ProtocolCatalog:
+    """Known protocols of an electoral term with the url they were downloaded from.
+
+    The filterlist of the Bundestag lists the newest protocols first. So instead
+    of paging through the whole listing on every run, discover stops at the first
+    page that links a protocol already in the catalog with the same url. A
+    corrected protocol gets a new url and is discovered as changed, as long as it
+    is listed before the first known one.
+
+    Args:
+        catalog_path (Path):    path of the catalog json file
+    """
+
+    def __init__(self, catalog_path: Path):
+        self.catalog_path = Path(catalog_path)
+        self.sessions = {}
+        if self.catalog_path.exists():
+            with open(self.catalog_path) as file:
+                self.sessions = json.load(file)["sessions"]
+
+    def discover(
+        self, fetch_page: Callable[[int], str], full: bool = False
+    ) -> dict[str, str]:
+        """
+        Pages through the listing until it reaches protocols already known.
+
+        Args:
+            fetch_page (Callable[[int], str]):  returns the html of the listing
+                                                page starting at an offset
+            full (bool):                        page through the whole listing,
+                                                e.g. to find corrected protocols
+                                                of older sessions
+
+        Returns:
+            dict[str, str]: url of every new or changed protocol by session
+        """
+        discovered = {}
+        offset = 0
+        while True:
+            protocols = parse_listing(fetch_page(offset))
+            if not protocols:
+                break
+            offset += len(protocols)
+
+            reached_known = False
+            for session, url in protocols:
+                if self.sessions.get(session) == url:
+                    reached_known = True
+                elif session not in discovered:
+                    discovered[session] = url
+            if reached_known and not full:
+                break
+        return discovered
+
+    def update(self, protocols: dict[str, str]):
+        """Records the url of downloaded protocols, call save to store them."""
+        self.sessions.update(protocols)
+
+    def save(self):
+        self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.catalog_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as file:
+            json.dump({"sessions": dict(sorted(self.sessions.items()))}, file, indent=1)
+        os.replace(tmp_path, self.catalog_path)
@@ -1,4 +1,4 @@
-import logging
+import zipfile
 from pathlib import Path
 from typing import Generator
 
@@ -11,13 +11,21 @@ from open_discourse.definitions.path import (
     CONTRIBUTIONS_EXTENDED_STAGE_04,
     RAW_TXT,
     RAW_XML,
+    RAW_ZIP,
     SPEECH_CONTENT_STAGE_01,
     SPEECH_CONTENT_STAGE_02,
     SPEECH_CONTENT_STAGE_03,
     SPEECH_CONTENT_STAGE_04,
 )
 from open_discourse.helper.create_electoral_terms import create_electoral_terms
-from open_discourse.helper.utils import get_term_from_path
+from open_discourse.helper.session_index import session_index
+from open_discourse.helper.session_store import (
+    StoredSession,
+    store_files,
+    store_sessions,
+)
+from open_discourse.helper.storage import SUFFIX
+from open_discourse.helper.utils import parse_path
 
 
 def validate_term_session(
@@ -79,25 +87,18 @@ def validate_term_session(
         return list(range(param[0], param[1] + 1))
 
 
-def _get_glob(file_pattern: str, term: int):
-    if file_pattern == "*.xml":
-        glob_pattern = f"electoral_term_pp{term:02}.zip/{file_pattern}"
-    elif file_pattern == "session_content.txt":
-        glob_pattern = f"electoral_term_pp{term:02}.zip/*/{file_pattern}"
-    else:
-        glob_pattern = f"electoral_term_pp{term:02}.zip/{file_pattern}"
-    return glob_pattern
-
-
 def session_file_iterator(
     source_dir: Path,
     term: int | tuple[int, int] | None = None,
     session: int | tuple[int, int] | None = None,
-) -> Generator[Path, None, None]:
+) -> Generator[Path | zipfile.Path | StoredSession, None, None]:
     """
     Iterate through every subfolder of source_dir, e.g. RAW_XML from electoral term 01
     to the highest completed electoral term and return input_file_path.
     Call can be limited to one term or one session by additional args.
+    For RAW_ZIP the sessions are members of the downloaded archives, read without
+    extracting them, see session_index. For RAW_TXT the sessions are in one session
+    store per term, they are returned as StoredSession, see session_store.
     Raises NotImplementedError resp. ValueError when args are not consistent or valid
 
     Args:
@@ -106,20 +107,22 @@ def session_file_iterator(
         session (int or tuple, optional):      session number in electoral term
 
     Returns:
-        Generator[Path, None, None]: input_file_path form Generator
+        Generator[Path | zipfile.Path | StoredSession, None, None]: input_file_path
+            form Generator, resp. stored session
 
     """
     file_pattern = {
         RAW_XML: "*.xml",
-        RAW_TXT: "session_content.txt",
-        SPEECH_CONTENT_STAGE_01: "*.pkl",
-        SPEECH_CONTENT_STAGE_02: "*.pkl",
-        SPEECH_CONTENT_STAGE_03: "*.pkl",
-        SPEECH_CONTENT_STAGE_04: "*.pkl",
-        CONTRIBUTIONS_EXTENDED_STAGE_01: "*.pkl",
-        CONTRIBUTIONS_EXTENDED_STAGE_02: "*.pkl",
-        CONTRIBUTIONS_EXTENDED_STAGE_03: "*.pkl",
-        CONTRIBUTIONS_EXTENDED_STAGE_04: "*.pkl",
+        RAW_ZIP: "*.xml",
+        RAW_TXT: f"electoral_term_pp*{SUFFIX}",
+        SPEECH_CONTENT_STAGE_01: f"*{SUFFIX}",
+        SPEECH_CONTENT_STAGE_02: f"*{SUFFIX}",
+        SPEECH_CONTENT_STAGE_03: f"*{SUFFIX}",
+        SPEECH_CONTENT_STAGE_04: f"*{SUFFIX}",
+        CONTRIBUTIONS_EXTENDED_STAGE_01: f"*{SUFFIX}",
+        CONTRIBUTIONS_EXTENDED_STAGE_02: f"*{SUFFIX}",
+        CONTRIBUTIONS_EXTENDED_STAGE_03: f"*{SUFFIX}",
+        CONTRIBUTIONS_EXTENDED_STAGE_04: f"*{SUFFIX}",
     }
 
     if source_dir not in file_pattern:
@@ -149,6 +152,20 @@ def session_file_iterator(
             max_session = electoral_terms[term]["number_of_sessions"]
             session_list = validate_term_session(session, max_session, "session")
 
+    if source_dir == RAW_TXT:
+        # term -> sessions of the store, only the session column is read
+        index = {
+            term_number: [
+                StoredSession(store_path, stored_session)
+                for stored_session in store_sessions(store_path)
+            ]
+            for term_number, store_path in store_files(source_dir).items()
+        }
+    else:
+        # term -> sorted session files, the term folders are only scanned if they
+        # changed
+        index = session_index(source_dir, file_pattern)
+
     # search for file_pattern
     tqdm_bar = None
     for term_number in term_list:
@@ -167,44 +184,17 @@ def session_file_iterator(
             position=0,
         )
 
-        glob_pattern = _get_glob(file_pattern=file_pattern, term=term_number)
-
-        file_list = sorted(source_dir.glob(glob_pattern), key=lambda x: x.name)
-        for input_path in file_list:
-            if not input_path.is_file():
-                continue
-
-            # session_content.txt-files are in a deeper directory
-            if file_pattern == "session_content.txt":
-                check_term = int(input_path.parent.name[:2])
-                check_session = int(input_path.parent.name[2:])
-                check_dir = input_path.parent.parent
-            else:
-                try:
-                    check_term = int(input_path.stem[:2])
-                    check_session = int(input_path.stem[2:])
-                    check_dir = input_path.parent
-                except ValueError:
-                    logging.warning(
-                        f"Invalid file: {input_path} should not exist in directoy!"
-                    )
-                    continue
-
+        for input_path in index.get(term_number, []):
             # Check for relevant session
             if session is not None:
-                if check_session not in session_list:
+                name = (
+                    input_path.session
+                    if isinstance(input_path, StoredSession)
+                    else input_path
+                )
+                if parse_path(str(name)).session not in session_list:
                     continue
 
-            parent = input_path.parent
-            # are there any sub_directories?
-            if any(child.is_dir() for child in input_path.parent.iterdir()):
-                logging.warning(f"Path {parent} should not contain sub_dirs!")
-
-            # check consistency in dir-name electoral_term
-            term_in_path = get_term_from_path(str(check_dir))
-            if term_in_path != check_term:
-                raise ValueError(f"inconsitent {input_path} {check_dir}")
-
             tqdm_bar.update(1)
             yield input_path
 
@@ -0,0 +1,175 @@
+import json
+import logging
+import operator
+import os
+import zipfile
+from pathlib import Path
+
+from open_discourse.helper.archive import archive_member, archive_members
+from open_discourse.helper.utils import document_number_pattern, get_term_from_path
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "session_index.json"
+
+
+def session_index(
+    source_dir: Path, file_pattern: str
+) -> dict[int, list[Path | zipfile.Path]]:
+    """
+    Returns the session files of every electoral term in source_dir.
+
+    The sessions are stored in electoral_term_ppXX folders, either as files named
+    after the session, e.g. 05001.xml for the file_pattern "*.xml", or as folders
+    named after the session, e.g. 05001/session_content.txt for the file_pattern
+    "session_content.txt". Instead of a folder, a term can also be a ZIP archive
+    like electoral_term_pp05.zip with the session files at its top level, then
+    the sessions are read from its central directory and returned as members of
+    the archive. The folders are scanned with os.scandir and the index is stored
+    as INDEX_NAME in source_dir. A term folder or archive is only scanned again if
+    its modification time changed, i.e. sessions were added, removed or renamed.
+    Deleting the index forces a full scan.
+
+    Args:
+        source_dir (Path):      directory of the term folders, e.g. RAW_XML
+        file_pattern (str):     "*" and the suffix of the session files, or the
+                                name of the file in the session folders
+
+    Returns:
+        dict[int, list[Path | zipfile.Path]]: session paths sorted by name, by
+                                              term in ascending order
+
+    Raises:
+        ValueError: if a session belongs to another term than its folder
+    """
+    source_dir = Path(source_dir)
+    index_path = source_dir / INDEX_NAME
+    previous = _load_index(index_path, file_pattern)
+
+    folders = {}
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            term_number = get_term_from_path(entry.name)
+            if term_number is None:
+                continue
+            is_archive = entry.name.endswith(".zip") and entry.is_file()
+            if not (is_archive or entry.is_dir()):
+                continue
+            mtime_ns = entry.stat().st_mtime_ns
+            folder = previous.get(entry.name)
+            if folder is None or folder["mtime_ns"] != mtime_ns:
+                scan = _scan_archive if is_archive else _scan_term_folder
+                folder = {
+                    "term": term_number,
+                    "mtime_ns": mtime_ns,
+                    "archive": is_archive,
+                    "sessions": scan(Path(entry.path), term_number, file_pattern),
+                }
+            folders[entry.name] = folder
+
+    if folders != previous:
+        _save_index(index_path, file_pattern, folders)
+
+    sessions = {}
+    for folder_name, folder in sorted(folders.items()):
+        if folder.get("archive"):
+            paths = (
+                archive_member(source_dir / folder_name, session)
+                for session in folder["sessions"]
+            )
+        else:
+            paths = (
+                source_dir / folder_name / session for session in folder["sessions"]
+            )
+        sessions.setdefault(folder["term"], []).extend(zip(paths, folder["sessions"]))
+    return {
+        term: [path for path, session in sorted(paths, key=operator.itemgetter(1))]
+        for term, paths in sorted(sessions.items())
+    }
+
+
+def _scan_term_folder(folder_path: Path, term: int, file_pattern: str) -> list[str]:
+    """Returns the session paths of a term folder relative to it, sorted."""
+    sessions = []
+    in_session_folders = not file_pattern.startswith("*")
+    suffix = file_pattern[1:]
+
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if in_session_folders:
+                if not entry.is_dir():
+                    continue
+                session = entry.name
+                with os.scandir(entry.path) as children:
+                    children = list(children)
+                if not any(
+                    child.name == file_pattern and child.is_file() for child in children
+                ):
+                    continue
+                if any(child.is_dir() for child in children):
+                    logger.warning(f"Path {entry.path} should not contain sub_dirs!")
+                relative_path = f"{session}/{file_pattern}"
+            else:
+                if entry.is_dir():
+                    logger.warning(f"Path {folder_path} should not contain sub_dirs!")
+                    continue
+                if not entry.name.endswith(suffix) or not entry.is_file():
+                    continue
+                session = entry.name[: -len(suffix)] if suffix else entry.name
+                relative_path = entry.name
+
+            if _is_session(session, term, entry.path, folder_path):
+                sessions.append(relative_path)
+
+    return sorted(sessions)
+
+
+def _scan_archive(archive_path: Path, term: int, file_pattern: str) -> list[str]:
+    """Returns the names of the session files in an archive, sorted."""
+    if not file_pattern.startswith("*"):
+        raise ValueError(f"Sessions in folders are not supported in {archive_path}")
+    suffix = file_pattern[1:]
+    return sorted(
+        member
+        for member in archive_members(archive_path, suffix)
+        if _is_session(
+            member[: -len(suffix)] if suffix else member,
+            term,
+            f"{archive_path}/{member}",
+            archive_path,
+        )
+    )
+
+
+def _is_session(session: str, term: int, file_path: str, folder_path: Path) -> bool:
+    """Checks the name of a session file, warns about other files."""
+    if not document_number_pattern.fullmatch(session):
+        logger.warning(f"Invalid file: {file_path} should not exist in directory!")
+        return False
+    if int(session[:2]) != term:
+        raise ValueError(f"inconsistent {file_path} {folder_path}")
+    return True
+
+
+def _load_index(index_path: Path, file_pattern: str) -> dict:
+    if not index_path.exists():
+        return {}
+    try:
+        with open(index_path) as file:
+            index = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if index.get("file_pattern") != file_pattern:
+        return {}
+    return index.get("folders", {})
+
+
+def _save_index(index_path: Path, file_pattern: str, folders: dict):
+    # The index is only a cache, e.g. a read only source_dir is scanned every time.
+    tmp_path = index_path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "w") as file:
+            json.dump({"file_pattern": file_pattern, "folders": folders}, file)
+        os.replace(tmp_path, index_path)
+    except OSError as error:
+        logger.warning(f"Could not save the session index {index_path}: {error}")
@@ -0,0 +1,149 @@
+import os
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from open_discourse.helper.storage import SUFFIX, FrameWriter
+from open_discourse.helper.utils import get_term_from_path
+
+# Columns of a session store, toc and appendix are None for terms 1 and 2.
+STORE_SCHEMA = pa.schema(
+    [
+        ("session", pa.string()),
+        ("document_number", pa.string()),
+        ("date", pa.string()),
+        ("toc", pa.string()),
+        ("session_content", pa.string()),
+        ("appendix", pa.string()),
+    ]
+)
+# Sessions per batch when a store is read sequentially.
+BATCH_SIZE = 16
+
+
+class StoredSession(NamedTuple):
+    """Reference to a single session of a store, see read_session."""
+
+    store_path: Path
+    session: str
+
+    def read(self, columns: list[str] | None = None) -> dict[str, str | None]:
+        """Reads the columns of the session, default all."""
+        return read_session(self.store_path, self.session, columns)
+
+
+def store_file(folder_path: Path, term_folder: str) -> Path:
+    """Returns the path of the store of a term, e.g. .../electoral_term_pp05.parquet."""
+    return Path(folder_path) / f"{term_folder}{SUFFIX}"
+
+
+def store_files(folder_path: Path) -> dict[int, Path]:
+    """
+    Returns the session store of every electoral term in a folder.
+
+    Args:
+        folder_path (Path): folder of the stores, e.g. RAW_TXT
+
+    Returns:
+        dict[int, Path]: path of the store by term in ascending order
+    """
+    stores = {}
+    for file_path in sorted(Path(folder_path).glob(f"electoral_term_pp*{SUFFIX}")):
+        term_number = get_term_from_path(file_path.stem)
+        if term_number is not None:
+            stores[term_number] = file_path
+    return stores
+
+
+def write_store(file_path: Path, sessions: Iterable[dict]) -> int:
+    """
+    Writes the split protocols of an electoral term to one Parquet file.
+
+    Every session is a row group of its own, so the footer of the file is an
+    index of the sessions: read_session reads a single session without reading
+    the others, iter_sessions reads the file from start to end.
+
+    Args:
+        file_path (Path):           path of the store, see store_file
+        sessions (Iterable[dict]):  the columns of STORE_SCHEMA of every session
+
+    Returns:
+        int: number of sessions written
+    """
+    count = 0
+    with FrameWriter(file_path, STORE_SCHEMA, row_group_size=1) as writer:
+        for session in sessions:
+            writer.write(pd.DataFrame([session], columns=STORE_SCHEMA.names))
+            count += 1
+    return count
+
+
+def store_sessions(file_path: Path) -> list[str]:
+    """Returns the sessions of a store in the order they are stored, e.g. "05001"."""
+    return list(_open_store(file_path)[1])
+
+
+def read_session(
+    file_path: Path, session: str, columns: list[str] | None = None
+) -> dict[str, str | None]:
+    """
+    Reads a single session of a store.
+
+    The footer of a store is read once per process and version of the store, so
+    reading the sessions of a store one by one only reads their row groups.
+
+    Args:
+        file_path (Path):               path of the store
+        session (str):                  document number of the session, e.g. "05001"
+        columns (list[str], optional):  columns to read, default all
+
+    Returns:
+        dict[str, str | None]: value by column
+
+    Raises:
+        KeyError: if the session is not in the store
+    """
+    parquet_file, row_groups = _open_store(file_path)
+    table = parquet_file.read_row_group(row_groups[session], columns=columns)
+    return table.to_pylist()[0]
+
+
+def iter_sessions(
+    file_path: Path, columns: list[str] | None = None
+) -> Iterator[dict[str, str | None]]:
+    """
+    Reads the sessions of a store one after the other.
+
+    Args:
+        file_path (Path):               path of the store
+        columns (list[str], optional):  columns to read, default all
+
+    Yields:
+        dict[str, str | None]: value by column of every session
+    """
+    parquet_file = pq.ParquetFile(file_path)
+    for batch in parquet_file.iter_batches(batch_size=BATCH_SIZE, columns=columns):
+        yield from batch.to_pylist()
+
+
+def _open_store(file_path: Path) -> tuple[pq.ParquetFile, dict[str, int]]:
+    # Like open_archive, a forked worker doesn't share the file of its parent.
+    stat = os.stat(file_path)
+    return _read_store(str(file_path), stat.st_mtime_ns, stat.st_size, os.getpid())
+
+
+@lru_cache(maxsize=32)
+def _read_store(
+    file_path: str, mtime_ns: int, size: int, pid: int
+) -> tuple[pq.ParquetFile, dict[str, int]]:
+    parquet_file = pq.ParquetFile(file_path)
+    # One session per row group, see write_store.
+    sessions = parquet_file.read(columns=["session"]).column("session").to_pylist()
+    return parquet_file, {
+        session: row_group for row_group, session in enumerate(sessions)
+    }
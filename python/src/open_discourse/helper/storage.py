@@ -0,0 +1,186 @@
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# File suffix of all stored data frames.
+SUFFIX = ".parquet"
+COMPRESSION = "zstd"
+# Low cardinality columns, stored dictionary encoded.
+DICTIONARY_COLUMNS = [
+    "session",
+    "electoral_term",
+    "type",
+    "faction",
+    "faction_id",
+    "position_short",
+    "position_long",
+    "position_raw",
+    "first_name",
+    "last_name",
+    "acad_title",
+    "name_raw",
+    "constituency",
+    "politician_id",
+]
+# Rows per row group of the large final frames, see write_frame.
+ROW_GROUP_SIZE = 100_000
+
+
+def session_file(folder_path: Path, session: str) -> Path:
+    """Returns the path of a session's data frame, e.g. .../05001.parquet."""
+    return Path(folder_path) / f"{session}{SUFFIX}"
+
+
+def session_files(folder_path: Path) -> list[Path]:
+    """Returns the paths of all stored session data frames in a folder, sorted."""
+    return sorted(Path(folder_path).glob(f"*{SUFFIX}"))
+
+
+def to_table(df: pd.DataFrame) -> pa.Table:
+    """Converts a data frame to an arrow table, keeping a non default index."""
+    return pa.Table.from_pandas(df)
+
+
+def write_frame(df: pd.DataFrame, file_path: Path, row_group_size: int | None = None):
+    """
+    Writes a data frame as compressed Parquet file.
+
+    The file is written to a temporary path first and then moved, so readers never
+    see half written files.
+
+    Args:
+        df (pd.DataFrame):          data frame to write
+        file_path (Path):           target path, should end with SUFFIX
+        row_group_size (int, optional): maximum number of rows per row group
+    """
+    file_path = Path(file_path)
+    tmp_path = file_path.with_suffix(".tmp")
+    table = to_table(df)
+    pq.write_table(
+        table,
+        tmp_path,
+        row_group_size=row_group_size,
+        **write_options(table.schema),
+    )
+    os.replace(tmp_path, file_path)
+
+
+def write_options(schema: pa.Schema) -> dict:
+    """Returns the pq.write_table / pq.ParquetWriter options for a schema."""
+    return {
+        "compression": COMPRESSION,
+        "use_dictionary": [
+            column for column in DICTIONARY_COLUMNS if column in schema.names
+        ],
+    }
+
+
+class FrameWriter:
+    """Appends data frames to one Parquet file, e.g. one electoral term at a time.
+
+    Only the frame currently written has to be kept in memory. The file is moved to
+    its final path when the writer is closed without an error.
+
+    Args:
+        file_path (Path):       target path, should end with SUFFIX
+        schema (pa.Schema):     schema of the file, all frames are converted to it;
+                                the index of the frames is not stored
+        row_group_size (int):   maximum number of rows per row group
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        schema: pa.Schema,
+        row_group_size: int = ROW_GROUP_SIZE,
+    ):
+        self.file_path = Path(file_path)
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._tmp_path = self.file_path.with_suffix(".tmp")
+        self._writer = pq.ParquetWriter(self._tmp_path, schema, **write_options(schema))
+
+    def write(self, df: pd.DataFrame):
+        table = pa.Table.from_pandas(
+            df.loc[:, self.schema.names], schema=self.schema, preserve_index=False
+        )
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.rows += len(df)
+
+    def close(self):
+        self._writer.close()
+        os.replace(self._tmp_path, self.file_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._writer.close()
+            self._tmp_path.unlink(missing_ok=True)
+
+
+def read_frame(
+    file_path: Path,
+    columns: list[str] | None = None,
+    filters: list[tuple] | None = None,
+) -> pd.DataFrame:
+    """
+    Reads a Parquet file written by write_frame.
+
+    Only the given columns are read. filters are passed to pyarrow and skip row
+    groups by their statistics, e.g. [("electoral_term", "==", 19)]. List columns,
+    e.g. first_name, are returned as python lists like the former pickles.
+
+    Args:
+        file_path (Path):               Parquet file
+        columns (list[str], optional):  columns to read, default all
+        filters (list[tuple], optional): row filters in pyarrow's DNF notation
+
+    Returns:
+        pd.DataFrame: the stored data frame
+    """
+    table = pq.read_table(
+        file_path, columns=columns, filters=filters, use_pandas_metadata=True
+    )
+    return from_table(table)
+
+
+def iter_frames(
+    file_path: Path, columns: list[str] | None = None, batch_size: int = ROW_GROUP_SIZE
+) -> Iterator[pd.DataFrame]:
+    """
+    Reads a Parquet file in batches, so only one batch has to fit into memory.
+
+    Args:
+        file_path (Path):               Parquet file
+        columns (list[str], optional):  columns to read, default all
+        batch_size (int):               maximum number of rows per data frame
+
+    Yields:
+        pd.DataFrame: consecutive rows of the stored data frame
+    """
+    parquet_file = pq.ParquetFile(file_path)
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        yield from_table(pa.Table.from_batches([batch]))
+
+
+def from_table(table: pa.Table) -> pd.DataFrame:
+    """Converts an arrow table to a data frame with python lists in list columns."""
+    df = table.to_pandas()
+    for field in table.schema:
+        if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+            df[field.name] = table.column(field.name).to_pylist()
+    return df
+
+
+def count_rows(file_path: Path) -> int:
+    """Returns the number of rows of a Parquet file from its metadata."""
+    return pq.ParquetFile(file_path).metadata.num_rows
@@ -1,15 +1,48 @@
-import pyparsing as pp
+from functools import lru_cache
+from pathlib import PurePath
+from typing import NamedTuple
 
+import regex
 
-def get_term_from_path(path: str) -> int | None:
+term_folder_pattern = regex.compile(r"electoral_term_pp(\d{2})")
+# A session is named by its document number, e.g. 05001 for session 1 of term 5.
+document_number_pattern = regex.compile(r"\d{5}")
+
+
+class PathMetadata(NamedTuple):
+    term: int | None
+    session: int | None
+
+
+@lru_cache(maxsize=65536)
+def parse_path(path: str | PurePath) -> PathMetadata:
     """
-    Extracts the electoral term number from the folder path.
+    Extracts the electoral term and the session from the path of a stage file.
+
+    The term is taken from the first electoral_term_ppXX folder, the session from
+    the last part of the path named by a document number, e.g. 05001.parquet or
+    05001/session_content.txt.
+
+    Args:
+        path (str | PurePath):  path of a folder or file, e.g.
+                                ".../electoral_term_pp05.zip/05001.xml"
+
+    Returns:
+        PathMetadata: term and session number, None if not in the path
     """
-    electoral_term_parser = "electoral_term_pp" + pp.Word(pp.nums, exact=2)
-    term_number = electoral_term_parser.search_string(path, max_matches=1)
-    term_number = term_number[0][1] if term_number else None
+    path = PurePath(path)
+    term_number = term_folder_pattern.search(str(path))
+    session = None
+    for part in reversed(path.parts):
+        document_number = document_number_pattern.fullmatch(part.split(".", 1)[0])
+        if document_number:
+            session = int(document_number.group(0)[2:])
+            break
+    return PathMetadata(int(term_number.group(1)) if term_number else None, session)
 
-    if term_number is not None:
-        term_number = int(term_number)
 
-    return term_number
+def get_term_from_path(path: str | PurePath) -> int | None:
+    """
+    Extracts the electoral term number from the folder path.
+    """
+    return parse_path(path).term
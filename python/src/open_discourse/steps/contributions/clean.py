@@ -1,10 +1,31 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
-import regex
-from tqdm import tqdm
 
 from open_discourse.definitions import path, pattern
-from open_discourse.helper.clean_text import clean_name_headers
+from open_discourse.helper import (
+    clean_text,
+    name_parser,
+    position_classifier,
+    storage,
+)
+from open_discourse.helper.clean_text import (
+    get_name_headers_pattern,
+    remove_name_headers,
+)
+from open_discourse.helper.manifest import MANIFEST_NAME, SessionManifest, code_version
+from open_discourse.helper.name_parser import split_names
+from open_discourse.helper.parallel import run_parallel
+from open_discourse.helper.position_classifier import PositionClassifier
+from open_discourse.helper.session_index import session_index
+from open_discourse.helper.storage import (
+    SUFFIX,
+    read_frame,
+    session_file,
+    write_frame,
+)
 
 # Disabling pandas warnings.
 pd.options.mode.chained_assignment = None
@@ -18,151 +39,124 @@ CONTRIBUTIONS_EXTENDED_OUTPUT = path.CONTRIBUTIONS_EXTENDED_STAGE_02
 
 
 def main(task):
-    factions = pd.read_pickle(FACTIONS / "factions.pkl")
+    # Only sessions with changed input, code or factions are processed again.
+    manifest = SessionManifest(
+        CONTRIBUTIONS_EXTENDED_OUTPUT / MANIFEST_NAME,
+        code_version(
+            sys.modules[__name__],
+            clean_text,
+            name_parser,
+            position_classifier,
+            storage,
+            pattern,
+            FACTIONS / "factions.pkl",
+        ),
+    )
+    session_tasks = []
 
     # iterate over all electoral_term_folders
-    for folder_path in sorted(CONTRIBUTIONS_EXTENDED_INPUT.iterdir()):
-        if not folder_path.is_dir():
-            continue
-
-        term_number = regex.search(r"(?<=electoral_term_pp)\d{2}", folder_path.stem)
-        if term_number is None:
-            continue
-        term_number = int(term_number.group(0))
-
-        save_path = CONTRIBUTIONS_EXTENDED_OUTPUT / folder_path.stem
-        save_path.mkdir(parents=True, exist_ok=True)
-
-        # iterate over every contributions_extended file
-        for contrib_ext_file_path in tqdm(
-            folder_path.glob("*.pkl"),
-            desc=f"Clean contributions (term {term_number:>2})...",
-        ):
-            # read the spoken content csv
-            contributions_extended = pd.read_pickle(contrib_ext_file_path)
-
-            # Insert acad_title column and extract plain name and titles.
-            # ADD DOCUMENTATION HERE
-            contributions_extended.insert(3, "faction_id", -1)
-            contributions_extended.insert(5, "last_name", "")
-            contributions_extended.insert(6, "first_name", "")
-            contributions_extended.insert(7, "acad_title", "")
-
-            # Current workaround, because some speeches seem to not be matched
-            # correctly. If second stage works without mistakes, this should not be
-            # necessary anymoregex.
-            contributions_extended = contributions_extended.fillna("")
-
-            # Clean all the names still remaining from PDF Header.
-            # KEEP IN MIND THIS ALSO DELETES NAMES IN VOTING LISTS!!!
-            # And I think not all names are cleaned because of their position, e.g.
-            # "Max Mustermann, Bundeskanzler"
-            # THIS PART IS IMPORTANT AND SHOULD WORK PROPERLY, AS REOCCURING NAMES
-            # CAN INTRODUCE A LARGE BIAS IN TEXT ANALYSIS
-            names = contributions_extended["name_raw"].to_list()
-            contributions_extended["content"] = contributions_extended["content"].apply(
-                clean_name_headers,
-                args=(np.unique(names), True),
+    for contrib_ext_file_paths in session_index(
+        CONTRIBUTIONS_EXTENDED_INPUT, f"*{SUFFIX}"
+    ).values():
+        # every contributions_extended file
+        for contrib_ext_file_path in contrib_ext_file_paths:
+            save_path = (
+                CONTRIBUTIONS_EXTENDED_OUTPUT / contrib_ext_file_path.parent.name
             )
-
-            contributions_extended.reset_index(inplace=True, drop=True)
-
-            # Delete all not alphabetical chars, keep "-" as it occurs often in
-            # names.
-            # Question: Is any other character deleted, which could be in a name?
-            # Answer: I don't think so.
-            contributions_extended["name_raw"] = contributions_extended[
-                "name_raw"
-            ].astype(str)
-            contributions_extended["name_raw"] = contributions_extended[
-                "name_raw"
-            ].str.replace(r"[^a-zA-ZÖÄÜäöüß\-]", " ", regex=True)
-
-            # Replace more than two whitespaces with one.
-            contributions_extended["name_raw"] = contributions_extended[
-                "name_raw"
-            ].str.replace(r"  +", " ", regex=True)
-
-            # Graf has to be checked again, as this is also a last_name.
-            # Titles have to be added: Like e.c. or when mistakes occur like b.c.
-            # Deleted "Graf" for now.
-            titles = [
-                "Dr",
-                "Frau",
-                "D",
-                "-Ing",
-                "von",
-                "und",
-                "zu",
-                "van",
-                "de",
-                "Baron",
-                "Freiherr",
-                "Prinz",
-                "h",
-                "c",
-            ]
-
-            # Split the name_raw column into it's components at space character.
-            first_last_titles = contributions_extended["name_raw"].apply(str.split)
-
-            # Extract acad_title, if it is in the titles list.
-            contributions_extended["acad_title"] = [
-                [acad_title for acad_title in title_list if acad_title in titles]
-                for title_list in first_last_titles
-            ]
-
-            # Remove titles from the first_last_name list.
-            for politician_titles in first_last_titles:
-                for acad_title in politician_titles[:]:
-                    if acad_title in titles:
-                        politician_titles.remove(acad_title)
-
-            # Get the first and last name based on the amount of elements.
-            for index, first_last in enumerate(first_last_titles):
-                if len(first_last) == 1:
-                    contributions_extended.at[index, "first_name"] = []
-                    contributions_extended.at[index, "last_name"] = first_last[0]
-                # elif len(first_last) == 2:
-                elif len(first_last) >= 2:
-                    contributions_extended.at[index, "first_name"] = first_last[:-1]
-                    contributions_extended.at[index, "last_name"] = first_last[-1]
-                else:
-                    contributions_extended.at[index, "first_name"] = []
-                    contributions_extended.at[index, "last_name"] = ""
-
-            # look for parties in the faction column and replace them with a
-            # standardized faction name
-            for index, faction in zip(
-                contributions_extended.index, contributions_extended["faction"]
+            save_path.mkdir(parents=True, exist_ok=True)
+            if manifest.is_up_to_date(
+                contrib_ext_file_path,
+                [session_file(save_path, contrib_ext_file_path.stem)],
             ):
-                if faction:
-                    faction_abbrev = get_faction_abbrev(str(faction))
-
-                    if faction_abbrev:
-                        contributions_extended.at[index, "faction"] = faction_abbrev
-                        try:
-                            contributions_extended.at[index, "faction_id"] = int(
-                                factions.loc[
-                                    factions["abbreviation"] == faction_abbrev, "id"
-                                ].iloc[0]
-                            )
-                        except IndexError:
-                            contributions_extended.at[index, "faction_id"] = -1
-
-            contributions_extended.drop(columns=["name_raw"])
-            contributions_extended.to_pickle(save_path / contrib_ext_file_path.name)
+                continue
+            session_tasks.append((contrib_ext_file_path, save_path))
+
+    run_parallel(
+        clean_session,
+        session_tasks,
+        initializer=_init_worker,
+        initargs=(FACTIONS / "factions.pkl",),
+        desc="Clean contributions...",
+    )
+    manifest.save()
 
     return True
 
 
-def get_faction_abbrev(faction):
-    """matches the given faction and returns an id"""
-
-    for faction_abbrev, faction_pattern in pattern.FACTIONS.items():
-        if regex.search(faction_pattern, faction):
-            return faction_abbrev
-    return None
+# Loaded once per worker process, see _init_worker.
+_classifier = None
+
+
+def _init_worker(factions_path: Path):
+    global _classifier
+    _classifier = PositionClassifier(pd.read_pickle(factions_path))
+
+
+def clean_session(session_task: tuple[Path, Path]):
+    """Cleans the contributions of a single session and saves them to the save_path."""
+    contrib_ext_file_path, save_path = session_task
+
+    # read the spoken content csv
+    contributions_extended = read_frame(contrib_ext_file_path)
+
+    # Insert acad_title column and extract plain name and titles.
+    # ADD DOCUMENTATION HERE
+    contributions_extended.insert(3, "faction_id", -1)
+    contributions_extended.insert(5, "last_name", "")
+    contributions_extended.insert(6, "first_name", "")
+    contributions_extended.insert(7, "acad_title", "")
+
+    # Current workaround, because some speeches seem to not be matched
+    # correctly. If second stage works without mistakes, this should not be
+    # necessary anymoregex.
+    contributions_extended = contributions_extended.fillna("")
+
+    # Clean all the names still remaining from PDF Header.
+    # KEEP IN MIND THIS ALSO DELETES NAMES IN VOTING LISTS!!!
+    # And I think not all names are cleaned because of their position, e.g.
+    # "Max Mustermann, Bundeskanzler"
+    # THIS PART IS IMPORTANT AND SHOULD WORK PROPERLY, AS REOCCURING NAMES
+    # CAN INTRODUCE A LARGE BIAS IN TEXT ANALYSIS
+    names = contributions_extended["name_raw"].to_list()
+    name_headers_pattern = get_name_headers_pattern(np.unique(names), True)
+    contributions_extended["content"] = contributions_extended["content"].apply(
+        remove_name_headers, args=(name_headers_pattern,)
+    )
+
+    contributions_extended.reset_index(inplace=True, drop=True)
+
+    # Delete all not alphabetical chars, keep "-" as it occurs often in
+    # names.
+    # Question: Is any other character deleted, which could be in a name?
+    # Answer: I don't think so.
+    contributions_extended["name_raw"] = contributions_extended["name_raw"].astype(str)
+    contributions_extended["name_raw"] = contributions_extended["name_raw"].str.replace(
+        r"[^a-zA-ZÖÄÜäöüß\-]", " ", regex=True
+    )
+
+    # Replace more than two whitespaces with one.
+    contributions_extended["name_raw"] = contributions_extended["name_raw"].str.replace(
+        r"  +", " ", regex=True
+    )
+
+    # Split the name_raw column into acad_title, first and last name.
+    names = split_names(contributions_extended["name_raw"])
+    contributions_extended["acad_title"] = names["acad_title"]
+    contributions_extended["first_name"] = names["first_name"]
+    contributions_extended["last_name"] = names["last_name"]
+
+    # look for parties in the faction column and replace them with a
+    # standardized faction name
+    factions = _classifier.classify_many(contributions_extended["faction"])
+    contributions_extended["faction"] = factions["faction_abbrev"].where(
+        factions["faction_abbrev"].notna(), contributions_extended["faction"]
+    )
+    contributions_extended["faction_id"] = factions["faction_id"]
+
+    contributions_extended.drop(columns=["name_raw"])
+    write_frame(
+        contributions_extended, session_file(save_path, contrib_ext_file_path.stem)
+    )
 
 
 if __name__ == "__main__":
@@ -1,9 +1,22 @@
+import sys
+from itertools import accumulate
+from pathlib import Path
+
 import pandas as pd
-import regex
-from tqdm import tqdm
 
 from open_discourse.definitions import path
-from open_discourse.helper.extract_contributions import extract
+from open_discourse.helper import extract_contributions, storage
+from open_discourse.helper.extract_contributions import Contributions, extract_into
+from open_discourse.helper.manifest import MANIFEST_NAME, SessionManifest, code_version
+from open_discourse.helper.parallel import run_parallel
+from open_discourse.helper.session_index import session_index
+from open_discourse.helper.storage import (
+    SUFFIX,
+    count_rows,
+    read_frame,
+    session_file,
+    write_frame,
+)
 
 # input directory
 SPEECH_CONTENT_INPUT = path.SPEECH_CONTENT_STAGE_03
@@ -16,74 +29,153 @@ CONTRIBUTIONS_SIMPLIFIED.mkdir(parents=True, exist_ok=True)
 
 
 def main(task):
-    speech_id = 0
+    # Only new or changed sessions and sessions whose speech ids moved are
+    # processed again.
+    manifest = SessionManifest(
+        CONTRIBUTIONS_EXTENDED_OUTPUT / MANIFEST_NAME,
+        code_version(sys.modules[__name__], extract_contributions, storage),
+    )
+    simplified_path = CONTRIBUTIONS_SIMPLIFIED / ("contributions_simplified" + SUFFIX)
 
-    simplified_list = []
+    speech_content_files = []
+    output_folders = []
+    unchanged = []
 
     # Go through all electoral_term folders
-    for folder_path in sorted(SPEECH_CONTENT_INPUT.iterdir()):
-        if not folder_path.is_dir():
-            continue
-
-        term_number = regex.search(r"(?<=electoral_term_pp)\d{2}", folder_path.stem)
-        if term_number is None:
-            continue
-        term_number = int(term_number.group(0))
-
-        speech_output = SPEECH_CONTENT_OUTPUT / folder_path.stem
-        extended_output = CONTRIBUTIONS_EXTENDED_OUTPUT / folder_path.stem
-
-        speech_output.mkdir(parents=True, exist_ok=True)
-        extended_output.mkdir(parents=True, exist_ok=True)
-
-        # iterate over every speech_content file
-        for speech_content_file_path in tqdm(
-            folder_path.glob("*.pkl"),
-            desc=f"Extract contributions (term {term_number:>2})...",
-        ):
-            # read the spoken content csv
-            speech_content = pd.read_pickle(speech_content_file_path)
-            speech_content.insert(0, "speech_id", 0)
-
-            extended_list = []
-            # iterate over every speech
-            for counter, speech in zip(
-                speech_content.index, speech_content["speech_content"]
-            ):
-                # call the extract method which returns the cleaned speech and a
-                # dataframe with all contributions in that particular speech
-
-                (
-                    contribution_extended,
-                    speech_text,
-                    contribution_simple,
-                    _,
-                ) = extract(
-                    speech,
-                    int(speech_content_file_path.stem),
-                    speech_id,
+    for speech_content_file_paths in session_index(
+        SPEECH_CONTENT_INPUT, f"*{SUFFIX}"
+    ).values():
+        # every speech_content file
+        for speech_content_file_path in speech_content_file_paths:
+            folder_name = speech_content_file_path.parent.name
+            speech_output = SPEECH_CONTENT_OUTPUT / folder_name
+            extended_output = CONTRIBUTIONS_EXTENDED_OUTPUT / folder_name
+
+            speech_output.mkdir(parents=True, exist_ok=True)
+            extended_output.mkdir(parents=True, exist_ok=True)
+
+            speech_content_files.append(speech_content_file_path)
+            output_folders.append((speech_output, extended_output))
+            unchanged.append(
+                manifest.is_up_to_date(
+                    speech_content_file_path,
+                    [
+                        session_file(speech_output, speech_content_file_path.stem),
+                        session_file(extended_output, speech_content_file_path.stem),
+                        simplified_path,
+                    ],
                 )
-                simplified_list.append(contribution_simple)
-                extended_list.append(contribution_extended)
-                speech_content.at[counter, "speech_content"] = speech_text
-                speech_content.at[counter, "speech_id"] = speech_id
-                speech_id += 1
-
-            contributions_extended = pd.concat(extended_list, sort=False)
-            # save the contributions_extended to pickle
-            contributions_extended.to_pickle(
-                extended_output / speech_content_file_path.name
             )
-            # save the spoken_conten to pickle
-            speech_content.to_pickle(speech_output / speech_content_file_path.name)
 
-    contributions_simplified = pd.concat(simplified_list, sort=False)
-    contributions_simplified.to_pickle(
-        CONTRIBUTIONS_SIMPLIFIED / "contributions_simplified.pkl"
+    # The speech ids are a running counter over all sessions. Counting the speeches
+    # first gives every session a fixed offset, independent of the worker order.
+    # Counts of unchanged sessions are taken from the manifest, the others from the
+    # metadata of the session files, without reading the sessions.
+    for file, is_unchanged in zip(speech_content_files, unchanged):
+        if not is_unchanged or "speech_count" not in manifest.info(file):
+            manifest.set_info(file, speech_count=count_rows(file))
+
+    speech_counts = [
+        manifest.info(file)["speech_count"] for file in speech_content_files
+    ]
+    speech_id_offsets = [0, *accumulate(speech_counts)][:-1]
+
+    session_tasks = []
+    for file, output_folder, offset, is_unchanged in zip(
+        speech_content_files, output_folders, speech_id_offsets, unchanged
+    ):
+        if not is_unchanged or manifest.info(file).get("speech_id_offset") != offset:
+            session_tasks.append((file, output_folder, offset))
+        manifest.set_info(file, speech_id_offset=offset)
+
+    processed = {}
+    for (file, _, _), (simplified, speech_count) in zip(
+        session_tasks,
+        run_parallel(extract_session, session_tasks, desc="Extract contributions..."),
+    ):
+        processed[file] = simplified
+        manifest.set_info(file, speech_count=speech_count)
+
+    # Contributions of skipped sessions are taken from the previous run.
+    previous_simplified = (
+        read_frame(simplified_path)
+        if len(processed) < len(speech_content_files)
+        else None
     )
+    simplified_list = []
+    for file, offset, speech_count in zip(
+        speech_content_files, speech_id_offsets, speech_counts
+    ):
+        if file in processed:
+            simplified_list.append(processed[file])
+        else:
+            simplified_list.append(
+                previous_simplified.loc[
+                    previous_simplified["speech_id"].between(
+                        offset, offset + speech_count - 1
+                    )
+                ]
+            )
+
+    contributions_simplified = pd.concat(simplified_list, sort=False)
+    write_frame(contributions_simplified, simplified_path)
+    manifest.save()
 
     return True
 
 
+def extract_session(
+    session_task: tuple[Path, tuple[Path, Path], int],
+) -> tuple[pd.DataFrame, int]:
+    """
+    Extracts the contributions of a single session.
+
+    The cleaned speeches and the contributions_extended are saved to the output
+    folders, the contributions_simplified are returned.
+
+    Args:
+        session_task (tuple):   speech_content file, (speech output folder,
+                                contributions_extended output folder) and the
+                                speech_id of the first speech in the session
+
+    Returns:
+        tuple[pd.DataFrame, int]: contributions_simplified and number of speeches of
+                                  the session
+    """
+    speech_content_file_path, (speech_output, extended_output), speech_id = session_task
+
+    # read the spoken content csv
+    speech_content = read_frame(speech_content_file_path)
+    speech_content.insert(0, "speech_id", 0)
+
+    # The contributions of all speeches are collected in one set of columns
+    contributions = Contributions()
+    # iterate over every speech
+    for counter, speech in zip(speech_content.index, speech_content["speech_content"]):
+        # call the extract method which adds all contributions in that
+        # particular speech and returns the cleaned speech
+        speech_text, _ = extract_into(
+            contributions,
+            speech,
+            int(speech_content_file_path.stem),
+            speech_id,
+        )
+        speech_content.at[counter, "speech_content"] = speech_text
+        speech_content.at[counter, "speech_id"] = speech_id
+        speech_id += 1
+
+    # save the contributions_extended
+    write_frame(
+        contributions.extended_frame(),
+        session_file(extended_output, speech_content_file_path.stem),
+    )
+    # save the spoken_conten
+    write_frame(
+        speech_content, session_file(speech_output, speech_content_file_path.stem)
+    )
+
+    return contributions.simplified_frame(), len(speech_content)
+
+
 if __name__ == "__main__":
     main(None)
@@ -1,11 +1,23 @@
+import sys
+from pathlib import Path
+
 import pandas as pd
-import regex
-from tqdm import tqdm
 
 from open_discourse.definitions import path
+from open_discourse.helper import fuzzy_names, match_names, storage
+from open_discourse.helper.fuzzy_names import FuzzyNameIndex
+from open_discourse.helper.manifest import MANIFEST_NAME, SessionManifest, code_version
 from open_discourse.helper.match_names import (
     insert_politician_id_into_contributions_extended,
 )
+from open_discourse.helper.parallel import run_parallel
+from open_discourse.helper.session_index import session_index
+from open_discourse.helper.storage import (
+    SUFFIX,
+    read_frame,
+    session_file,
+    write_frame,
+)
 
 # input directory
 CONTRIBUTIONS_EXTENDED_INPUT = path.CONTRIBUTIONS_EXTENDED_STAGE_02
@@ -16,8 +28,52 @@ CONTRIBUTIONS_EXTENDED_OUTPUT = path.CONTRIBUTIONS_EXTENDED_STAGE_03
 
 
 def main(task):
+    # Only sessions with changed input, code or politicians are processed again.
+    manifest = SessionManifest(
+        CONTRIBUTIONS_EXTENDED_OUTPUT / MANIFEST_NAME,
+        code_version(
+            sys.modules[__name__],
+            match_names,
+            fuzzy_names,
+            storage,
+            DATA_FINAL / "politicians.csv",
+        ),
+    )
+    session_tasks = []
+
+    # iterate over all electoral_term_folders __________________________________________________
+    for term_number, contrib_ext_file_paths in session_index(
+        CONTRIBUTIONS_EXTENDED_INPUT, f"*{SUFFIX}"
+    ).items():
+        # every contributions_extended file
+        for contrib_ext_file_path in contrib_ext_file_paths:
+            save_path = (
+                CONTRIBUTIONS_EXTENDED_OUTPUT / contrib_ext_file_path.parent.name
+            )
+            save_path.mkdir(parents=True, exist_ok=True)
+            if manifest.is_up_to_date(
+                contrib_ext_file_path,
+                [session_file(save_path, contrib_ext_file_path.stem)],
+            ):
+                continue
+            session_tasks.append((contrib_ext_file_path, save_path, term_number))
+
+    run_parallel(
+        match_session,
+        session_tasks,
+        initializer=_init_worker,
+        initargs=(DATA_FINAL / "politicians.csv",),
+        desc="Match contributions...",
+    )
+    manifest.save()
+
+    return True
+
+
+def load_politicians(politicians_path: Path) -> pd.DataFrame:
+    """Reads politicians.csv and normalizes the names for matching."""
     # MDBS
-    politicians = pd.read_csv(DATA_FINAL / "politicians.csv")
+    politicians = pd.read_csv(politicians_path)
     politicians = politicians.loc[
         :,
         [
@@ -50,47 +106,54 @@ def main(task):
 
     politicians["first_name"] = politicians["first_name"].apply(str.split)
 
-    # iterate over all electoral_term_folders __________________________________________________
-    for folder_path in sorted(CONTRIBUTIONS_EXTENDED_INPUT.iterdir()):
-        if not folder_path.is_dir():
-            continue
-
-        term_number = regex.search(r"(?<=electoral_term_pp)\d{2}", folder_path.stem)
-        if term_number is None:
-            continue
-        term_number = int(term_number.group(0))
-
-        save_path = CONTRIBUTIONS_EXTENDED_OUTPUT / folder_path.stem
-        save_path.mkdir(parents=True, exist_ok=True)
-
-        # Only select politicians of the election period.
-        politicians_electoral_term = politicians.loc[
-            politicians["electoral_term"] == term_number
-        ]
-        gov_members_electoral_term = politicians_electoral_term.loc[
-            politicians_electoral_term["institution_type"] == "Regierungsmitglied"
-        ]
-
-        # iterate over every contributions_extended file
-        for contrib_ext_file_path in tqdm(
-            folder_path.glob("*.pkl"),
-            desc=f"Match contributions (term {term_number:>2})...",
-        ):
-            # read the contributions_extended pickle file
-            contributions_extended = pd.read_pickle(contrib_ext_file_path)
-
-            (
-                contributions_extended_matched,
-                problems,
-            ) = insert_politician_id_into_contributions_extended(
-                contributions_extended,
-                politicians_electoral_term,
-                gov_members_electoral_term,
-            )
-
-            contributions_extended.to_pickle(save_path / contrib_ext_file_path.name)
+    return politicians
+
+
+# Loaded once per worker process, see _init_worker.
+_politicians = None
+# FuzzyNameIndex per electoral term, built on first use in a worker.
+_fuzzy_indexes = {}
+
+
+def _init_worker(politicians_path: Path):
+    global _politicians
+    _politicians = load_politicians(politicians_path)
+    _fuzzy_indexes.clear()
+
+
+def match_session(session_task: tuple[Path, Path, int]):
+    """Matches the contributions of a single session and saves them to the save_path."""
+    contrib_ext_file_path, save_path, term_number = session_task
+
+    # Only select politicians of the election period.
+    politicians_electoral_term = _politicians.loc[
+        _politicians["electoral_term"] == term_number
+    ]
+    gov_members_electoral_term = politicians_electoral_term.loc[
+        politicians_electoral_term["institution_type"] == "Regierungsmitglied"
+    ]
+    # Fuzzy name lookups are shared by all sessions of the electoral term.
+    if term_number not in _fuzzy_indexes:
+        _fuzzy_indexes[term_number] = FuzzyNameIndex(
+            politicians_electoral_term["last_name"]
+        )
+
+    # read the contributions_extended pickle file
+    contributions_extended = read_frame(contrib_ext_file_path)
+
+    (
+        contributions_extended_matched,
+        problems,
+    ) = insert_politician_id_into_contributions_extended(
+        contributions_extended,
+        politicians_electoral_term,
+        gov_members_electoral_term,
+        fuzzy_index=_fuzzy_indexes[term_number],
+    )
 
-    return True
+    write_frame(
+        contributions_extended, session_file(save_path, contrib_ext_file_path.stem)
+    )
 
 
 if __name__ == "__main__":
@@ -1,16 +1,25 @@
-import time
+import os
+from functools import partial
+from pathlib import Path
 
-import regex
 import requests
-from bs4 import BeautifulSoup
-from tqdm import tqdm
 
 from open_discourse.definitions import path
+from open_discourse.helper.download import (
+    DOWNLOADS_NAME,
+    FAILED,
+    Download,
+    download_files,
+)
+from open_discourse.helper.protocol_catalog import CATALOG_NAME, ProtocolCatalog
 
 # output directory
 OUTPUT_PATH = path.DATA_CACHE / "electoral_term_pp20" / "stage_01"
 OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
 
+# Page through the whole listing instead of stopping at the known protocols.
+FULL_DISCOVERY_ENV_VAR = "OPEN_DISCOURSE_FULL_DISCOVERY"
+
 
 def main(task):
     election_periods = [
@@ -20,6 +29,8 @@ def main(task):
         },
     ]
 
+    full = bool(os.environ.get(FULL_DISCOVERY_ENV_VAR))
+
     for election_period in election_periods:
         print(
             f"Scraping links for term {election_period['election_period']}...",
@@ -27,44 +38,53 @@ def main(task):
             flush=True,
         )
 
-        offset = 0
-        xml_links = []
-
-        while True:
-            URL = election_period["url"].format(str(offset))
-            page = requests.get(URL, headers={"User-Agent": "Mozilla/5.0"})
-            soup = BeautifulSoup(page.text, "html.parser")
-            # scrape for links
-            current_links = list(soup.find_all("a", attrs={"href": regex.compile("xml$")}))
-            if len(current_links) != 0:
-                xml_links += current_links
-                offset += len(current_links)
-            else:
-                break
+        catalog = ProtocolCatalog(OUTPUT_PATH / CATALOG_NAME)
+        protocols = catalog.discover(
+            partial(fetch_listing_page, election_period["url"]), full=full
+        )
+        # Known protocols whose file got lost are downloaded again as well.
+        for session, url in catalog.sessions.items():
+            if (
+                session not in protocols
+                and not (OUTPUT_PATH / (session + ".xml")).exists()
+            ):
+                protocols[session] = url
 
-        print("Done.")
+        print(f"Done. {len(protocols)} new or changed protocols.")
 
-        for link in tqdm(
-            xml_links,
+        downloads = [
+            Download(url, OUTPUT_PATH / (session + ".xml"))
+            for session, url in sorted(protocols.items())
+        ]
+        results = download_files(
+            downloads,
+            OUTPUT_PATH / DOWNLOADS_NAME,
             desc=f"Download XML-files for term {election_period['election_period']}...",
-        ):
-            url = link.get("href")
-            page = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
-            session = regex.search(r"\d{5}(?=\.xml)", url).group(0)
-
-            with open(OUTPUT_PATH / (session + ".xml"), "w") as file:
-                file.write(
-                    regex.sub(
-                        "</sub>",
-                        "",
-                        regex.sub("<sub>", "", page.content.decode("utf-8")),
-                    )
-                )
-            time.sleep(1)
+        )
+        for session, result in zip(sorted(protocols), results):
+            if result.status == FAILED:
+                print(f"Download of {result.url} failed: {result.error}")
+            else:
+                remove_sub_tags(result.path)
+                catalog.update({session: result.url})
+        catalog.save()
 
     return True
 
 
+def fetch_listing_page(url: str, offset: int) -> str:
+    """Returns the html of the listing page starting at offset."""
+    page = requests.get(url.format(str(offset)), headers={"User-Agent": "Mozilla/5.0"})
+    page.raise_for_status()
+    return page.text
+
+
+def remove_sub_tags(file_path: Path):
+    """Removes the <sub> tags of a downloaded XML file, keeping their text."""
+    content = file_path.read_bytes()
+    if b"<sub>" in content or b"</sub>" in content:
+        file_path.write_bytes(content.replace(b"<sub>", b"").replace(b"</sub>", b""))
+
+
 if __name__ == "__main__":
     main(None)
-
@@ -1,13 +1,12 @@
-import io
-import time
-import zipfile
-
 import regex
-import requests
-from requests.adapters import HTTPAdapter, Retry
-from tqdm import tqdm
 
 from open_discourse.definitions import path
+from open_discourse.helper.download import (
+    DOWNLOADS_NAME,
+    FAILED,
+    Download,
+    download_files,
+)
 
 # input
 zip_links = [
@@ -32,47 +31,33 @@ zip_links = [
     "https://www.bundestag.de/resource/blob/870686/91b713c492499db98eec5b2f8f142d20/pp19.zip",
 ]
 
-# output directory
-RAW_XML = path.RAW_XML
+# output directory, the archives are read without extracting them
+RAW_ZIP = path.RAW_ZIP
 
 
 def main(task):
-    # Setup retries
-    session = requests.Session()
-    retries = Retry(total=5, backoff_factor=2, status_forcelist=[500, 502, 503, 504])
-    session.mount("https://", HTTPAdapter(max_retries=retries))
-
-    for link in tqdm(zip_links, desc="Download & unzip election period data..."):
-        electoral_term_str = "electoral_term_" + regex.search(r"pp(\d+).zip$", link).group(0)
-        print(f"Downloading & unzipping '{electoral_term_str}'...", end="", flush=True)
-
-        file_buffer = download_file(link, session)
-        if file_buffer is None:
-            print(f"Skipping {electoral_term_str} due to repeated failures.")
-            continue
-
-        with zipfile.ZipFile(file_buffer) as z:
-            save_path = RAW_XML / electoral_term_str
-            save_path.mkdir(parents=True, exist_ok=True)
-            z.extractall(save_path)
-
-        time.sleep(1)
+    downloads = [
+        Download(
+            link,
+            RAW_ZIP
+            / ("electoral_term_" + regex.search(r"pp(\d+).zip$", link).group(0)),
+        )
+        for link in zip_links
+    ]
+    results = download_files(
+        downloads,
+        RAW_ZIP / DOWNLOADS_NAME,
+        desc="Download election period data...",
+    )
+
+    for result in results:
+        if result.status == FAILED:
+            print(
+                f"Skipping {result.path.name} due to repeated failures: {result.error}"
+            )
 
     return True
 
 
-def download_file(link, session):
-    try:
-        with session.get(link, stream=True, timeout=30) as r:
-            r.raise_for_status()  # Ensure request was successful
-            file_buffer = io.BytesIO()
-            for chunk in r.iter_content(chunk_size=1024**2):  # 1MB chunks
-                file_buffer.write(chunk)
-            file_buffer.seek(0)
-            return file_buffer
-    except requests.exceptions.RequestException as e:
-        print(f"Download failed: {e}")
-        return None
-
 if __name__ == "__main__":
     main(None)
@@ -1,13 +1,27 @@
+import sys
 import xml.etree.ElementTree as et
+import zipfile
+from pathlib import Path
 
 import pandas as pd
 import pendulum
-import regex
+import pyarrow as pa
+from tqdm import tqdm
 
 from open_discourse.definitions import path
+from open_discourse.helper import archive, storage, utils
+from open_discourse.helper.archive import xml_source_dir
+from open_discourse.helper.manifest import SessionManifest, code_version
+from open_discourse.helper.session_index import session_index
+from open_discourse.helper.storage import (
+    SUFFIX,
+    FrameWriter,
+    read_frame,
+    session_files,
+)
+from open_discourse.helper.utils import get_term_from_path
 
 # input directory
-RAW_XML = path.RAW_XML
 SPEECH_CONTENT_INPUT = path.SPEECH_CONTENT_STAGE_04
 SPEECH_CONTENT_INPUT_TERM_20 = path.DATA_CACHE / "electoral_term_pp20" / "stage_03"
 CONTRIBUTIONS_EXTENDED_INPUT = path.CONTRIBUTIONS_EXTENDED_STAGE_03
@@ -19,173 +33,278 @@ CONTRIBUTIONS_EXTENDED_OUTPUT = path.FINAL
 SPEECH_CONTENT_OUTPUT.mkdir(parents=True, exist_ok=True)
 CONTRIBUTIONS_EXTENDED_OUTPUT.mkdir(parents=True, exist_ok=True)
 
+DOCUMENT_URL = "https://dip21.bundestag.de/dip21/btp/"
+
+# Only these columns are read from the session files.
+SPEECH_CONTENT_COLUMNS = [
+    "speech_id",
+    "session",
+    "first_name",
+    "last_name",
+    "faction_id",
+    "position_short",
+    "position_long",
+    "politician_id",
+    "speech_content",
+]
+CONTRIBUTIONS_COLUMNS = [
+    "type",
+    "first_name",
+    "last_name",
+    "faction_id",
+    "id",
+    "text_position",
+    "politician_id",
+    "content",
+]
+
+# Schemas of the final data frames.
+SPEECH_CONTENT_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("electoral_term", pa.int32()),
+        ("session", pa.int32()),
+        ("first_name", pa.string()),
+        ("document_url", pa.string()),
+        ("last_name", pa.string()),
+        ("faction_id", pa.int64()),
+        ("position_short", pa.string()),
+        ("position_long", pa.string()),
+        ("politician_id", pa.int64()),
+        ("speech_content", pa.string()),
+        ("date", pa.float64()),
+    ]
+)
+CONTRIBUTIONS_EXTENDED_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("type", pa.string()),
+        ("first_name", pa.string()),
+        ("last_name", pa.string()),
+        ("faction_id", pa.int32()),
+        ("speech_id", pa.int32()),
+        ("text_position", pa.int32()),
+        ("politician_id", pa.int32()),
+        ("content", pa.string()),
+    ]
+)
 
-def main(task):
-    # spoken content
-
-    # Placeholder for concating speeches DF of all sessions.
-    speech_content_01_19 = []
-
-    # Walk over all legislature periods.
-    for folder_path in sorted(SPEECH_CONTENT_INPUT.iterdir()):
-        if not folder_path.is_dir():
-            continue
 
-        for speech_content_file_path in sorted(folder_path.glob("*.pkl")):
-            speech_content_01_19.append(pd.read_pickle(speech_content_file_path))
-
-    speech_content_01_19 = (
-        pd.concat(speech_content_01_19, sort=False)
-        .loc[
-            :,
-            [
-                "speech_id",
-                "session",
-                "first_name",
-                "last_name",
-                "faction_id",
-                "position_short",
-                "position_long",
-                "politician_id",
-                "speech_content",
-            ],
-        ]
-        .rename(columns={"speech_id": "id"})
-        .assign(
-            first_name=lambda df: df["first_name"].str.join(" "),
-            id=lambda df: range(len(df)),
-            session=lambda df: df["session"].str.replace(r"\.pkl", "", regex=True),
+def main(task):
+    # The final data frames are written one electoral term at a time, so only the
+    # largest term has to fit into memory. Global ids are running offsets, so a
+    # final data frame is written again as a whole if any of its sessions changed.
+    version = code_version(sys.modules[__name__], archive, storage, utils)
+    concat_speech_content(
+        SessionManifest(SPEECH_CONTENT_OUTPUT / "speech_content_manifest.json", version)
+    )
+    concat_contributions_extended(
+        SessionManifest(
+            CONTRIBUTIONS_EXTENDED_OUTPUT / "contributions_extended_manifest.json",
+            version,
         )
     )
 
-    meta_data = {}
+    return True
+
 
-    # Open every xml plenar file in every legislature period.
-    for folder_path in sorted(RAW_XML.iterdir()):
+def concat_speech_content(manifest: SessionManifest):
+    """Writes the speeches of all electoral terms to one data frame."""
+    output_path = SPEECH_CONTENT_OUTPUT / ("speech_content" + SUFFIX)
+    term_folders = get_term_folders(SPEECH_CONTENT_INPUT)
+    term_20_path = (
+        SPEECH_CONTENT_INPUT_TERM_20 / "speech_content" / ("speech_content" + SUFFIX)
+    )
+    # The session dates are read from the protocols the sessions were extracted
+    # from, so they only change with the sessions.
+    input_paths = [
+        file_path
+        for folder_path in term_folders.values()
+        for file_path in session_files(folder_path)
+    ]
+    if is_up_to_date(manifest, [*input_paths, term_20_path], output_path):
+        return
+
+    with FrameWriter(output_path, SPEECH_CONTENT_SCHEMA) as writer:
+        # The protocols of every term, from the downloaded archives or extracted.
+        raw_xml_files = session_index(xml_source_dir(), "*.xml")
+
+        # Walk over all legislature periods.
+        for term_number, folder_path in tqdm(
+            term_folders.items(), desc="Concat speeches..."
+        ):
+            speech_content = concat_sessions(folder_path, SPEECH_CONTENT_COLUMNS)
+            if speech_content is None:
+                continue
+
+            meta_data = {}
+            if term_number in raw_xml_files:
+                meta_data = get_session_dates(raw_xml_files[term_number])
+
+            writer.write(
+                prepare_speech_content(speech_content, meta_data, id_offset=writer.rows)
+            )
+
+        speech_content_20 = read_frame(
+            term_20_path, columns=[*SPEECH_CONTENT_COLUMNS[1:], "id", "date"]
+        )
+        writer.write(prepare_speech_content_20(speech_content_20))
+    manifest.save()
+
+
+def concat_contributions_extended(manifest: SessionManifest):
+    """Writes the contributions of all electoral terms to one data frame."""
+    output_path = CONTRIBUTIONS_EXTENDED_OUTPUT / ("contributions_extended" + SUFFIX)
+    term_folders = get_term_folders(CONTRIBUTIONS_EXTENDED_INPUT)
+    input_paths = [
+        file_path
+        for folder_path in term_folders.values()
+        for file_path in session_files(folder_path)
+    ]
+    if is_up_to_date(manifest, input_paths, output_path):
+        return
+
+    with FrameWriter(output_path, CONTRIBUTIONS_EXTENDED_SCHEMA) as writer:
+        # Walk over all legislature periods. _______________________________________
+        for folder_path in tqdm(term_folders.values(), desc="Concat contributions..."):
+            contributions_extended = concat_sessions(folder_path, CONTRIBUTIONS_COLUMNS)
+            if contributions_extended is None:
+                continue
+
+            writer.write(
+                prepare_contributions_extended(
+                    contributions_extended, id_offset=writer.rows
+                )
+            )
+    manifest.save()
+
+
+def is_up_to_date(
+    manifest: SessionManifest, input_paths: list[Path], output_path: Path
+) -> bool:
+    """
+    Checks if an output concatenated from many inputs has to be written again.
+
+    Args:
+        manifest (SessionManifest): manifest of the output
+        input_paths (list[Path]):   all inputs of the output
+        output_path (Path):         the output
+
+    Returns:
+        bool: True, if no input was changed, added or removed and the output exists
+    """
+    # Every input is checked, so the manifest knows all of them on save.
+    unchanged = [manifest.is_up_to_date(path, [output_path]) for path in input_paths]
+    return all(unchanged) and not manifest.removed_inputs()
+
+
+def get_term_folders(input_dir: Path) -> dict[int, Path]:
+    """Returns the electoral_term_ppXX folders of input_dir by term number."""
+    term_folders = {}
+    for folder_path in sorted(input_dir.iterdir()):
         # Skip e.g. the .DS_Store file.
         if not folder_path.is_dir():
             continue
 
-        term_number = regex.search(r"(?<=electoral_term_pp)\d{2}", folder_path.stem)
+        term_number = get_term_from_path(folder_path.name)
         if term_number is None:
             continue
-        term_number = int(term_number.group(0))
-
-        for xml_plenar_file_path in sorted(folder_path.glob("*.xml")):
-            tree = et.parse(xml_plenar_file_path)
-            # Get the document number, the date of the session and the content.
-            # meta_data["document_number"].append(tree.find("NR").text)
-            # meta_data["date"].append(tree.find("DATUM").text)
-            # document_number = tree.find("NR").text
-
-            # date_str a date string like "27.10.2009"
-            date_str = tree.find("DATUM").text
-
-            dt = pendulum.from_format(date_str, "DD.MM.YYYY")
-
-            document_number = xml_plenar_file_path.stem
-            document_number = int(document_number)
-            meta_data[document_number] = dt.int_timestamp
-
-    speech_content_01_19.insert(1, "electoral_term", -1)
-    speech_content_01_19.insert(4, "document_url", "")
-    speech_content_01_19 = speech_content_01_19.assign(
-        electoral_term=lambda df: df["session"].str.slice(start=0, stop=2),
-        date=lambda df: df["session"].apply(lambda x: meta_data.get(int(x))),
-        session=lambda df: df["session"].str.slice(start=-3),
-    )
+        term_folders[term_number] = folder_path
+    return term_folders
 
-    speech_content_01_19["document_url"] = speech_content_01_19.apply(
-        lambda row: "https://dip21.bundestag.de/dip21/btp/{0}/{0}{1}.pdf".format(
-            row["electoral_term"], row["session"]
-        ),
-        axis=1,
-    )
 
-    speech_content_20 = pd.read_pickle(
-        SPEECH_CONTENT_INPUT_TERM_20 / "speech_content" / "speech_content.pkl"
-    )
+def concat_sessions(folder_path: Path, columns: list[str]) -> pd.DataFrame | None:
+    """Reads the given columns of all sessions of one electoral term.
 
-    speech_content_20 = speech_content_20.loc[
-        :,
-        [
-            "id",
-            "session",
-            "first_name",
-            "last_name",
-            "faction_id",
-            "position_short",
-            "position_long",
-            "politician_id",
-            "speech_content",
-            "date",
-        ],
+    The session column is the name of the session file, e.g. "05001".
+    """
+    file_columns = [column for column in columns if column != "session"]
+    sessions = [
+        read_frame(file_path, columns=file_columns).assign(session=file_path.stem)
+        for file_path in session_files(folder_path)
     ]
+    if not sessions:
+        return None
+    return pd.concat(sessions, sort=False).loc[:, columns]
 
-    speech_content_20.insert(1, "electoral_term", -1)
 
+def get_session_dates(
+    xml_plenar_file_paths: list[Path | zipfile.Path],
+) -> dict[int, int]:
+    """Returns the timestamp of every session by document number, e.g. 5001."""
+    meta_data = {}
+    # Open every xml plenar file of the legislature period.
+    for xml_plenar_file_path in xml_plenar_file_paths:
+        with xml_plenar_file_path.open("rb") as xml_plenar_file:
+            tree = et.parse(xml_plenar_file)
+        # Get the document number, the date of the session and the content.
+        # date_str a date string like "27.10.2009"
+        date_str = tree.find("DATUM").text
+
+        dt = pendulum.from_format(date_str, "DD.MM.YYYY")
+
+        document_number = int(xml_plenar_file_path.stem)
+        meta_data[document_number] = dt.int_timestamp
+    return meta_data
+
+
+def prepare_speech_content(
+    speech_content: pd.DataFrame, meta_data: dict[int, int], id_offset: int
+) -> pd.DataFrame:
+    """Derives the final columns of the speeches of one of the terms 1 to 19."""
+    session = speech_content["session"]
+    electoral_term = session.str.slice(start=0, stop=2)
+    session_number = session.str.slice(start=-3)
+
+    return speech_content.assign(
+        id=range(id_offset, id_offset + len(speech_content)),
+        electoral_term=electoral_term.astype("int32"),
+        session=session_number.astype("int32"),
+        first_name=speech_content["first_name"].str.join(" "),
+        document_url=DOCUMENT_URL
+        + electoral_term
+        + "/"
+        + electoral_term
+        + session_number
+        + ".pdf",
+        date=session.astype(int).map(meta_data).astype("float64"),
+    ).drop(columns=["speech_id"])
+
+
+def prepare_speech_content_20(speech_content_20: pd.DataFrame) -> pd.DataFrame:
+    """Derives the final columns of the speeches of term 20, keeping their ids."""
     speech_content_20 = speech_content_20.assign(
-        electoral_term=lambda df: df["session"].str.slice(stop=2),
-        session=lambda df: df["session"].str.slice(start=-3),
-    ).astype({"session": "int32", "electoral_term": "int32"})
-
-    speech_content_20["document_url"] = speech_content_20.apply(
-        lambda row: "https://dip21.bundestag.de/dip21/btp/{0}/{0}{1}.pdf".format(
-            row["electoral_term"], row["session"]
-        ),
-        axis=1,
+        electoral_term=speech_content_20["session"].str.slice(stop=2).astype("int32"),
+        session=speech_content_20["session"].str.slice(start=-3).astype("int32"),
+    )
+    electoral_term = speech_content_20["electoral_term"].astype(str)
+    return speech_content_20.assign(
+        document_url=DOCUMENT_URL
+        + electoral_term
+        + "/"
+        + electoral_term
+        + speech_content_20["session"].astype(str)
+        + ".pdf",
     )
 
-    speech_content = pd.concat([speech_content_01_19, speech_content_20])
-
-    # save data.
-
-    speech_content.to_pickle(SPEECH_CONTENT_OUTPUT / "speech_content.pkl")
-
-    # Placeholder for concating contributions_extended DF of all sessions.
-    contributions_extended = []
-
-    # Walk over all legislature periods. ___________________________________________
-    for folder_path in sorted(CONTRIBUTIONS_EXTENDED_INPUT.iterdir()):
-        # Skip e.g. the .DS_Store file.
-        if not folder_path.is_dir():
-            continue
-
-        term_number = regex.search(r"(?<=electoral_term_pp)\d{2}", folder_path.stem)
-        if term_number is None:
-            continue
-        term_number = int(term_number.group(0))
-
-        for contrib_ext_file_path in sorted(folder_path.glob("*.pkl")):
-            contributions_extended.append(pd.read_pickle(contrib_ext_file_path))
-
-    contributions_extended = pd.concat(contributions_extended, sort=False)
-
-    contributions_extended = contributions_extended.loc[
-        :,
-        [
-            "type",
-            "first_name",
-            "last_name",
-            "faction_id",
-            "id",
-            "text_position",
-            "politician_id",
-            "content",
-        ],
-    ]
 
+def prepare_contributions_extended(
+    contributions_extended: pd.DataFrame, id_offset: int
+) -> pd.DataFrame:
+    """Derives the final columns of the contributions of one electoral term."""
     contributions_extended = contributions_extended.rename(
         columns={"id": "speech_id", "politician_id": "politician_id"}
     )
 
-    contributions_extended.insert(0, "id", list(range(len(contributions_extended))))
+    contributions_extended.insert(
+        0, "id", range(id_offset, id_offset + len(contributions_extended))
+    )
 
     contributions_extended["first_name"] = contributions_extended[
         "first_name"
     ].str.join(" ")
 
-    contributions_extended = contributions_extended.astype(
+    return contributions_extended.astype(
         {
             "id": "int64",
             "type": "object",
@@ -199,12 +318,6 @@ def main(task):
         }
     )
 
-    contributions_extended.to_pickle(
-        CONTRIBUTIONS_EXTENDED_OUTPUT / "contributions_extended.pkl"
-    )
-
-    return True
-
 
 if __name__ == "__main__":
     main(None)
@@ -6,8 +6,15 @@ import pandas as pd
 import regex
 from tqdm import tqdm
 
-from open_discourse.definitions import path, pattern
-from open_discourse.helper.extract_contributions import extract
+from open_discourse.definitions import path
+from open_discourse.helper.extract_contributions import Contributions, extract_into
+from open_discourse.helper.name_parser import split_name
+from open_discourse.helper.position_classifier import (
+    PositionClassifier,
+    get_position_short_and_long,
+    guest_electoral_term_20_pattern,
+)
+from open_discourse.helper.storage import SUFFIX, session_file, write_frame
 
 # input directory
 ELECTORAL_TERM_20_INPUT = path.DATA_CACHE / "electoral_term_pp20" / "stage_02"
@@ -42,7 +49,10 @@ def main(task):
         }
     )
 
-    factions = pd.read_pickle(FACTIONS / "factions.pkl")
+    classifier = PositionClassifier(
+        pd.read_pickle(FACTIONS / "factions.pkl"),
+        guest_pattern=guest_electoral_term_20_pattern,
+    )
 
     politicians = pd.read_csv(POLITICIANS / "politicians.csv")
     politicians["last_name"] = politicians["last_name"].str.lower()
@@ -76,7 +86,8 @@ def main(task):
         if not session_path.is_dir():
             continue
 
-        contributions_extended = []
+        # The contributions of all speeches of the session
+        contributions = Contributions()
 
         session_content = et.parse(session_path / "session_content.xml")
         meta_data = et.parse(session_path / "meta_data.xml")
@@ -117,22 +128,11 @@ def main(task):
                 else:
                     position_raw = ""
 
-                faction_abbrev = get_faction_abbrev(str(position_raw))
-                position_short, position_long = get_position_short_and_long(
-                    faction_abbrev
-                    if faction_abbrev
-                    else regex.sub("\n+", " ", position_raw)
+                # Some faction entries in the factions df share the same
+                # abbreviation, the first one is chosen right now.
+                _, faction_id, position_short, position_long = classifier.classify(
+                    position_raw
                 )
-                faction_id = -1
-                if faction_abbrev:
-                    # .iloc[0] is important right now, as some faction entries
-                    # in factions df share same faction_id, so always the first
-                    # one is chosen right now.
-                    faction_id = int(
-                        factions.loc[
-                            factions["abbreviation"] == faction_abbrev, "id"
-                        ].iloc[0]
-                    )
 
                 speech_text = ""
                 text_position = 0
@@ -159,7 +159,7 @@ def main(task):
                         name = regex.sub(":", "", content.text).split()
                         first_name, last_name = get_first_last(" ".join(name[1:]))
                         position_short, position_long = get_position_short_and_long(
-                            name[0]
+                            name[0], guest_electoral_term_20_pattern
                         )
                         possible_matches = politicians_electoral_term.loc[
                             politicians_electoral_term["last_name"] == last_name.lower()
@@ -221,35 +221,20 @@ def main(task):
                             position_raw = name.find("fraktion").text
                         except (ValueError, AttributeError):
                             position_raw = name.find("rolle").find("rolle_lang").text
-                        faction_abbrev = get_faction_abbrev(str(position_raw))
-
-                        faction_id = -1
-                        position_short, position_long = get_position_short_and_long(
-                            faction_abbrev
-                            if faction_abbrev
-                            else regex.sub("\n+", " ", position_raw)
-                        )
-                        if faction_abbrev:
-                            # .iloc[0] is important right now, as some faction entries
-                            # in factions df share same faction_id, so always the first
-                            # one is chosen right now.
-                            faction_id = int(
-                                factions.loc[
-                                    factions["abbreviation"] == faction_abbrev, "id"
-                                ].iloc[0]
-                            )
+                        (
+                            _,
+                            faction_id,
+                            position_short,
+                            position_long,
+                        ) = classifier.classify(position_raw)
                     elif tag == "p":
                         try:
                             speech_text += "\n\n" + content.text
                         except TypeError:
                             pass
                     elif tag == "kommentar":
-                        (
-                            contributions_extended_frame,
-                            speech_replaced,
-                            contributions_simplified_frame,
-                            text_position,
-                        ) = extract(
+                        speech_replaced, text_position = extract_into(
+                            contributions,
                             content.text,
                             int(session_path.stem),
                             speech_content_id,
@@ -257,8 +242,6 @@ def main(task):
                             False,
                         )
                         speech_text += "\n\n" + speech_replaced
-                        contributions_extended.append(contributions_extended_frame)
-                        contributions_simplified.append(contributions_simplified_frame)
 
                 speech_records.append(
                     {
@@ -276,78 +259,29 @@ def main(task):
                 )
                 speech_content_id += 1
 
-        contributions_extended = pd.concat(contributions_extended, sort=False)
-        contributions_extended.to_pickle(
-            contributions_extended_output / (session_path.stem + ".pkl")
+        write_frame(
+            contributions.extended_frame(),
+            session_file(contributions_extended_output, session_path.stem),
         )
+        contributions_simplified.append(contributions.simplified_frame())
 
     speech_content = pd.DataFrame.from_records(speech_records)
 
-    speech_content.to_pickle(term_spoken_content / "speech_content.pkl")
+    write_frame(speech_content, term_spoken_content / ("speech_content" + SUFFIX))
 
     contributions_simplified = pd.concat(contributions_simplified, sort=False)
-    contributions_simplified.to_pickle(
-        contributions_simplified_output / "contributions_simplified.pkl"
+    write_frame(
+        contributions_simplified,
+        contributions_simplified_output / ("contributions_simplified" + SUFFIX),
     )
 
     return True
 
 
-def get_position_short_and_long(position_raw):
-    """matches the given position_raw and returns the long and short version"""
-    if position_raw in pattern.FACTIONS.keys() or regex.match(
-        r"^[Bb]erichterstatter(in)?(\s|$|,|.)", position_raw
-    ):
-        return (
-            "Member of Parliament",
-            None if position_raw in pattern.FACTIONS.keys() else position_raw,
-        )
-    elif (
-        regex.match(r"^[Bb]undestagspräsident(in)?(\s|$|,|.)", position_raw)
-        or regex.match(r"^[Aa]lterspräsident(in)?(\s|$|,|.)", position_raw)
-        or regex.match(r"^[Vv]izebundestagspräsident(in)?(\s|$|,|.)", position_raw)
-        or regex.match(r"^[Ss]chriftführer(in)?(\s|$|,|.)", position_raw)
-        or position_raw.lower()
-        in [
-            "präsidentin",
-            "präsident",
-            "präsident des deutschen bundestages",
-            "präsidentin des deutschen bundestages",
-            "vizepräsidentin",
-            "vizepräsident",
-        ]
-    ):
-        return "Presidium of Parliament", position_raw
-    elif (
-        regex.match(r"^[Bb]undespräsident(in)?(\s|$|,|.)", position_raw)
-        or regex.match(r"^[Mm]inisterpräsident(in)?(\s|$|,|.)", position_raw)
-        or regex.match(r"^[Ss]taatsminister(in)?(\s|$|,|.)", position_raw)
-        or regex.match(r"^[Ss]enator(in)?(\s|$|,|.)", position_raw)
-        or regex.match(r"^[Pp]räsident(in)?(\s|$|,|.)", position_raw)
-        or regex.match(r"^[Gg]ast", position_raw)
-    ):
-        return "Guest", position_raw
-    elif regex.match(r"^[Bb]undeskanzler(in)?(\s|$|,|.)", position_raw):
-        return "Chancellor", None
-    elif regex.match(r"^(Bundes)?[Mm]inister(in)?(\s|$|,|.)", position_raw):
-        return "Minister", position_raw
-    elif regex.match(
-        r"^([Pp]arl\s*\.\s+)?[Ss]taatssekretär(in)?(\s|$|,|.)", position_raw
-    ):
-        return "Secretary of State", position_raw
-    else:
-        return "Not found", None
-
-
 def get_first_last(name):
-    first_last = name.split()
-    if len(first_last) == 1:
-        first_name = ""
-        last_name = first_last[0]
-    elif len(first_last) >= 2:
-        first_name = first_last[:-1]
-        last_name = first_last[-1]
-    else:
+    # Titles are part of the first name here.
+    _, first_name, last_name = split_name(name, titles=[])
+    if not last_name:
         first_name = "ERROR"
         last_name = "ERROR"
     return " ".join(first_name), last_name
@@ -358,14 +292,5 @@ def find_with_default(node, key, default):
     return default if result is None else result.text
 
 
-def get_faction_abbrev(faction):
-    """matches the given faction and returns an id"""
-
-    for faction_abbrev, faction_pattern in pattern.FACTIONS.items():
-        if regex.search(faction_pattern, faction):
-            return faction_abbrev
-    return None
-
-
 if __name__ == "__main__":
     main(None)
@@ -3,6 +3,7 @@ import regex
 from tqdm import tqdm
 
 from open_discourse.definitions import path
+from open_discourse.helper.position_classifier import PositionClassifier
 
 # input directory
 MGS_PATH = path.POLITICIANS_STAGE_01
@@ -88,13 +89,13 @@ def main(task):
         "NR": r"^NR$",
     }
 
-    def get_faction_abbrev(faction, faction_patterns):
-        """matches the given faction and returns an id"""
-
-        for faction_abbrev, faction_pattern in faction_patterns.items():
-            if regex.search(faction_pattern, faction):
-                return faction_abbrev
-        return None
+    classifier = PositionClassifier(
+        factions,
+        faction_patterns={
+            faction_abbrev: regex.compile(faction_pattern)
+            for faction_abbrev, faction_pattern in faction_patterns.items()
+        },
+    )
 
     def get_electoral_term(from_year=None, to_year=None):
         if not from_year and not to_year:
@@ -171,14 +172,7 @@ def main(task):
         elif last_name == "Kinkel" and first_name[0] == "Klaus":
             faction = "FDP"
 
-        faction_abbrev = get_faction_abbrev(faction, faction_patterns)
-
-        if faction_abbrev:
-            faction_match = int(
-                factions.loc[factions["abbreviation"] == faction_abbrev, "id"].iloc[0]
-            )
-        else:
-            faction_match = -1
+        faction_match = classifier.classify(faction).faction_id
 
         first_name = [regex.sub("-", " ", name) for name in first_name]
 
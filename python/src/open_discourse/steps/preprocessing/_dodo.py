@@ -2,13 +2,11 @@ import open_discourse.steps.data._dodo as download_task
 import open_discourse.steps.preprocessing.create_electoral_terms as step5
 import open_discourse.steps.preprocessing.extract_mps_from_mp_base_data as step4
 import open_discourse.steps.preprocessing.split_xml as step2
-import open_discourse.steps.preprocessing.split_xml_electoral_term_1_and_2 as step1
 import open_discourse.steps.preprocessing.split_xml_electoral_term_20 as step3
 from open_discourse.definitions import path
 from open_discourse.steps.task_factory import TaskFactory
 
 # Define targets
-TARGET_TASK1 = path.RAW_TXT / "02_01.done"
 TARGET_TASK2 = path.RAW_TXT / "02_02.done"
 TARGET_TASK3 = step3.OUTPUT_PATH / "02_03.done"
 TARGET_TASK4 = path.POLITICIANS_STAGE_01 / "02_04.done"
@@ -22,12 +20,6 @@ factory = TaskFactory(
 
 # Define tasks using factory
 TASK_DEFINITION = {
-    "step1": factory.create_task(
-        step_module=step1,
-        target_paths=[TARGET_TASK1],
-        task_deps=["01_download:download_previous_periods"],
-        file_deps=[download_task.TARGET_TASK1],
-    ),
     "step2": factory.create_task(
         step_module=step2,
         target_paths=[TARGET_TASK2],
@@ -1,27 +1,102 @@
 import logging
 import xml.etree.ElementTree as Et
+import zipfile
+from functools import cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+from typing import BinaryIO
 from xml.etree.ElementTree import ParseError
 
-import dicttoxml
 import regex
-from tqdm import tqdm
 
 from open_discourse.definitions import path
+from open_discourse.helper.archive import (
+    path_reference,
+    resolve_reference,
+    xml_source_dir,
+)
 from open_discourse.helper.clean_text import clean
 from open_discourse.helper.create_electoral_terms import create_electoral_terms
 from open_discourse.helper.logging_config import setup_and_get_logger
-from open_discourse.helper.session_file_iterator import session_file_iterator
-
-
-def split_single_session_xml_data(xml_file_path: Path) -> tuple:
+from open_discourse.helper.parallel import iter_parallel
+from open_discourse.helper.parser import get_session_content
+from open_discourse.helper.session_index import session_index
+from open_discourse.helper.session_store import store_file, write_store
+from open_discourse.helper.utils import parse_path
+
+logger = logging.getLogger(__name__)
+
+# Tags of a session protocol read by split_single_session_xml_data, the metadata
+# by their key in meta_data and the text corpus.
+META_DATA_TAGS = {
+    "WAHLPERIODE": "term",
+    "DOKUMENTART": "document_type",
+    "NR": "document_number",
+    "DATUM": "date",
+}
+SESSION_TAGS = (*META_DATA_TAGS, "TEXT")
+# The tags the split of terms 1 and 2 needs, see split_session.
+ELECTORAL_TERM_1_AND_2_TAGS = ("NR", "DATUM", "TEXT")
+
+# Default patterns for the begin of the speech content and of the appendix.
+BEGIN_PATTERN = r"Beginn?:?\s?(\d){1,2}(\s?[.,]\s?(\d){1,2})?\s?Uhr"
+APPENDIX_PATTERN = (
+    r"\(Schlu(ß|ss)\s?:?(.*?)\d{1,2}\D+(\d{1,"
+    r"2})?(.*?)\)?|\(Ende der Sitzung: \d{1,"
+    r"2}\D+(\d{1,2}) Uhr\.?\)"
+)
+
+# Some files have issues which have to be handled manually
+# like a duplicated text corpus or two sessions in one file.
+# Patterns by document number, where they differ from the default.
+SPECIAL_BEGIN_PATTERNS = {
+    "04/69": r"Beginn: 9\.01",
+    "04/176": r"Beginn: 16\.02 Uhr",
+    "05/76": r"\(Beginn: 14\.32 Uhr\)",
+    "05/162": r"\(Beginn: 21\.13 Uhr\.\)",
+    "07/243": r"Beginn: 9\.00 Uhr(?=\nPräsident)",
+    "08/7": r"Beginn: 9\.00 Uhr(?=\nPräsident)",
+    "08/146": r"Beginn: 8\.00 Uhr",
+    "11/155": r"Beginn: 9\.00 Uhr(?=\nVize)",
+    "14/17": "Beginn: 9.00 Uhr",
+    "17/250": r"Beginn: 9.02 Uhr(?=\nPräsident)",
+    "18/237": r"Beginn: 9 \.02 Uhr",
+}
+SPECIAL_APPENDIX_PATTERNS = {
+    "03/16": r"\(Schluß der Sitzung: 16\.58 Uhr\.\)",
+    "04/196": r"Beifall.*?Schluß der Sitzung: 14\.54 Uhr\.\)",
+    "05/235": r"\(Schluß der Sitzung: 16\.09 Uhr\.\)",
+    "11/68": r"\(Schluß der Sitzung: 21\. 07 Uhr\)",
+    "14/17": (
+        r"Schluß: 12.06 Uhr\)\n\nDruck: Bonner Universitäts-Buchdruckerei, 53113 "
+        r"Bonn\n 53003 Bonn, Telefon: 02 28/3 82 08 40, Telefax: 02 28/3 82 08 "
+        r"44\n\n20\n\nBundespräsident Dr. Roman Herzog\n\nDeutscher"
+    ),
+    "14/21": r"\(Schluß: 22.18 Uhr\)\n\nAdelheid Tröscher\n\n1594",
+    "14/192": (
+        r"Vizepräsidentin Petra Bläss: Ich schließe die "
+        r"Aus-\nsprache\.(?=\n\nInter)"
+    ),
+    "16/222": r"\(Schluss: 18\.54 Uhr\)",
+    "17/250": r"\(Schluss: 0.52 Uhr\)\n\nIch",
+    "18/142": r"\(Schluss: 16 \.36 Uhr\)",
+}
+
+
+def split_single_session_xml_data(
+    xml_file_path: Path | zipfile.Path, required_tags: tuple[str, ...] = SESSION_TAGS
+) -> tuple:
     """
     Open a session protocol xml-file and split content into metadata and text corpus.
-    Raise ParseError resp. ValueError when xml-content cannot be processed properly
-    or expected tags are missing.
+    Raise ParseError resp. AttributeError when xml-content cannot be processed
+    properly or required tags are missing.
 
     Args:
-        xml_file_path (Path): Path to single session protocol xml-file
+        xml_file_path (Path | zipfile.Path): Path to single session protocol xml-file,
+                                             also a member of an archive
+        required_tags (tuple[str, ...]):     tags that must be present, the metadata
+                                             of other missing tags is None
 
     Returns:
         meta_data (dict):   Metadata of current xml-file
@@ -31,33 +106,29 @@ def split_single_session_xml_data(xml_file_path: Path) -> tuple:
     # Cancel if not xml file, this case should not occur
     if (not xml_file_path.is_file()) or xml_file_path.suffix != ".xml":
         msg = f"xml file expected {xml_file_path}"
-        logging.error(msg)
+        logger.error(msg)
         raise FileNotFoundError(msg)
 
-    meta_data = {}
-    text_corpus = None
-
     try:
-        tree = Et.parse(xml_file_path)
+        with xml_file_path.open("rb") as xml_file:
+            texts = read_session_tags(xml_file)
     except ParseError:
         msg = "xml ParseError" + str(xml_file_path)
-        logging.error(msg)
+        logger.error(msg)
         raise
 
-    try:
-        meta_data["term"] = tree.find("WAHLPERIODE").text
-        meta_data["document_type"] = tree.find("DOKUMENTART").text
-        # Get the document number, the date of the session and the content.
-        meta_data["document_number"] = tree.find("NR").text
-        meta_data["date"] = tree.find("DATUM").text
-        text_corpus = tree.find("TEXT").text
-    except AttributeError:
+    missing_tags = [tag for tag in required_tags if tag not in texts]
+    if missing_tags:
         msg = "xml AttributeError" + str(xml_file_path)
-        logging.error(msg)
-        raise
+        logger.error(msg)
+        raise AttributeError(f"Missing tags {missing_tags} in {xml_file_path}")
+
+    # Get the document number, the date of the session and the content.
+    meta_data = {key: texts.get(tag) for tag, key in META_DATA_TAGS.items()}
+    text_corpus = texts["TEXT"]
 
     # Are filename and meta_data consistent?
-    if (
+    if meta_data["term"] is not None and (
         xml_file_path.stem != f"{int(meta_data['term']):02d}"
         f"{int(meta_data['document_number'].split('/')[1]):03d}"
     ):
@@ -65,11 +136,42 @@ def split_single_session_xml_data(xml_file_path: Path) -> tuple:
             f"meta_data / filepath not consistent: {str(xml_file_path)} "
             f"{meta_data['document_number']}"
         )
-        logging.warning(msg)
+        logger.warning(msg)
 
     return meta_data, text_corpus
 
 
+def read_session_tags(xml_file: BinaryIO) -> dict[str, str | None]:
+    """
+    Reads the texts of the SESSION_TAGS below the root of a session protocol.
+
+    The protocol is parsed incrementally with iterparse and every element is
+    cleared once it is read, so no tree of the whole protocol is built. Like
+    tree.find, the first element of a tag wins. The file is read to its end, so a
+    malformed protocol raises a ParseError, too.
+
+    Args:
+        xml_file (BinaryIO):    session protocol opened in binary mode
+
+    Returns:
+        dict[str, str | None]: text by tag, missing tags are left out
+
+    Raises:
+        ParseError: if the xml is malformed
+    """
+    texts = {}
+    depth = 0
+    for event, element in Et.iterparse(xml_file, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1 and element.tag in SESSION_TAGS and element.tag not in texts:
+            texts[element.tag] = element.text
+        element.clear()
+    return texts
+
+
 def define_single_session_regex_pattern(meta_data: dict) -> tuple:
     """
     Define regex pattern for finding begin of speech_content respectively appendix
@@ -85,70 +187,15 @@ def define_single_session_regex_pattern(meta_data: dict) -> tuple:
         appendix_pattern (compiled regex):  regex pattern for appendix
 
     """
-    begin_pattern_electoral_term = r"Beginn?:?\s?(\d){1,2}(\s?[.,]\s?(\d){1,2})?\s?Uhr"
-    appendix_pattern_electoral_term = (
-        r"\(Schlu(ß|ss)\s?:?(.*?)\d{1,2}\D+(\d{1,"
-        r"2})?(.*?)\)?|\(Ende der Sitzung: \d{1,"
-        r"2}\D+(\d{1,2}) Uhr\.?\)"
-    )
+    return get_session_patterns(meta_data["document_number"])
 
-    begin_pattern = begin_pattern_electoral_term
-    appendix_pattern = appendix_pattern_electoral_term
 
-    # Some files have issues which have to be handled manually
-    # like a duplicated text corpus or two sessions in one file.
-    # change begin_pattern / appendix_patern only when different to default
-    if meta_data["document_number"] == "03/16":
-        appendix_pattern = r"\(Schluß der Sitzung: 16\.58 Uhr\.\)"
-    elif meta_data["document_number"] == "04/69":
-        begin_pattern = r"Beginn: 9\.01"
-    elif meta_data["document_number"] == "04/176":
-        begin_pattern = r"Beginn: 16\.02 Uhr"
-    elif meta_data["document_number"] == "04/196":
-        appendix_pattern = r"Beifall.*?Schluß der Sitzung: 14\.54 Uhr\.\)"
-    elif meta_data["document_number"] == "05/76":
-        begin_pattern = r"\(Beginn: 14\.32 Uhr\)"
-    elif meta_data["document_number"] == "05/162":
-        begin_pattern = r"\(Beginn: 21\.13 Uhr\.\)"
-    elif meta_data["document_number"] == "05/235":
-        appendix_pattern = r"\(Schluß der Sitzung: 16\.09 Uhr\.\)"
-    elif meta_data["document_number"] == "07/243":
-        begin_pattern = r"Beginn: 9\.00 Uhr(?=\nPräsident)"
-    elif meta_data["document_number"] == "08/7":
-        begin_pattern = r"Beginn: 9\.00 Uhr(?=\nPräsident)"
-    elif meta_data["document_number"] == "08/146":
-        begin_pattern = r"Beginn: 8\.00 Uhr"
-    elif meta_data["document_number"] == "11/68":
-        appendix_pattern = r"\(Schluß der Sitzung: 21\. 07 Uhr\)"
-    elif meta_data["document_number"] == "11/155":
-        begin_pattern = r"Beginn: 9\.00 Uhr(?=\nVize)"
-    elif meta_data["document_number"] == "14/17":
-        begin_pattern = "Beginn: 9.00 Uhr"
-        appendix_pattern = (
-            r"Schluß: 12.06 Uhr\)\n\nDruck: Bonner Universitäts-Buchdruckerei, 53113 "
-            r"Bonn\n 53003 Bonn, Telefon: 02 28/3 82 08 40, Telefax: 02 28/3 82 08 "
-            r"44\n\n20\n\nBundespräsident Dr. Roman Herzog\n\nDeutscher"
-        )
-    elif meta_data["document_number"] == "14/21":
-        appendix_pattern = r"\(Schluß: 22.18 Uhr\)\n\nAdelheid Tröscher\n\n1594"
-    elif meta_data["document_number"] == "14/192":
-        appendix_pattern = r"Vizepräsidentin Petra Bläss: Ich schließe die "
-        appendix_pattern += r"Aus-\nsprache\.(?=\n\nInter)"
-    elif meta_data["document_number"] == "16/222":
-        appendix_pattern = r"\(Schluss: 18\.54 Uhr\)"
-    elif meta_data["document_number"] == "17/250":
-        begin_pattern = r"Beginn: 9.02 Uhr(?=\nPräsident)"
-        appendix_pattern = r"\(Schluss: 0.52 Uhr\)\n\nIch"
-    elif meta_data["document_number"] == "18/142":
-        appendix_pattern = r"\(Schluss: 16 \.36 Uhr\)"
-    elif meta_data["document_number"] == "18/237":
-        begin_pattern = r"Beginn: 9 \.02 Uhr"
-
-    # return compiled regex
-    begin_pattern = regex.compile(begin_pattern)
-    appendix_pattern = regex.compile(appendix_pattern)
-
-    return begin_pattern, appendix_pattern
+@cache
+def get_session_patterns(document_number: str) -> tuple:
+    """Compiles the patterns of a document number once per worker process."""
+    begin_pattern = SPECIAL_BEGIN_PATTERNS.get(document_number, BEGIN_PATTERN)
+    appendix_pattern = SPECIAL_APPENDIX_PATTERNS.get(document_number, APPENDIX_PATTERN)
+    return regex.compile(begin_pattern), regex.compile(appendix_pattern)
 
 
 def single_session_special_text_split(meta_data: dict, text_corpus: str) -> str:
@@ -206,20 +253,200 @@ def single_session_special_text_split(meta_data: dict, text_corpus: str) -> str:
     return text_corpus
 
 
-def main(task):
-    logger = setup_and_get_logger(__file__, logging.DEBUG)
-    logger.info("Script 02_01 starts")
+def split_session(reference: tuple[str, str | None]) -> dict[str, str] | None:
+    """
+    Splits a session protocol into the columns of its row in the session store.
+
+    Terms 3 and later are split into the table of content, the spoken content and
+    the appendix by the patterns of define_single_session_regex_pattern. Because
+    of the "interesting" structure of the first two electoral terms, only the
+    spoken content is cut out of their protocols, by get_session_content.
+
+    Args:
+        reference (tuple[str, str | None]): path_reference of the protocol
+
+    Returns:
+        dict[str, str] | None:  the columns of STORE_SCHEMA, None if the protocol
+                                can't be split
+    """
+    input_file_path = resolve_reference(reference)
+    # ========================================
+    # 1 split xml
+    # ========================================
+    term_1_or_2 = parse_path(str(input_file_path)).term <= 2
+    try:
+        meta_data, text_corpus = split_single_session_xml_data(
+            input_file_path,
+            ELECTORAL_TERM_1_AND_2_TAGS if term_1_or_2 else SESSION_TAGS,
+        )
+    except (ParseError, AttributeError):
+        return None  # logs are written in func
+
+    if term_1_or_2:
+        parts = split_session_electoral_term_1_and_2(text_corpus)
+    else:
+        parts = split_session_text(meta_data, text_corpus)
+    if parts is None:
+        logger.warning(f"{input_file_path.name}: Session not written.")
+        return None
+
+    return {
+        "session": input_file_path.stem,
+        "document_number": meta_data["document_number"],
+        "date": meta_data["date"],
+        **parts,
+    }
+
+
+def split_session_text(meta_data: dict, text_corpus: str) -> dict[str, str] | None:
+    """
+    Splits the text of a session of term 3 or later.
+
+    Args:
+        meta_data (dict):   Metadata of current xml-file
+        text_corpus (str):  Content of tag <TEXT> of current xml-file
+
+    Returns:
+        dict[str, str] | None:  toc, session_content and appendix, None if the
+                                begin or the end of the session isn't found
+                                exactly once
+    """
+    # ========================================
+    # 2 define regex patterns
+    # ========================================
+    begin_pattern, appendix_pattern = define_single_session_regex_pattern(meta_data)
+    # ========================================
+    # 3 special cases with text split
+    # ========================================
+    text_corpus = single_session_special_text_split(meta_data, text_corpus)
+    # ========================================
+    # 4 clean text corpus.
+    # ========================================
+    text_corpus = clean(text_corpus)
+    # ========================================
+    # 5 Find the beginning pattern in session protocol
+    # ========================================
+    find_beginnings = list(regex.finditer(begin_pattern, text_corpus))
+
+    # If found more than once or none, handle depending on period.
+    if len(find_beginnings) != 1:
+        msg = (
+            f"found {len(find_beginnings)} beginnings, 1 is expected in "
+            f"{meta_data['document_number']}."
+        )
+        logger.warning(msg)
+        return None
 
-    # input directory
-    RAW_XML = path.RAW_XML
+    beginning_of_session = find_beginnings[0].span()[1]
+
+    toc = text_corpus[:beginning_of_session]
+    session_content = text_corpus[beginning_of_session:]
+    # At this point the document has a unique beginning. The spoken
+    # content begins after the matched phrase.
+
+    # ========================================
+    # 6 Find the ending pattern in session protocol
+    # ========================================
+    # Append "END OF FILE" to document text, otherwise pattern is
+    # not found, when appearing at the end of the file.
+    session_content += "\n\nEND OF FILE"
+
+    find_endings = list(regex.finditer(appendix_pattern, session_content))
+
+    if len(find_endings) != 1:
+        msg = (
+            f"found {len(find_endings)} endings, 1 is expected in "
+            f"{meta_data['document_number']}."
+        )
+        logger.warning(msg)
+        return None
+
+    # Appendix begins before the matched phrase.
+    end_of_session = find_endings[0].span()[0]
+
+    return {
+        "toc": toc,
+        "session_content": session_content[:end_of_session],
+        "appendix": session_content[end_of_session:],
+    }
+
+
+def split_session_electoral_term_1_and_2(text_corpus: str) -> dict[str, str] | None:
+    """
+    Cuts the spoken content out of the text of a session of term 1 or 2.
+
+    Args:
+        text_corpus (str):  Content of tag <TEXT> of current xml-file
+
+    Returns:
+        dict[str, str] | None:  session_content, None if no spoken content is found
+    """
+    # Clean text corpus.
+    text_corpus = clean(text_corpus)
+
+    # Append "END OF FILE" to document text, otherwise pattern is
+    # not found, when appearing at the end of the file.
+    text_corpus += "\n\nEND OF FILE"
+
+    session_content = get_session_content(text_corpus)
+    if not session_content:
+        logger.warning("No session content found.")
+        return None
+    return {"session_content": session_content}
+
+
+def split_sessions(electoral_terms: tuple[int, int], workers: int | None = None) -> int:
+    """
+    Splits the protocols of a range of electoral terms in one parallel pass.
+
+    The sessions of every term are written to a session store in RAW_TXT, e.g.
+    electoral_term_pp05.parquet, as soon as the term is done.
+
+    Args:
+        electoral_terms (tuple[int, int]):  first and last electoral term
+        workers (int, optional):            number of worker processes, see
+                                            get_worker_count
+
+    Returns:
+        int: number of sessions written
+    """
+    first_term, last_term = electoral_terms
+    # input directory, the downloaded archives or the extracted protocols
+    term_folders = []
+    references = []
+    for term_number, xml_file_paths in session_index(xml_source_dir(), "*.xml").items():
+        if first_term <= term_number <= last_term:
+            for xml_file_path in xml_file_paths:
+                term_folders.append(xml_file_path.parent.stem)
+                references.append(path_reference(xml_file_path))
 
     # output directory
-    RAW_TXT = path.RAW_TXT
-    RAW_TXT.mkdir(parents=True, exist_ok=True)
+    path.RAW_TXT.mkdir(parents=True, exist_ok=True)
+
+    sessions = iter_parallel(
+        split_session,
+        references,
+        workers=workers,
+        chunksize=16,
+        desc=f"Split terms {first_term} to {last_term}...",
+    )
+    written = 0
+    # The protocols are sorted by term, so the sessions of a term are consecutive.
+    for term_folder, term_sessions in groupby(
+        zip(term_folders, sessions), key=itemgetter(0)
+    ):
+        written += write_store(
+            store_file(path.RAW_TXT, term_folder),
+            (session for _, session in term_sessions if session is not None),
+        )
+    return written
+
 
-    # iterate through entire data or select term or session
-    # by default the iterator process from electoral term 3 until the last completed
-    # electoral term
+def main(task):
+    setup_and_get_logger(__file__, logging.DEBUG)
+    logger.info("Script 02_01 starts")
+
+    # by default the terms 1 until the last completed electoral term are processed
     electoral_terms = create_electoral_terms()
     max_term = max(electoral_terms)
     while electoral_terms[max_term]["number_of_sessions"] is None:
@@ -227,113 +454,12 @@ def main(task):
         if max_term < 1:
             msg = "No valid completed electoral term found. Check SESSIONS_PER_TERM."
             raise ValueError(msg)
-    # change here for testing with single terms or sessions
-    # for input_file_path in tqdm(session_file_iterator(RAW_XML,4, 19)):
-    logger.debug("Processing electoral terms from 3 to %s.", max_term)
-    for input_file_path in tqdm(session_file_iterator(RAW_XML, (3, max_term))):
-        # ========================================
-        # 1 split xml
-        # ========================================
-        try:
-            meta_data, text_corpus = split_single_session_xml_data(input_file_path)
-        except ParseError:
-            continue  # logs are written in func
-        # ========================================
-        # 2 define regex patterns
-        # ========================================
-        begin_pattern, appendix_pattern = define_single_session_regex_pattern(meta_data)
-        # ========================================
-        # 3 special cases with text split
-        # ========================================
-        text_corpus = single_session_special_text_split(meta_data, text_corpus)
-        # ========================================
-        # 4 clean text corpus.
-        # ========================================
-        text_corpus = clean(text_corpus)
-        # ========================================
-        # 5 Find the beginning pattern in session protocol
-        # ========================================
-        find_beginnings = list(regex.finditer(begin_pattern, text_corpus))
-
-        # If found more than once or none, handle depending on period.
-        if len(find_beginnings) != 1:
-            msg = (
-                f"found {len(find_beginnings)} beginnings, 1 is expected in "
-                f"{input_file_path.name}. No files written."
-            )
-            logging.warning(msg)
-            continue
-
-        beginning_of_session = find_beginnings[0].span()[1]
-
-        toc = text_corpus[:beginning_of_session]
-        session_content = text_corpus[beginning_of_session:]
-        # At this point the document has a unique beginning. The spoken
-        # content begins after the matched phrase.
-
-        # ========================================
-        # 6 Find the ending pattern in session protocol
-        # ========================================
-        # Append "END OF FILE" to document text, otherwise pattern is
-        # not found, when appearing at the end of the file.
-        session_content += "\n\nEND OF FILE"
-
-        find_endings = list(regex.finditer(appendix_pattern, session_content))
-
-        if len(find_endings) != 1:
-            msg = (
-                f"found {len(find_endings)} endings, 1 is expected in "
-                f"{input_file_path.name}. No files written."
-            )
-            logging.warning(msg)
-            continue
+    # change here for testing with single terms
+    logger.debug("Processing electoral terms from 1 to %s.", max_term)
+    written = split_sessions((1, max_term))
 
-        # Appendix begins before the matched phrase.
-        end_of_session = find_endings[0].span()[0]
-
-        appendix = session_content[end_of_session:]
-        session_content = session_content[:end_of_session]
-
-        # ========================================
-        # 7 write files
-        # ========================================
-        output_dir_path = RAW_TXT / input_file_path.parent.stem / input_file_path.stem
-        output_dir_path.mkdir(parents=True, exist_ok=True)
-
-        # Save table of content, spoken content and appendix in separate files
-        with open(output_dir_path / "toc.txt", "w", encoding="utf-8") as text_file:
-            text_file.write(toc)
-
-        with open(
-            output_dir_path / "session_content.txt", "w", encoding="utf-8"
-        ) as text_file:
-            text_file.write(session_content)
-
-        with open(output_dir_path / "appendix.txt", "w", encoding="utf-8") as text_file:
-            text_file.write(appendix)
-
-        # Dictionary Comprehension to reduce meta_data
-        keys_to_keep = ["document_number", "date"]
-        meta_data_short = {k: meta_data[k] for k in keys_to_keep if k in meta_data}
-
-        # other loglevel for dicttoxml!
-        logging.getLogger("dicttoxml").setLevel(logging.WARNING)
-        with open(output_dir_path / "meta_data.xml", "wb") as result_file:
-            result_file.write(dicttoxml.dicttoxml(meta_data_short))
-
-        # above writes successful?
-        for file_name in [
-            "toc.txt",
-            "session_content.txt",
-            "appendix.txt",
-            "meta_data.xml",
-        ]:
-            file_path = Path(output_dir_path / file_name)
-            if not file_path.exists():
-                msg = f"pp{input_file_path.stem}: File {file_name} not written."
-                logging.error(msg)
-
-    logging.info("Script 02_01 ends")
+    logger.info("Script 02_01 ends, %s sessions written", written)
+    return written > 0
 
 
 if __name__ == "__main__":
@@ -23,11 +23,8 @@ TASK_DEFINITION = {
     "step1": factory.create_task(
         step_module=step1,
         target_paths=[TARGET_TASK1],
-        task_deps=[
-            "02_preprocessing:split_xml_electoral_term_1_and_2",
-            "02_preprocessing:split_xml",
-        ],
-        file_deps=[preprocessing_task.TARGET_TASK1, preprocessing_task.TARGET_TASK2],
+        task_deps=["02_preprocessing:split_xml"],
+        file_deps=[preprocessing_task.TARGET_TASK2],
     ),
     "step2": factory.create_task(
         step_module=step2,
@@ -1,10 +1,31 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
-import regex
-from tqdm import tqdm
 
 from open_discourse.definitions import path, pattern
-from open_discourse.helper.clean_text import clean_name_headers
+from open_discourse.helper import (
+    clean_text,
+    name_parser,
+    position_classifier,
+    storage,
+)
+from open_discourse.helper.clean_text import (
+    get_name_headers_pattern,
+    remove_name_headers,
+)
+from open_discourse.helper.manifest import MANIFEST_NAME, SessionManifest, code_version
+from open_discourse.helper.name_parser import split_names
+from open_discourse.helper.parallel import run_parallel
+from open_discourse.helper.position_classifier import PositionClassifier
+from open_discourse.helper.session_index import session_index
+from open_discourse.helper.storage import (
+    SUFFIX,
+    read_frame,
+    session_file,
+    write_frame,
+)
 
 # input directory
 SPEECH_CONTENT_INPUT = path.SPEECH_CONTENT_STAGE_01
@@ -15,191 +36,123 @@ SPEECH_CONTENT_OUTPUT = path.SPEECH_CONTENT_STAGE_02
 
 
 def main(task):
-    factions = pd.read_pickle(FACTIONS / "factions.pkl")
+    # Only sessions with changed input, code or factions are processed again.
+    manifest = SessionManifest(
+        SPEECH_CONTENT_OUTPUT / MANIFEST_NAME,
+        code_version(
+            sys.modules[__name__],
+            clean_text,
+            name_parser,
+            position_classifier,
+            storage,
+            pattern,
+            FACTIONS / "factions.pkl",
+        ),
+    )
+    session_tasks = []
 
     # iterate over all electoral_term_folders
-    for folder_path in sorted(SPEECH_CONTENT_INPUT.iterdir()):
-        if not folder_path.is_dir():
-            continue
-
-        term_number = regex.search(r"(?<=electoral_term_pp)\d{2}", folder_path.stem)
-        if term_number is None:
-            continue
-        term_number = int(term_number.group(0))
-
-        save_path = SPEECH_CONTENT_OUTPUT / folder_path.stem
-        save_path.mkdir(parents=True, exist_ok=True)
-
-        # iterate over every speech_content file
-        for speech_content_file in tqdm(
-            folder_path.glob("*.pkl"),
-            desc=f"Clean speeches (term {term_number:>2})...",
-        ):
-            # read the spoken content csv
-            speech_content = pd.read_pickle(speech_content_file)
-
-            # Insert acad_title column and extract plain name and titles.
-            # ADD DOCUMENTATION HERE
-            speech_content.insert(3, "faction_id", -1)
-            speech_content.insert(3, "position_short", "")
-            speech_content.insert(4, "position_long", "")
-            speech_content.insert(5, "last_name", "")
-            speech_content.insert(6, "first_name", "")
-            speech_content.insert(7, "acad_title", "")
-
-            # Current workaround, because some speeches seem to not be matched
-            # correctly. If second stage works without mistakes (extracting the
-            # speech parts), this should not be necessary anymore.
-            speech_content = speech_content.fillna("")
-
-            # Clean all the names still remaining from PDF Header.
-            # KEEP IN MIND THIS ALSO DELETES NAMES IN VOTING LISTS!!!
-            # And I think not all names are cleaned because of their position, e.g.
-            # "Max Mustermann, Bundeskanzler"
-            # THIS PART IS IMPORTANT AND SHOULD WORK PROPERLY, AS REOCCURING NAMES
-            # CAN INTRODUCE A LARGE BIAS IN TEXT ANALYSIS
-            names = speech_content["name_raw"].to_list()
-            speech_content["speech_content"] = speech_content["speech_content"].apply(
-                clean_name_headers, args=(np.unique(names),)
-            )
-
-            speech_content.reset_index(inplace=True, drop=True)
-
-            # Delete all not alphabetical chars, keep "-" as it occurs often in
-            # names.
-            # Question: Is any other character deleted, which could be in a name?
-            # Answer: I don't think so.
-            speech_content["name_raw"] = speech_content["name_raw"].str.replace(
-                r"[^a-zA-ZÖÄÜäöüß\-]", " ", regex=True
-            )
-
-            # Replace more than two whitespaces with one.
-            speech_content["name_raw"] = speech_content["name_raw"].str.replace(
-                r"  +", " ", regex=True
-            )
-
-            # Graf has to be checked again, as this is also a last_name.
-            # Titles have to be added: Like e.c. or when mistakes occur like b.c.
-            # Deleted "Graf" for now.
-            titles = [
-                "Dr",
-                "Frau",
-                "D",
-                "-Ing",
-                "von",
-                "und",
-                "zu",
-                "van",
-                "de",
-                "Baron",
-                "Freiherr",
-                "Prinz",
-                "h",
-                "c",
-            ]
-
-            # Split the name column into it's components at space character.
-            first_last_titles = speech_content["name_raw"].apply(str.split)
-
-            # Extract acad_title, if it is in the titles list.
-            speech_content["acad_title"] = [
-                [acad_title for acad_title in title_list if acad_title in titles]
-                for title_list in first_last_titles
-            ]
-
-            # Remove titles from the first_last_name list.
-            for politician_titles in first_last_titles:
-                for acad_title in politician_titles[:]:
-                    if acad_title in titles:
-                        politician_titles.remove(acad_title)
-
-            # Get the first and last name based on the amount of elements.
-            for index, first_last in first_last_titles.items():
-                if len(first_last) == 1:
-                    speech_content.at[index, "first_name"] = ""
-                    speech_content.at[index, "last_name"] = first_last[0]
-                elif len(first_last) >= 2:
-                    speech_content.at[index, "first_name"] = first_last[:-1]
-                    speech_content.at[index, "last_name"] = first_last[-1]
-                else:
-                    speech_content.at[index, "first_name"] = "ERROR"
-                    speech_content.at[index, "last_name"] = "ERROR"
-
-            # look for factions in the faction column and replace them with a
-            # standardized faction name
-            for index, position_raw in speech_content["position_raw"].items():
-                faction_abbrev = _get_faction_abbrev(str(position_raw))
-                (
-                    speech_content.at[index, "position_short"],
-                    speech_content.at[index, "position_long"],
-                ) = _get_position_short_and_long(
-                    faction_abbrev
-                    if faction_abbrev
-                    else regex.sub("\n+", " ", position_raw)
-                )
-                if faction_abbrev:
-                    try:
-                        speech_content.at[index, "faction_id"] = int(
-                            factions.loc[
-                                factions["abbreviation"] == faction_abbrev, "id"
-                            ].iloc[0]
-                        )
-                    except IndexError:
-                        speech_content.at[index, "faction_id"] = -1
-
-            speech_content = speech_content.drop(columns=["position_raw", "name_raw"])
-            speech_content.to_pickle(save_path / speech_content_file.name)
-
-
-def _get_faction_abbrev(faction):
-    """matches the given faction and returns an id"""
-    for faction_abbrev, faction_pattern in pattern.FACTIONS.items():
-        if faction_pattern.search(faction):
-            return faction_abbrev
-    return None
-
-
-def _get_position_short_and_long(position):
-    """matches the given position and returns the long and short version"""
-    if position in pattern.FACTIONS.keys() or regex.match(
-        r"^[Bb]erichterstatter(in)?(\s|$|,|.)", position
-    ):
-        return (
-            "Member of Parliament",
-            None if position in pattern.FACTIONS.keys() else position,
-        )
-    elif (
-        regex.match(r"^[Bb]undestagspräsident(in)?(\s|$|,|.)", position)
-        or regex.match(r"^[Aa]lterspräsident(in)?(\s|$|,|.)", position)
-        or regex.match(r"^[Vv]izebundestagspräsident(in)?(\s|$|,|.)", position)
-        or regex.match(r"^[Ss]chriftführer(in)?(\s|$|,|.)", position)
-        or position.lower()
-        in [
-            "präsidentin",
-            "präsident",
-            "präsident des deutschen bundestages",
-            "präsidentin des deutschen bundestages",
-            "vizepräsidentin",
-            "vizepräsident",
-        ]
-    ):
-        return "Presidium of Parliament", position
-    elif (
-        regex.match(r"^[Bb]undespräsident(in)?(\s|$|,|.)", position)
-        or regex.match(r"^[Ss]taatsminister(in)?(\s|$|,|.)", position)
-        or regex.match(r"^[Ss]enator(in)?(\s|$|,|.)", position)
-        or regex.match(r"^[Pp]räsident(in)?(\s|$|,|.)", position)
-        or regex.match(r"^[Gg]ast", position)
-    ):
-        return "Guest", position
-    elif regex.match(r"^[Bb]undeskanzler(in)?(\s|$|,|.)", position):
-        return "Chancellor", None
-    elif regex.match(r"^(Bundes)?[Mm]inister(in)?(\s|$|,|.)", position):
-        return "Minister", position
-    elif regex.match(r"^([Pp]arl\s*\.\s+)?[Ss]taatssekretär(in)?(\s|$|,|.)", position):
-        return "Secretary of State", position
-    else:
-        return "Not found", None
+    for speech_content_files in session_index(
+        SPEECH_CONTENT_INPUT, f"*{SUFFIX}"
+    ).values():
+        # every speech_content file
+        for speech_content_file in speech_content_files:
+            save_path = SPEECH_CONTENT_OUTPUT / speech_content_file.parent.name
+            save_path.mkdir(parents=True, exist_ok=True)
+            if manifest.is_up_to_date(
+                speech_content_file, [session_file(save_path, speech_content_file.stem)]
+            ):
+                continue
+            session_tasks.append((speech_content_file, save_path))
+
+    run_parallel(
+        clean_session,
+        session_tasks,
+        initializer=_init_worker,
+        initargs=(FACTIONS / "factions.pkl",),
+        desc="Clean speeches...",
+    )
+    manifest.save()
+
+    return True
+
+
+# Loaded once per worker process, see _init_worker.
+_classifier = None
+
+
+def _init_worker(factions_path: Path):
+    global _classifier
+    _classifier = PositionClassifier(pd.read_pickle(factions_path))
+
+
+def clean_session(session_task: tuple[Path, Path]):
+    """Cleans the speeches of a single session and saves them to the save_path."""
+    speech_content_file, save_path = session_task
+
+    # read the spoken content csv
+    speech_content = read_frame(speech_content_file)
+
+    # Insert acad_title column and extract plain name and titles.
+    # ADD DOCUMENTATION HERE
+    speech_content.insert(3, "faction_id", -1)
+    speech_content.insert(3, "position_short", "")
+    speech_content.insert(4, "position_long", "")
+    speech_content.insert(5, "last_name", "")
+    speech_content.insert(6, "first_name", "")
+    speech_content.insert(7, "acad_title", "")
+
+    # Current workaround, because some speeches seem to not be matched
+    # correctly. If second stage works without mistakes (extracting the
+    # speech parts), this should not be necessary anymore.
+    speech_content = speech_content.fillna("")
+
+    # Clean all the names still remaining from PDF Header.
+    # KEEP IN MIND THIS ALSO DELETES NAMES IN VOTING LISTS!!!
+    # And I think not all names are cleaned because of their position, e.g.
+    # "Max Mustermann, Bundeskanzler"
+    # THIS PART IS IMPORTANT AND SHOULD WORK PROPERLY, AS REOCCURING NAMES
+    # CAN INTRODUCE A LARGE BIAS IN TEXT ANALYSIS
+    names = speech_content["name_raw"].to_list()
+    name_headers_pattern = get_name_headers_pattern(np.unique(names))
+    speech_content["speech_content"] = speech_content["speech_content"].apply(
+        remove_name_headers, args=(name_headers_pattern,)
+    )
+
+    speech_content.reset_index(inplace=True, drop=True)
+
+    # Delete all not alphabetical chars, keep "-" as it occurs often in
+    # names.
+    # Question: Is any other character deleted, which could be in a name?
+    # Answer: I don't think so.
+    speech_content["name_raw"] = speech_content["name_raw"].str.replace(
+        r"[^a-zA-ZÖÄÜäöüß\-]", " ", regex=True
+    )
+
+    # Replace more than two whitespaces with one.
+    speech_content["name_raw"] = speech_content["name_raw"].str.replace(
+        r"  +", " ", regex=True
+    )
+
+    # Split the name column into acad_title, first and last name.
+    names = split_names(speech_content["name_raw"])
+    speech_content["acad_title"] = names["acad_title"]
+    # A single name is the last name, the first names are an empty list then.
+    # Names with no parts are marked as errors in the last name.
+    speech_content["first_name"] = names["first_name"]
+    speech_content["last_name"] = names["last_name"].mask(
+        names["name_count"] == 0, "ERROR"
+    )
+
+    # look for factions in the faction column and replace them with a
+    # standardized faction name
+    positions = _classifier.classify_many(speech_content["position_raw"])
+    speech_content["position_short"] = positions["position_short"]
+    speech_content["position_long"] = positions["position_long"]
+    speech_content["faction_id"] = positions["faction_id"]
+
+    speech_content = speech_content.drop(columns=["position_raw", "name_raw"])
+    write_frame(speech_content, session_file(save_path, speech_content_file.stem))
 
 
 if __name__ == "__main__":
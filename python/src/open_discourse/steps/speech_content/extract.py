@@ -1,11 +1,21 @@
-import concurrent.futures
+import heapq
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
 import regex
-from tqdm import tqdm
 
 from open_discourse.definitions import path
+from open_discourse.helper import session_store, storage
+from open_discourse.helper.manifest import MANIFEST_NAME, SessionManifest, code_version
+from open_discourse.helper.parallel import run_parallel
+from open_discourse.helper.session_store import (
+    read_session,
+    store_files,
+    store_sessions,
+)
+from open_discourse.helper.storage import session_file, write_frame
 
 # input directory
 RAW_TXT = path.RAW_TXT
@@ -18,18 +28,45 @@ SPEECH_CONTENT_OUTPUT.mkdir(parents=True, exist_ok=True)
 def main(task):
     print("Starting..")
 
-    for folder_path in sorted(RAW_TXT.iterdir()):
-        process_period(folder_path)
+    # Only new or changed sessions are processed again.
+    manifest = SessionManifest(
+        SPEECH_CONTENT_OUTPUT / MANIFEST_NAME,
+        code_version(sys.modules[__name__], session_store, storage),
+    )
+
+    session_tasks = []
+    for term_number, store_path in store_files(RAW_TXT).items():
+        # Fail early for unsupported electoral terms.
+        get_patterns(term_number)
+
+        save_path = SPEECH_CONTENT_OUTPUT / store_path.stem
+        save_path.mkdir(parents=True, exist_ok=True)
+        sessions = store_sessions(store_path)
+        # The sessions of a term are processed again if one of them changed.
+        if manifest.is_up_to_date(
+            store_path, [session_file(save_path, session) for session in sessions]
+        ):
+            continue
+        session_tasks.extend(
+            (store_path, session, term_number, save_path) for session in sessions
+        )
+
+    run_parallel(process_session, session_tasks, desc="Extract speeches...")
+    manifest.save()
 
     return True
 
 
-def process_period(folder_path: Path):
+@lru_cache
+def get_patterns(term_number: int) -> list[regex.Pattern]:
+    """Compiles the speaker patterns of an electoral term once per process."""
     president_pattern_str = r"(?P<position_raw>Präsident(?:in)?|Vizepräsident(?:in)?|Alterspräsident(?:in)?|Bundespräsident(?:in)?|Bundeskanzler(?:in)?)\s+(?P<name_raw>[A-ZÄÖÜß](?:[^:([}{\]\)\s]+\s?){1,5})\s?:\s?"
 
     faction_speaker_pattern_str = r"{3}(?P<name_raw>[A-ZÄÖÜß][^:([{{}}\]\)\n]+?)(\s*{0}(?P<constituency>[^:(){{}}[\]\n]+){1})*\s*{0}(?P<position_raw>{2}){1}(\s*{0}(?P<constituency>[^:(){{}}[\]\n]+){1})*\s?:\s?"
 
-    minister_pattern_str = r"{0}(?P<name_raw>[A-ZÄÖÜß](?:[^:([{{}}\]\)\s]+\s?){{1,5}}?),\s?(?P<position_raw>(?P<short_position>Bundesminister(?:in)?|Staatsminister(?:in)?|(?:Parl\s?\.\s)?Staatssekretär(?:in)?|Präsident(?:in)?|Bundeskanzler(?:in)?|Schriftführer(?:in)?|Senator(?:in)?\s?(?:{1}(?P<constituency>[^:([{{}}\]\)\s]+){2})?|Berichterstatter(?:in)?)\s?([^:([\]{{}}\)\n]{{0,76}}?\n?){{1,2}})\s?:\s?"
+    # The lookahead only skips lines without a comma and a position after the first
+    # five words, it saves the backtracking of the name group on most lines.
+    minister_pattern_str = r"{0}(?=[A-ZÄÖÜß])(?=(?:[^:([{{}}\])\s]+\s){{0,5}}[^:([{{}}\])\s]*,\s?(?:Bundesminister|Staatsminister|Parl|Staatssekretär|Präsident|Bundeskanzler|Schriftführer|Senator|Berichterstatter))(?P<name_raw>[A-ZÄÖÜß](?:[^:([{{}}\]\)\s]+\s?){{1,5}}?),\s?(?P<position_raw>(?P<short_position>Bundesminister(?:in)?|Staatsminister(?:in)?|(?:Parl\s?\.\s)?Staatssekretär(?:in)?|Präsident(?:in)?|Bundeskanzler(?:in)?|Schriftführer(?:in)?|Senator(?:in)?\s?(?:{1}(?P<constituency>[^:([{{}}\]\)\s]+){2})?|Berichterstatter(?:in)?)\s?([^:([\]{{}}\)\n]{{0,76}}?\n?){{1,2}})\s?:\s?"
 
     parties = [
         r"(?:Gast|-)?(?:\s*C\s*[DSMU]\s*S?[DU]\s*(?:\s*[/,':!.-]?)*\s*(?:\s*C+\s*[DSs]?\s*[UÙ]?\s*)?)(?:-?Hosp\.|-Gast|1)?",
@@ -55,16 +92,6 @@ def process_period(folder_path: Path):
         "DBP",
         "NR",
     ]
-    if not folder_path.is_dir():
-        return
-
-    term_number = regex.search(r"(?<=electoral_term_pp)\d{2}", folder_path.stem)
-    print(term_number)
-    if term_number is None:
-        return
-
-    term_number = int(term_number.group(0))
-
     if term_number <= 10:
         open_brackets = r"[({\[]"
         close_brackets = r"[)}\]]"
@@ -86,91 +113,82 @@ def process_period(folder_path: Path):
         minister_pattern_str.format(prefix, open_brackets, close_brackets)
     )
 
-    patterns = [president_pattern, faction_speaker_pattern, minister_pattern]
-
-    save_path = SPEECH_CONTENT_OUTPUT / folder_path.stem
-    save_path.mkdir(parents=True, exist_ok=True)
-
-    # Walk over every session in the period.
-    with concurrent.futures.ThreadPoolExecutor() as inner_executor:
-        sessions = sorted(folder_path.iterdir())
-        inner_futures = [
-            inner_executor.submit(process_session, session, patterns, save_path)
-            for session in sessions
-        ]
-        for _ in tqdm(
-            concurrent.futures.as_completed(inner_futures),
-            total=len(inner_futures),
-            desc=f"Processing {folder_path.name}",
-        ):
-            pass
+    return [president_pattern, faction_speaker_pattern, minister_pattern]
+
+
+def find_speakers(session_content: str, term_number: int) -> list[regex.Match]:
+    """
+    Finds the speakers of a session with every pattern of get_patterns.
+
+    Every pattern scans the whole session, so the matches of different patterns
+    may overlap, e.g. the president in the position of a minister. The matches
+    are merged in the order of the text, at the same position in the order of
+    the patterns.
+
+    Args:
+        session_content (str):  spoken content of a session
+        term_number (int):      electoral term, 1 to 19
+
+    Returns:
+        list[regex.Match]: matches with the groups name_raw, position_raw and
+                           constituency
+    """
+    return list(
+        heapq.merge(
+            *(
+                pattern.finditer(session_content)
+                for pattern in get_patterns(term_number)
+            ),
+            key=regex.Match.start,
+        )
+    )
 
 
-def process_session(session_path: Path, patterns: list[regex.Pattern], save_path: Path):
-    # Skip e.g. the .DS_Store file.
-    if not session_path.is_dir():
-        return
+def process_session(session_task: tuple[Path, str, int, Path]):
+    """Splits a session into speeches and saves them to the save_path."""
+    store_path, session, term_number, save_path = session_task
 
-    session_df = pd.DataFrame(
-        {
-            "session": [],
-            "name_raw": [],
-            "position_raw": [],
-            "constituency": [],
-            "speech_content": [],
-            "span_begin": [],
-            "span_end": [],
-        }
-    )
+    # Read the session content from the session store of the term
+    session_content = read_session(store_path, session, ["session_content"])[
+        "session_content"
+    ]
 
-    # Open the session content
-    with open(session_path / "session_content.txt") as file:
-        session_content = file.read()
-
-    # Placeholders for the information of a speaker.
-    session_list = []
-    speaker_name = []
-    speaker_position = []  # faction like "SPD" or also "Präsident"
-    speaker_constituency = []
-    speaker_span_begin = []  # Character position beginning of match
-    speaker_span_end = []  # Character position ending of match
-    speech_content = []
-
-    # Search all parts where one of the patterns is matching.
-    for pattern in patterns:
-        for match in regex.finditer(pattern, session_content):
-            session_list.append(session_path.stem)
-            speaker_name.append(match.group("name_raw"))
-            speaker_position.append(match.group("position_raw"))
-            try:
-                speaker_constituency.append(match.group("constituency"))
-            except IndexError:
-                speaker_constituency.append(None)
-            spans = match.span()
-            speaker_span_begin.append(spans[0])
-            speaker_span_end.append(spans[1])
-
-    # Sort the speeches in the text.
-    session_df["session"] = session_list
-    session_df["name_raw"] = speaker_name
-    session_df["position_raw"] = speaker_position
-    session_df["constituency"] = speaker_constituency
-    session_df["span_begin"] = speaker_span_begin
-    session_df["span_end"] = speaker_span_end
-
-    session_df = session_df.sort_values(by="span_begin")
+    # The speakers in the order of the text.
+    speakers = find_speakers(session_content, term_number)
+    span_begin = [speaker.start() for speaker in speakers]
+    span_end = [speaker.end() for speaker in speakers]
 
     # Cut out the speech_contents between the matched patterns.
-    speech_beginnings = session_df["span_end"].to_list()
-    speech_endings = session_df["span_begin"].to_list()[1:]
-    speech_endings.append(len(session_content))
+    speech_endings = span_begin[1:] + [len(session_content)]
 
-    for begin, end in zip(speech_beginnings, speech_endings):
-        speech_content.append(session_content[begin:end])
-
-    session_df["speech_content"] = speech_content
+    session_df = pd.DataFrame(
+        {
+            "session": pd.Series([session] * len(speakers), dtype=object),
+            "name_raw": pd.Series(
+                [speaker.group("name_raw") for speaker in speakers], dtype=object
+            ),
+            # faction like "SPD" or also "Präsident"
+            "position_raw": pd.Series(
+                [speaker.group("position_raw") for speaker in speakers], dtype=object
+            ),
+            "constituency": pd.Series(
+                [speaker.groupdict().get("constituency") for speaker in speakers],
+                dtype=object,
+            ),
+            "speech_content": pd.Series(
+                [
+                    session_content[begin:end]
+                    for begin, end in zip(span_end, speech_endings)
+                ],
+                dtype=object,
+            ),
+            # Character positions of the beginning and ending of the match
+            "span_begin": pd.Series(span_begin, dtype="int64"),
+            "span_end": pd.Series(span_end, dtype="int64"),
+        }
+    )
 
-    session_df.to_pickle(save_path / (session_path.stem + ".pkl"))
+    write_frame(session_df, session_file(save_path, session))
 
 
 if __name__ == "__main__":
@@ -1,11 +1,28 @@
+import sys
+from pathlib import Path
+
 import pandas as pd
-import regex
-from tqdm import tqdm
 
 from open_discourse.definitions import path
+from open_discourse.helper import (
+    fuzzy_names,
+    match_names,
+    politician_matcher,
+    storage,
+)
+from open_discourse.helper.manifest import MANIFEST_NAME, SessionManifest, code_version
 from open_discourse.helper.match_names import (
     insert_politician_id_into_speech_content,
 )
+from open_discourse.helper.parallel import run_parallel
+from open_discourse.helper.politician_matcher import PoliticianMatcher
+from open_discourse.helper.session_index import session_index
+from open_discourse.helper.storage import (
+    SUFFIX,
+    read_frame,
+    session_file,
+    write_frame,
+)
 
 # input directory
 SPEECH_CONTENT_INPUT = path.SPEECH_CONTENT_STAGE_02
@@ -17,8 +34,50 @@ SPEECH_CONTENT_OUTPUT.mkdir(parents=True, exist_ok=True)
 
 
 def main(task):
+    # Only sessions with changed input, code or politicians are processed again.
+    manifest = SessionManifest(
+        SPEECH_CONTENT_OUTPUT / MANIFEST_NAME,
+        code_version(
+            sys.modules[__name__],
+            match_names,
+            politician_matcher,
+            fuzzy_names,
+            storage,
+            DATA_FINAL / "politicians.csv",
+        ),
+    )
+    session_tasks = []
+
+    # iterate over all electoral_term_folders __________________________________________________
+    for term_number, speech_content_files in session_index(
+        SPEECH_CONTENT_INPUT, f"*{SUFFIX}"
+    ).items():
+        # every speech_content file
+        for speech_content_file in speech_content_files:
+            save_path = SPEECH_CONTENT_OUTPUT / speech_content_file.parent.name
+            save_path.mkdir(parents=True, exist_ok=True)
+            if manifest.is_up_to_date(
+                speech_content_file, [session_file(save_path, speech_content_file.stem)]
+            ):
+                continue
+            session_tasks.append((speech_content_file, save_path, term_number))
+
+    run_parallel(
+        match_session,
+        session_tasks,
+        initializer=_init_worker,
+        initargs=(DATA_FINAL / "politicians.csv",),
+        desc="Match speaker names...",
+    )
+    manifest.save()
+
+    return True
+
+
+def load_politicians(politicians_path: Path) -> pd.DataFrame:
+    """Reads politicians.csv and normalizes the names for matching."""
     # MDBS
-    politicians = pd.read_csv(DATA_FINAL / "politicians.csv")
+    politicians = pd.read_csv(politicians_path)
     politicians = politicians.loc[
         :,
         [
@@ -54,45 +113,64 @@ def main(task):
 
     politicians["profession"] = politicians["profession"].str.lower()
 
-    # iterate over all electoral_term_folders __________________________________________________
-    for folder_path in sorted(SPEECH_CONTENT_INPUT.iterdir()):
-        if not folder_path.is_dir():
-            continue
-
-        term_number = regex.search(r"(?<=electoral_term_pp)\d{2}", folder_path.stem)
-        if term_number is None:
-            continue
-        term_number = int(term_number.group(0))
-
-        save_path = SPEECH_CONTENT_OUTPUT / folder_path.stem
-        save_path.mkdir(parents=True, exist_ok=True)
-
-        # Only select politicians of the election period.
-        politicians_electoral_term = politicians.loc[
-            politicians["electoral_term"] == term_number
-        ]
-        mgs_electoral_term = politicians_electoral_term.loc[
-            politicians_electoral_term["institution_type"] == "Regierungsmitglied"
-        ]
-
-        # iterate over every speech_content file
-        for speech_content_file in tqdm(
-            folder_path.glob("*.pkl"),
-            desc=f"Match speaker names (term {term_number:>2})...",
-        ):
-            # read the spoken content pickle file
-            speech_content = pd.read_pickle(speech_content_file)
-
-            speech_content_matched, _ = insert_politician_id_into_speech_content(
-                speech_content,
-                politicians_electoral_term,
-                mgs_electoral_term,
-                politicians,
-            )
-
-            speech_content_matched.to_pickle(save_path / speech_content_file.name)
+    return politicians
 
-    return True
+
+# Loaded once per worker process, see _init_worker.
+_politicians = None
+# PoliticianMatcher per electoral term, built on first use in a worker.
+_matchers = {}
+
+
+def _init_worker(politicians_path: Path):
+    global _politicians
+    _politicians = load_politicians(politicians_path)
+    _matchers.clear()
+
+
+def get_matcher(term_number: int) -> PoliticianMatcher:
+    """Returns the (cached) matcher for the politicians of an electoral term."""
+    if term_number not in _matchers:
+        politicians_electoral_term, mgs_electoral_term = _select_electoral_term(
+            term_number
+        )
+        # Build the lookup indexes once for all sessions of the electoral term.
+        _matchers[term_number] = PoliticianMatcher(
+            politicians_electoral_term, mgs_electoral_term
+        )
+    return _matchers[term_number]
+
+
+def _select_electoral_term(term_number: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # Only select politicians of the election period.
+    politicians_electoral_term = _politicians.loc[
+        _politicians["electoral_term"] == term_number
+    ]
+    mgs_electoral_term = politicians_electoral_term.loc[
+        politicians_electoral_term["institution_type"] == "Regierungsmitglied"
+    ]
+    return politicians_electoral_term, mgs_electoral_term
+
+
+def match_session(session_task: tuple[Path, Path, int]):
+    """Matches the speakers of a single session and saves them to the save_path."""
+    speech_content_file, save_path, term_number = session_task
+    politicians_electoral_term, mgs_electoral_term = _select_electoral_term(term_number)
+
+    # read the spoken content pickle file
+    speech_content = read_frame(speech_content_file)
+
+    speech_content_matched, _ = insert_politician_id_into_speech_content(
+        speech_content,
+        politicians_electoral_term,
+        mgs_electoral_term,
+        _politicians,
+        matcher=get_matcher(term_number),
+    )
+
+    write_frame(
+        speech_content_matched, session_file(save_path, speech_content_file.stem)
+    )
 
 
 if __name__ == "__main__":
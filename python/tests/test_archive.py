@@ -0,0 +1,117 @@
+import pickle
+import zipfile
+from unittest.mock import patch
+
+from open_discourse.helper import archive
+from open_discourse.helper.archive import (
+    archive_member,
+    archive_members,
+    open_archive,
+    path_reference,
+    resolve_reference,
+    xml_source_dir,
+)
+from open_discourse.helper.parallel import run_parallel
+from open_discourse.helper.session_index import session_index
+
+
+def make_archive(archive_path, members):
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(archive_path, "w") as zip_file:
+        for name, content in members.items():
+            zip_file.writestr(name, content)
+    return archive_path
+
+
+def test_open_archive_is_shared(tmp_path):
+    archive_path = make_archive(tmp_path / "electoral_term_pp05.zip", {"05001.xml": ""})
+
+    assert open_archive(archive_path) is open_archive(archive_path)
+
+
+def test_open_archive_per_process(tmp_path):
+    archive_path = make_archive(tmp_path / "electoral_term_pp05.zip", {"05001.xml": ""})
+    parent_archive = open_archive(archive_path)
+
+    # A forked worker doesn't share the file offset of the parent's archive.
+    with patch.object(archive.os, "getpid", return_value=-1):
+        assert open_archive(archive_path) is not parent_archive
+
+
+def test_archive_members(tmp_path):
+    archive_path = make_archive(
+        tmp_path / "electoral_term_pp05.zip",
+        {"05002.xml": "", "05001.xml": "", "readme.txt": "", "sub/05003.xml": ""},
+    )
+
+    assert archive_members(archive_path, ".xml") == ["05002.xml", "05001.xml"]
+
+
+def test_archive_member(tmp_path):
+    archive_path = make_archive(
+        tmp_path / "electoral_term_pp05.zip", {"05001.xml": "<DOKUMENT/>"}
+    )
+
+    member = archive_member(archive_path, "05001.xml")
+
+    assert member.name == "05001.xml"
+    assert member.stem == "05001"
+    assert member.suffix == ".xml"
+    assert member.parent.stem == "electoral_term_pp05"
+    assert member.is_file()
+    with member.open("rb") as file:
+        assert file.read() == b"<DOKUMENT/>"
+
+
+def test_path_reference(tmp_path):
+    archive_path = make_archive(
+        tmp_path / "electoral_term_pp05.zip", {"05001.xml": "<DOKUMENT/>"}
+    )
+    file_path = tmp_path / "05002.xml"
+
+    for session_path in [archive_member(archive_path, "05001.xml"), file_path]:
+        reference = pickle.loads(pickle.dumps(path_reference(session_path)))
+        resolved = resolve_reference(reference)
+
+        assert type(resolved) is type(session_path)
+        assert str(resolved) == str(session_path)
+
+
+def read_member(reference):
+    return resolve_reference(reference).read_text()
+
+
+def test_archive_members_in_worker_processes(tmp_path):
+    contents = {f"05{session:03}.xml": f"{session}" * 50000 for session in range(40)}
+    archive_path = make_archive(tmp_path / "electoral_term_pp05.zip", contents)
+    references = [
+        path_reference(archive_member(archive_path, name)) for name in contents
+    ]
+
+    assert run_parallel(read_member, references, workers=2) == list(contents.values())
+
+
+def test_session_index_of_archives(tmp_path):
+    make_archive(
+        tmp_path / "electoral_term_pp05.zip",
+        {"05002.xml": "b", "05001.xml": "a", "x47P13.xml": ""},
+    )
+    make_archive(tmp_path / "electoral_term_pp04.zip", {"04019.xml": "c"})
+
+    for _ in range(2):  # built and read from the stored index
+        index = session_index(tmp_path, "*.xml")
+
+        assert list(index) == [4, 5]
+        assert [member.name for member in index[5]] == ["05001.xml", "05002.xml"]
+        assert [member.read_text() for member in index[5]] == ["a", "b"]
+        assert all(isinstance(member, zipfile.Path) for member in index[5])
+
+
+def test_xml_source_dir(tmp_path):
+    raw_zip = tmp_path / "zip"
+    raw_xml = tmp_path / "xml"
+
+    with patch.multiple(archive, RAW_ZIP=raw_zip, RAW_XML=raw_xml):
+        assert xml_source_dir() == raw_xml
+        make_archive(raw_zip / "electoral_term_pp01.zip", {"01001.xml": ""})
+        assert xml_source_dir() == raw_zip
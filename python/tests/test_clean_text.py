@@ -1,10 +1,20 @@
+from pathlib import Path
+
 import pytest
 
 from open_discourse.helper.clean_text import (
     clean,
+    clean_name_headers,
+    get_name_headers_pattern,
+    remove_margin_markers,
+    remove_name_headers,
     remove_newlines_in_brackets,
 )
 
+# Sample protocols with pdf headers, section markers, tabs, misrecognized
+# characters and hyphenation. The golden files hold the output of clean.
+GOLDEN_DIR = Path(__file__).parent / "data" / "clean_text"
+
 
 def test_clean_replaces_misrecognized_characters():
     input_text = "  — – •"
@@ -42,6 +52,32 @@ def test_clean_combined():
     assert clean(input_text, remove_pdf_header=True) == expected_output
 
 
+@pytest.mark.parametrize("protocol", sorted(GOLDEN_DIR.glob("protocol_?.txt")))
+@pytest.mark.parametrize(
+    "remove_pdf_header, golden_suffix",
+    [(True, ".clean.txt"), (False, ".clean_no_header.txt")],
+)
+def test_clean_golden_files(protocol, remove_pdf_header, golden_suffix):
+    input_text = protocol.read_text(encoding="utf-8")
+    expected_output = protocol.with_name(protocol.stem + golden_suffix).read_text(
+        encoding="utf-8"
+    )
+    assert clean(input_text, remove_pdf_header=remove_pdf_header) == expected_output
+
+
+@pytest.mark.parametrize(
+    "input_text, expected_output",
+    [
+        ("Text\n(A) more", "Text more"),
+        ("Text \t\n\n(B)\n(C)(D)", "Text"),
+        ("(A)Text (E) (a)", "Text (E) (a)"),
+        ("Text\xa0\u2009(D)", "Text"),
+    ],
+)
+def test_remove_margin_markers(input_text, expected_output):
+    assert remove_margin_markers(input_text) == expected_output
+
+
 @pytest.mark.parametrize(
     "input_text, expected_output",
     [
@@ -85,3 +121,27 @@ text with some lines)""",
 )
 def test_remove_newlines_in_brackets(input_text, expected_output):
     assert remove_newlines_in_brackets(input_text) == expected_output
+
+
+def test_remove_newlines_in_brackets_cleans_every_bracket_once():
+    # The same bracket nested in a later one is cleaned in both places.
+    input_text = "(Beifall\n)\n(Abg. Müller: Ja!\n(Beifall\n) —\nZurufe)"
+    expected_output = "(Beifall )\n(Abg. Müller: Ja! (Beifall ) — Zurufe)"
+    assert remove_newlines_in_brackets(input_text) == expected_output
+
+
+def test_clean_name_headers():
+    names = ["Dr. Lammert", "Müller (Köln)"]
+    input_text = "Text\nDr. Lammert\nmore\nBundesminister Dr. Lammert \n123\nend"
+    assert clean_name_headers(input_text, names) == "Text\nmore\nend"
+
+    input_text = "Text\nMüller Köln\nmore"
+    assert clean_name_headers(input_text, names, True) == "Text\nmore"
+
+
+def test_get_name_headers_pattern_is_compiled_once():
+    names = ["Dr. Lammert", "Anna Schmidt"]
+    pattern = get_name_headers_pattern(names)
+    assert get_name_headers_pattern(list(names)) is pattern
+    assert get_name_headers_pattern(names, True) is not pattern
+    assert remove_name_headers("Text\nAnna Schmidt\nmore", pattern) == "Text\nmore"
@@ -0,0 +1,91 @@
+import pandas as pd
+
+from open_discourse.helper.manifest import SessionManifest
+from open_discourse.helper.match_names import (
+    insert_politician_id_into_contributions_extended,
+)
+from open_discourse.helper.storage import write_frame
+from open_discourse.steps.database.concat import (
+    CONTRIBUTIONS_COLUMNS,
+    concat_sessions,
+    is_up_to_date,
+    prepare_contributions_extended,
+    prepare_speech_content,
+)
+
+
+def test_concat_speech_content(tmp_path):
+    sessions = {"05001": [["Wolfgang"]], "05002": [["Helmut"], []]}
+    for session, first_names in sessions.items():
+        write_frame(
+            pd.DataFrame(
+                {
+                    "speech_id": range(len(first_names)),
+                    "first_name": first_names,
+                    "last_name": ["Schmidt"] * len(first_names),
+                }
+            ),
+            tmp_path / f"{session}.parquet",
+        )
+
+    speech_content = concat_sessions(
+        tmp_path, ["speech_id", "session", "first_name", "last_name"]
+    )
+    speech_content = prepare_speech_content(speech_content, {5002: 1}, id_offset=10)
+
+    assert speech_content["id"].to_list() == [10, 11, 12]
+    assert speech_content["electoral_term"].to_list() == [5, 5, 5]
+    assert speech_content["session"].to_list() == [1, 2, 2]
+    assert speech_content["first_name"].to_list() == ["Wolfgang", "Helmut", ""]
+    assert speech_content["document_url"].iloc[0].endswith("/05/05001.pdf")
+    assert speech_content["date"].fillna(-1).to_list() == [-1, 1, 1]
+
+
+def test_is_up_to_date(tmp_path):
+    input_paths = [tmp_path / "05001.parquet", tmp_path / "05002.parquet"]
+    for input_path in input_paths:
+        input_path.write_text(input_path.stem)
+    output_path = tmp_path / "speech_content.parquet"
+    manifest_path = tmp_path / "manifest.json"
+
+    manifest = SessionManifest(manifest_path, "v1")
+    assert not is_up_to_date(manifest, input_paths, output_path)
+    output_path.write_text("speeches")
+    manifest.save()
+
+    manifest = SessionManifest(manifest_path, "v1")
+    assert is_up_to_date(manifest, input_paths, output_path)
+    manifest.save()
+    # A removed session changes the output as well.
+    manifest = SessionManifest(manifest_path, "v1")
+    assert not is_up_to_date(manifest, input_paths[:1], output_path)
+    manifest.save()
+    assert output_path.exists()
+
+
+def test_concat_session_without_contributions(tmp_path):
+    contributions_extended = pd.DataFrame(
+        columns=[
+            "type",
+            "first_name",
+            "last_name",
+            "faction_id",
+            "id",
+            "text_position",
+            "acad_title",
+            "constituency",
+            "content",
+        ]
+    )
+    contributions_extended, _ = insert_politician_id_into_contributions_extended(
+        contributions_extended, pd.DataFrame(), pd.DataFrame()
+    )
+    write_frame(contributions_extended, tmp_path / "05001.parquet")
+
+    contributions_extended = concat_sessions(tmp_path, CONTRIBUTIONS_COLUMNS)
+    contributions_extended = prepare_contributions_extended(
+        contributions_extended, id_offset=0
+    )
+
+    assert len(contributions_extended) == 0
+    assert contributions_extended["politician_id"].dtype == "int32"
@@ -0,0 +1,187 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from open_discourse.helper.download import (
+    DOWNLOADED,
+    FAILED,
+    NOT_MODIFIED,
+    Download,
+    DownloadManifest,
+    RateLimiter,
+    download_files,
+)
+
+LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+class ArchiveHandler(BaseHTTPRequestHandler):
+    """Serves server.files with ETag, Last-Modified and range support."""
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        if self.path in self.server.errors:
+            self.send_error(self.server.errors[self.path])
+            return
+        if self.path not in self.server.files:
+            self.send_error(404)
+            return
+        content = self.server.files[self.path]
+        etag = f'"{hash(content)}"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") == etag:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+        else:
+            self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.send_header("Content-Length", str(len(content) - start))
+        self.end_headers()
+        self.wfile.write(content[start:])
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ArchiveHandler)
+    server.files = {}
+    server.errors = {}
+    server.requests = []
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def run(server, tmp_path, names, **kwargs):
+    downloads = [Download(server.url + "/" + name, tmp_path / name) for name in names]
+    kwargs.setdefault("min_interval", 0)
+    return download_files(downloads, tmp_path / "downloads.json", **kwargs)
+
+
+def test_download_files(server, tmp_path):
+    server.files = {f"/pp{term:02}.zip": bytes([term]) * 1000 for term in range(1, 6)}
+    names = [f"pp{term:02}.zip" for term in range(1, 6)]
+
+    results = run(server, tmp_path, names)
+
+    assert [result.status for result in results] == [DOWNLOADED] * 5
+    assert [result.path for result in results] == [tmp_path / name for name in names]
+    for term, name in enumerate(names, start=1):
+        assert (tmp_path / name).read_bytes() == bytes([term]) * 1000
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_download_files_skips_unchanged_files(server, tmp_path):
+    server.files = {"/pp01.zip": b"a" * 100, "/pp02.zip": b"b" * 100}
+    run(server, tmp_path, ["pp01.zip", "pp02.zip"])
+    server.files["/pp02.zip"] = b"c" * 100
+    server.requests.clear()
+
+    results = run(server, tmp_path, ["pp01.zip", "pp02.zip"])
+
+    assert [result.status for result in results] == [NOT_MODIFIED, DOWNLOADED]
+    assert (tmp_path / "pp02.zip").read_bytes() == b"c" * 100
+    headers = dict(server.requests)["/pp01.zip"]
+    assert headers["If-Modified-Since"] == LAST_MODIFIED
+
+
+def test_download_files_resumes_part_files(server, tmp_path):
+    content = bytes(range(256)) * 40
+    server.files = {"/pp01.zip": content}
+    run(server, tmp_path, ["pp01.zip"])
+    etag = DownloadManifest(tmp_path / "downloads.json").get(tmp_path / "pp01.zip")
+
+    # An interrupted download: half of the file and the validators of the start.
+    (tmp_path / "pp01.zip").unlink()
+    (tmp_path / "pp01.zip.part").write_bytes(content[:5000])
+    DownloadManifest(tmp_path / "downloads.json").set(
+        tmp_path / "pp01.zip", **{**etag, "complete": False}
+    )
+    server.requests.clear()
+
+    results = run(server, tmp_path, ["pp01.zip"])
+
+    assert results[0].status == DOWNLOADED
+    assert (tmp_path / "pp01.zip").read_bytes() == content
+    assert server.requests[0][1]["Range"] == "bytes=5000-"
+
+
+def test_download_files_restarts_changed_part_files(server, tmp_path):
+    server.files = {"/pp01.zip": b"new" * 100}
+    (tmp_path / "pp01.zip.part").write_bytes(b"old" * 50)
+    DownloadManifest(tmp_path / "downloads.json").set(
+        tmp_path / "pp01.zip", etag='"old"', last_modified=None, complete=False
+    )
+
+    results = run(server, tmp_path, ["pp01.zip"])
+
+    assert results[0].status == DOWNLOADED
+    assert (tmp_path / "pp01.zip").read_bytes() == b"new" * 100
+
+
+def test_download_files_reports_failures(server, tmp_path):
+    server.files = {"/pp01.zip": b"a"}
+
+    results = run(server, tmp_path, ["pp01.zip", "missing.zip"])
+
+    assert [result.status for result in results] == [DOWNLOADED, FAILED]
+    assert "404" in results[1].error
+    # A client error is not retried.
+    assert [path for path, _ in server.requests].count("/missing.zip") == 1
+    with open(tmp_path / "downloads.json") as file:
+        assert list(json.load(file)) == ["pp01.zip"]
+
+
+def test_download_files_retries_server_errors(server, tmp_path):
+    server.errors = {"/pp01.zip": 503}
+
+    results = run(server, tmp_path, ["pp01.zip"], attempts=3, backoff=0.05)
+
+    assert results[0].status == FAILED
+    assert "503" in results[0].error
+    # Every attempt is a single request, the session itself does not retry.
+    assert len(server.requests) == 3
+
+
+def test_rate_limiter_spaces_requests_per_host():
+    rate_limiter = RateLimiter(0.05)
+    starts = []
+
+    def request(url):
+        rate_limiter.wait(url)
+        starts.append((url, time.monotonic()))
+
+    threads = [
+        threading.Thread(target=request, args=(url,))
+        for url in ["http://a/1", "http://a/2", "http://a/3", "http://b/1"]
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    host_a = sorted(start for url, start in starts if url.startswith("http://a"))
+    assert all(b - a >= 0.045 for a, b in zip(host_a, host_a[1:]))
+    host_b = [start for url, start in starts if url.startswith("http://b")]
+    assert host_b[0] - min(host_a) < 0.045
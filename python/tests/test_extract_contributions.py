@@ -0,0 +1,123 @@
+import pytest
+
+from open_discourse.helper.extract_contributions import (
+    Contributions,
+    contribution_Patterns,
+    extract,
+    extract_applause,
+    extract_approval,
+    extract_into,
+    extract_person_interjection,
+    extract_shout,
+    faction_Patterns,
+    get_contribution_methods,
+    get_name_Pattern_id,
+    parties,
+    person_Patterns,
+)
+
+SPEECH = (
+    "Meine Damen und Herren! (Beifall bei der SPD und dem BÜNDNIS 90/DIE GRÜNEN) "
+    "Wir beginnen. (Zuruf von der CDU/CSU: Quatsch!) Weiter. "
+    "(Lachen bei der AfD – Abg. Dr. Hans Müller [FDP]: Das ist falsch!)"
+)
+
+
+def test_extract():
+    contributions_extended, speech_text, contributions_simplified, text_position = (
+        extract(SPEECH, 19003, 7)
+    )
+
+    assert speech_text == (
+        "Meine Damen und Herren! ({0}) Wir beginnen. ({1}) Weiter. ({2})"
+    )
+    assert text_position == 3
+    assert contributions_extended[
+        ["type", "name_raw", "faction", "content", "text_position"]
+    ].values.tolist() == [
+        ["Personen-Einruf", "Dr. Hans Müller", "FDP", "Das ist falsch!", 2],
+        ["Lachen", "", "AfD", "", 2],
+        ["Zuruf", "", "CDU/CSU", "Quatsch!", 1],
+        ["Beifall", "", "SPD", "", 0],
+        ["Beifall", "", "BÜNDNIS 90/DIE GRÜNEN", "", 0],
+    ]
+    assert contributions_extended["id"].tolist() == [7] * 5
+    assert contributions_simplified.to_dict("list") == {
+        "text_position": [2, 1, 0],
+        "content": [
+            "(Lachen bei der AfD – Abg. Dr. Hans Müller [FDP]: Das ist falsch!)",
+            "(Zuruf von der CDU/CSU: Quatsch!)",
+            "(Beifall bei der SPD und dem BÜNDNIS 90/DIE GRÜNEN)",
+        ],
+        "speech_id": [7, 7, 7],
+    }
+
+
+def test_extract_without_brackets():
+    contributions_extended, speech_text, contributions_simplified, text_position = (
+        extract("Meine Damen und Herren!", 5001, 0)
+    )
+
+    assert speech_text == "Meine Damen und Herren!"
+    assert contributions_extended.empty
+    assert contributions_simplified.empty
+    assert text_position == 0
+    assert contributions_extended["id"].dtype == "int64"
+    assert contributions_simplified["content"].dtype == "object"
+
+
+def test_extract_into_collects_speeches():
+    contributions = Contributions()
+
+    speech_text, text_position = extract_into(contributions, SPEECH, 19003, 7)
+    extract_into(contributions, "Danke. (Heiterkeit bei der FDP)", 19003, 8)
+
+    assert speech_text == extract(SPEECH, 19003, 7)[1]
+    assert text_position == 3
+    assert len(contributions) == 4
+    contributions_extended = contributions.extended_frame()
+    assert contributions_extended["id"].tolist() == [7] * 5 + [8]
+    assert contributions_extended["type"].iloc[-1] == "Heiterkeit"
+    contributions_simplified = contributions.simplified_frame()
+    assert contributions_simplified["speech_id"].tolist() == [7, 7, 7, 8]
+    assert contributions_simplified.index.tolist() == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("session, name_Pattern_id", [(7114, 1), (7115, 0)])
+def test_person_Patterns(session, name_Pattern_id):
+    assert get_name_Pattern_id(session) == name_Pattern_id
+    pattern = person_Patterns[name_Pattern_id]["first_person"]
+
+    match = pattern.search("bei der SPD sowie des Abg. Anna Schmidt [SPD]")
+
+    assert match.group("name_raw").strip() == "Anna Schmidt"
+
+
+def test_pattern_registry_is_complete():
+    assert set(faction_Patterns) == set(parties)
+    assert {
+        "applause",
+        "cheerfulness",
+        "objection",
+        "laughter",
+        "approval",
+        "interruption",
+        "disturbance",
+        "faction_shout",
+    } == set(contribution_Patterns)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("(Beifall bei der SPD)", [extract_applause]),
+        (
+            "(Zuruf von der CDU/CSU: Quatsch!)",
+            [extract_person_interjection, extract_shout],
+        ),
+        ("(Sehr richtig! bei der FDP)", [extract_approval]),
+        ("(Unterbrechung der Sitzung)", []),
+    ],
+)
+def test_get_contribution_methods(text, expected):
+    assert get_contribution_methods(text) == expected
@@ -0,0 +1,39 @@
+import Levenshtein
+import pytest
+
+from open_discourse.helper.fuzzy_names import FuzzyNameIndex
+
+NAMES = ["müller", "mueller", "meyer", "maier", "schmidt", "schmitt", "kohl"]
+
+
+@pytest.mark.parametrize("query", ["müler", "meier", "schmid", "kohl", "xyz", ""])
+@pytest.mark.parametrize("fuzzy_threshold", [0.5, 0.7, 0.9])
+def test_lookup_matches_levenshtein_ratio(query, fuzzy_threshold):
+    index = FuzzyNameIndex(NAMES)
+
+    expected = [n for n in NAMES if Levenshtein.ratio(n, query) >= fuzzy_threshold]
+
+    assert index.lookup(query, fuzzy_threshold) == expected
+
+
+def test_lookup_with_percentage_threshold_never_matches():
+    assert FuzzyNameIndex(NAMES).lookup("kohl", 75) == []
+
+
+def test_lookup_many_deduplicates_and_bounds_cache():
+    index = FuzzyNameIndex(NAMES + [None], maxsize=2)
+
+    result = index.lookup_many(["meier", "meier", "kohl", "schmid"])
+
+    assert list(result) == ["meier", "kohl", "schmid"]
+    assert result["kohl"] == ["kohl"]
+    assert index.cache_info().currsize == 2
+
+
+def test_lookup_memoizes_queries():
+    index = FuzzyNameIndex(NAMES)
+
+    assert index.lookup("meier") == index.lookup("meier")
+    index.lookup("meier", 0.9)
+
+    assert index.cache_info() == (1, 2, 4096, 2)
@@ -0,0 +1,97 @@
+from open_discourse.helper.manifest import SessionManifest, code_version
+
+
+def test_manifest_skips_unchanged_sessions(tmp_path):
+    session = tmp_path / "01001.pkl"
+    output = tmp_path / "out" / "01001.pkl"
+    session.write_text("speech")
+    output.parent.mkdir()
+    manifest_path = tmp_path / "out" / "manifest.json"
+
+    manifest = SessionManifest(manifest_path, "v1")
+    assert not manifest.is_up_to_date(session, [output])
+    output.write_text("result")
+    manifest.save()
+
+    assert SessionManifest(manifest_path, "v1").is_up_to_date(session, [output])
+    # A new code version invalidates all sessions.
+    assert not SessionManifest(manifest_path, "v2").is_up_to_date(session, [output])
+
+    output.unlink()
+    assert not SessionManifest(manifest_path, "v1").is_up_to_date(session, [output])
+
+
+def test_manifest_detects_changed_content(tmp_path):
+    session = tmp_path / "01001.pkl"
+    session.write_text("speech")
+    manifest_path = tmp_path / "manifest.json"
+
+    manifest = SessionManifest(manifest_path, "v1")
+    manifest.is_up_to_date(session)
+    manifest.set_info(session, speech_count=1)
+    manifest.save()
+
+    manifest = SessionManifest(manifest_path, "v1")
+    assert manifest.is_up_to_date(session)
+    assert manifest.info(session) == {"speech_count": 1}
+
+    session.write_text("changed speech")
+    manifest = SessionManifest(manifest_path, "v1")
+    assert not manifest.is_up_to_date(session)
+    assert manifest.info(session) == {}
+
+
+def test_manifest_drops_removed_sessions(tmp_path):
+    sessions = [tmp_path / "01001.pkl", tmp_path / "01002.pkl"]
+    for session in sessions:
+        session.write_text(session.stem)
+    manifest_path = tmp_path / "manifest.json"
+
+    manifest = SessionManifest(manifest_path, "v1")
+    for session in sessions:
+        manifest.is_up_to_date(session)
+    manifest.save()
+
+    manifest = SessionManifest(manifest_path, "v1")
+    manifest.is_up_to_date(sessions[0])
+    manifest.save()
+
+    assert not SessionManifest(manifest_path, "v1").is_up_to_date(sessions[1])
+
+
+def test_manifest_deletes_outputs_of_removed_sessions(tmp_path):
+    sessions = [tmp_path / "01001.pkl", tmp_path / "01002.pkl"]
+    outputs = [tmp_path / "out" / session.name for session in sessions]
+    shared_output = tmp_path / "out" / "all.pkl"
+    (tmp_path / "out").mkdir()
+    for session, output in zip(sessions, outputs):
+        session.write_text(session.stem)
+        output.write_text(session.stem)
+    shared_output.write_text("all")
+    manifest_path = tmp_path / "out" / "manifest.json"
+
+    manifest = SessionManifest(manifest_path, "v1")
+    for session, output in zip(sessions, outputs):
+        manifest.is_up_to_date(session, [output, shared_output])
+    manifest.save()
+
+    sessions[1].unlink()
+    # Outputs of removed sessions are deleted, even if the version changed.
+    manifest = SessionManifest(manifest_path, "v2")
+    manifest.is_up_to_date(sessions[0], [outputs[0], shared_output])
+    assert manifest.removed_inputs() == ["../01002.pkl"]
+    manifest.save()
+
+    assert outputs[0].exists()
+    assert not outputs[1].exists()
+    assert shared_output.exists()
+
+
+def test_code_version(tmp_path):
+    config = tmp_path / "factions.pkl"
+    config.write_text("a")
+    version = code_version("x", config)
+
+    assert code_version("x", config) == version
+    config.write_text("b")
+    assert code_version("x", config) != version
@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+
+from open_discourse.helper.name_parser import split_name, split_names
+from open_discourse.steps.electoral_term_20.extract import get_first_last
+
+
+def test_split_names():
+    names = pd.Series(
+        ["Dr h c Hans Peter Müller", "Schmidt", "Dr", "", "Frau Dr Anna Schmidt"],
+        index=[3, 4, 5, 6, 7],
+    )
+    result = split_names(names)
+
+    assert result.index.to_list() == [3, 4, 5, 6, 7]
+    assert result["acad_title"].to_list() == [
+        ["Dr", "h", "c"],
+        [],
+        ["Dr"],
+        [],
+        ["Frau", "Dr"],
+    ]
+    assert result["first_name"].to_list() == [["Hans", "Peter"], [], [], [], ["Anna"]]
+    assert result["last_name"].to_list() == ["Müller", "Schmidt", "", "", "Schmidt"]
+    assert result["name_count"].to_list() == [3, 1, 0, 0, 2]
+
+
+def test_split_names_empty():
+    result = split_names(pd.Series([], dtype=object))
+    assert len(result) == 0
+    assert list(result.columns) == [
+        "acad_title",
+        "first_name",
+        "last_name",
+        "name_count",
+    ]
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["Dr h c Hans Peter Müller", "Schmidt", "Dr", "", " Otto  Graf  Lambsdorff "],
+)
+def test_split_name_matches_split_names(name):
+    row = split_names(pd.Series([name])).iloc[0]
+    assert split_name(name) == (row["acad_title"], row["first_name"], row["last_name"])
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("Hans Peter Müller", ("Hans Peter", "Müller")),
+        ("Dr. Müller", ("Dr.", "Müller")),
+        ("Müller", ("", "Müller")),
+    ],
+)
+def test_get_first_last(name, expected):
+    assert get_first_last(name) == expected
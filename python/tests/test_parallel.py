@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+from open_discourse.helper.parallel import (
+    get_chunksize,
+    get_worker_count,
+    run_parallel,
+)
+
+_offset = 0
+
+
+def _init_offset(offset):
+    global _offset
+    _offset = offset
+
+
+def _add_offset(value):
+    return value + _offset
+
+
+def _square(value):
+    return value * value
+
+
+def test_get_worker_count_from_env(monkeypatch):
+    monkeypatch.setenv("OPEN_DISCOURSE_WORKERS", "3")
+    assert get_worker_count() == 3
+    assert get_worker_count(2) == 2
+
+
+def test_get_worker_count_default(monkeypatch):
+    monkeypatch.delenv("OPEN_DISCOURSE_WORKERS", raising=False)
+    assert get_worker_count() == (os.cpu_count() or 1)
+
+
+def test_get_worker_count_invalid():
+    with pytest.raises(ValueError):
+        get_worker_count(0)
+
+
+@pytest.mark.parametrize(
+    "item_count, workers, expected",
+    [(0, 4, 1), (10, 4, 1), (100, 4, 7), (4000, 8, 125)],
+)
+def test_get_chunksize(item_count, workers, expected):
+    assert get_chunksize(item_count, workers) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_parallel_keeps_order(workers):
+    items = list(range(20))
+    assert run_parallel(_square, items, workers=workers, chunksize=3) == [
+        item * item for item in items
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_parallel_initializer(workers):
+    result = run_parallel(
+        _add_offset,
+        [1, 2, 3],
+        workers=workers,
+        initializer=_init_offset,
+        initargs=(10,),
+    )
+    assert result == [11, 12, 13]
+
+
+def test_run_parallel_default_chunksize():
+    items = list(range(101))
+    assert run_parallel(_square, items, workers=3) == [item * item for item in items]
+
+
+def test_run_parallel_empty():
+    assert run_parallel(_square, []) == []
@@ -1,6 +1,15 @@
 import pytest
 
-from open_discourse.helper.parser import get_session_content
+from open_discourse.helper.parser import (
+    APPENDIX_ANCHOR,
+    APPENDIX_PATTERN,
+    APPENDIX_WORDS,
+    BEGIN_ANCHOR,
+    BEGIN_PATTERN,
+    BEGIN_WORDS,
+    find_in_lines,
+    get_session_content,
+)
 
 
 @pytest.mark.parametrize(
@@ -41,3 +50,23 @@ Test
 )
 def test_get_session_content(text_corpus, expected):
     assert get_session_content(text_corpus) == expected
+
+
+def test_find_in_lines():
+    text_corpus = """Die Sitzung wird vertagt, die Sitzung wird eröffnet.
+Die Sitzung wird um 9 Uhr eröffnet. Die Sitzung wird um 14 Uhr eröffnet.
+Die 2. Sitzung wird um 11 Uhr nicht
+eröffnet.
+(Schluß der Sitzung: 12 Uhr.) (Schluß der Sitzung: 18 Uhr.)
+(Schluß: 19 Uhr.)"""
+
+    for pattern, anchor, words in [
+        (BEGIN_PATTERN, BEGIN_ANCHOR, BEGIN_WORDS),
+        (APPENDIX_PATTERN, APPENDIX_ANCHOR, APPENDIX_WORDS),
+    ]:
+        matches = find_in_lines(pattern, text_corpus, anchor, words)
+
+        assert len(matches) == 2
+        assert [match.span() for match in matches] == [
+            match.span() for match in pattern.finditer(text_corpus)
+        ]
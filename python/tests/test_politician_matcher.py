@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+
+from open_discourse.helper.match_names import insert_politician_id_into_speech_content
+from open_discourse.helper.politician_matcher import PoliticianMatcher
+
+
+@pytest.fixture
+def politicians():
+    politicians = pd.DataFrame(
+        {
+            "ui": [1, 2, 3, 4, 5, 6],
+            "electoral_term": [1, 1, 1, 1, 1, 1],
+            "faction_id": [0, 1, 1, 2, 3, 3],
+            "first_name": [["hans"], ["peter"], ["anna"], ["karl"], ["otto"], ["eva"]],
+            "last_name": ["müller", "meyer", "meyer", "schmidt", "kohl", "kohl"],
+            "gender": ["männlich", "männlich", "weiblich", "männlich", "m", "weiblich"],
+            "profession": ["präsident dbt", None, None, "jurist", None, None],
+            "constituency": ["", "hagen", "bremen", "", "", ""],
+            "institution_type": [
+                "Mitglied des Bundestages",
+                "Mitglied des Bundestages",
+                "Mitglied des Bundestages",
+                "Regierungsmitglied",
+                "Mitglied des Bundestages",
+                "Mitglied des Bundestages",
+            ],
+        }
+    )
+    return politicians
+
+
+def speech(position_short, last_name, **kwargs):
+    row = {
+        "session": "01001",
+        "faction_id": -1,
+        "position_short": position_short,
+        "position_long": "",
+        "last_name": last_name,
+        "first_name": [],
+        "acad_title": [],
+        "constituency": "",
+        "speech_content": "",
+    }
+    row.update(kwargs)
+    return row
+
+
+@pytest.mark.parametrize(
+    "row, expected",
+    [
+        (speech("Member of Parliament", "Müller"), 1),
+        (speech("Member of Parliament", "Mülller"), 1),
+        (speech("Member of Parliament", "Meyer", faction_id=1), -1),
+        (speech("Member of Parliament", "Meyer", first_name=["Anna"]), 3),
+        (speech("Member of Parliament", "Meyer", constituency="Hagen"), 2),
+        (speech("Member of Parliament", "Kohl", acad_title=["Frau"]), 6),
+        (speech("Presidium of Parliament", "Müller", position_long="Präsident"), 1),
+        (speech("Minister", "Schmidt"), 4),
+        (speech("Chancellor", "Meyer"), -1),
+        (speech("Secretary of State", "Meyer", position_long="Staatssekretär"), -1),
+        (speech("Guest", "Müller"), -1),
+    ],
+)
+def test_insert_politician_id_into_speech_content(politicians, row, expected):
+    mgs = politicians.loc[politicians["institution_type"] == "Regierungsmitglied"]
+    df, problems = insert_politician_id_into_speech_content(
+        pd.DataFrame([row]), politicians, mgs, politicians
+    )
+
+    assert df["politician_id"].tolist() == [expected]
+    assert len(problems) == (1 if expected == -1 else 0)
+
+
+def test_matcher_memoizes_speakers(politicians):
+    mgs = politicians.loc[politicians["institution_type"] == "Regierungsmitglied"]
+    matcher = PoliticianMatcher(politicians, mgs)
+    df = pd.DataFrame([speech("Member of Parliament", "müller")] * 3)
+
+    results = matcher.match_speeches(df)
+
+    assert [result.politician_id for result in results] == [1, 1, 1]
+    assert len(matcher._cache) == 1
@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+
+from open_discourse.helper.position_classifier import (
+    Position,
+    PositionClassifier,
+    get_faction_abbrev,
+    get_position_short_and_long,
+    guest_electoral_term_20_pattern,
+)
+
+FACTIONS = pd.DataFrame(
+    {"abbreviation": ["SPD", "CDU/CSU", "SPD", "FDP"], "id": [23, 4, 99, 13]}
+)
+
+
+@pytest.mark.parametrize(
+    "faction, expected",
+    [
+        ("SPD", "SPD"),
+        ("CDU/CSU", "CDU/CSU"),
+        ("F.D.P.", "FDP"),
+        ("BÜNDNIS 90/DIE GRÜNEN", "Bündnis 90/Die Grünen"),
+        ("fraktionslos", "Fraktionslos"),
+        ("Bundesminister", None),
+    ],
+)
+def test_get_faction_abbrev(faction, expected):
+    assert get_faction_abbrev(faction) == expected
+
+
+@pytest.mark.parametrize(
+    "position, expected",
+    [
+        ("SPD", ("Member of Parliament", None)),
+        ("Berichterstatter", ("Member of Parliament", "Berichterstatter")),
+        ("Vizepräsidentin", ("Presidium of Parliament", "Vizepräsidentin")),
+        ("Alterspräsident", ("Presidium of Parliament", "Alterspräsident")),
+        ("Senator (Hamburg)", ("Guest", "Senator (Hamburg)")),
+        ("Bundeskanzlerin", ("Chancellor", None)),
+        ("Bundesminister der Finanzen", ("Minister", "Bundesminister der Finanzen")),
+        ("Ministerpräsident", ("Minister", "Ministerpräsident")),
+        ("Parl. Staatssekretär", ("Secretary of State", "Parl. Staatssekretär")),
+        ("Wehrbeauftragter", ("Not found", None)),
+    ],
+)
+def test_get_position_short_and_long(position, expected):
+    assert get_position_short_and_long(position) == expected
+
+
+def test_get_position_short_and_long_electoral_term_20():
+    assert get_position_short_and_long(
+        "Ministerpräsident", guest_electoral_term_20_pattern
+    ) == ("Guest", "Ministerpräsident")
+
+
+def test_classify():
+    classifier = PositionClassifier(FACTIONS)
+
+    # The first id of an abbreviation wins.
+    assert classifier.classify("SPD") == Position(
+        "SPD", 23, "Member of Parliament", None
+    )
+    # Abbreviations missing in factions get the id -1.
+    assert classifier.classify("PDS") == Position(
+        "PDS", -1, "Member of Parliament", None
+    )
+    assert classifier.classify("Bundesminister\n\nder Finanzen") == Position(
+        None, -1, "Minister", "Bundesminister der Finanzen"
+    )
+
+    classifier.classify("SPD")
+    assert classifier.classify.cache_info().hits == 1
+
+
+def test_classify_many():
+    classifier = PositionClassifier(FACTIONS)
+    positions_raw = pd.Series(
+        ["SPD", "Bundeskanzler", "F.D.P.", "SPD", ""], index=[5, 6, 7, 8, 9]
+    )
+
+    result = classifier.classify_many(positions_raw)
+
+    assert result.index.to_list() == [5, 6, 7, 8, 9]
+    assert result["faction_abbrev"].to_list() == ["SPD", None, "FDP", "SPD", None]
+    assert result["faction_id"].to_list() == [23, -1, 13, 23, -1]
+    assert result["position_short"].to_list() == [
+        "Member of Parliament",
+        "Chancellor",
+        "Member of Parliament",
+        "Member of Parliament",
+        "Not found",
+    ]
+    assert classifier.classify.cache_info().misses == 4
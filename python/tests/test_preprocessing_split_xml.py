@@ -1,3 +1,5 @@
+import io
+import zipfile
 from collections import namedtuple
 from xml.etree.ElementTree import ParseError
 
@@ -5,8 +7,13 @@ import pytest
 import regex
 
 import open_discourse.definitions.path as path
+from open_discourse.helper.archive import archive_member
+from open_discourse.helper.session_store import iter_sessions, store_files
+from open_discourse.steps.preprocessing import split_xml
 from open_discourse.steps.preprocessing.split_xml import (
     define_single_session_regex_pattern,
+    read_session_tags,
+    split_sessions,
     split_single_session_xml_data,
 )
 
@@ -176,6 +183,23 @@ def test_pp_split_xml_data(tmp_path, case: namedtuple):
         assert result[1] == case.expected[1]
 
 
+@pytest.mark.parametrize("case", test_cases)
+def test_pp_split_xml_data_from_archive(tmp_path, case: namedtuple):
+    # the same file as member of a downloaded archive
+    archive_path = tmp_path / "electoral_term_pp04.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr(case.input[0], case.input[1].encode("utf-8"))
+    member = archive_member(archive_path, case.input[0])
+
+    if case.exception:
+        with pytest.raises(case.exception):
+            split_single_session_xml_data(member)
+    else:
+        result = split_single_session_xml_data(member)
+        assert result[0] == case.expected[0]
+        assert result[1] == case.expected[1]
+
+
 # ========================================
 # test cases for define_single_session_regex_pattern (list of namedtuple)
 # ========================================
@@ -217,3 +241,92 @@ def test_pp_define_regex_pattern(case: namedtuple):
     else:
         result = define_single_session_regex_pattern(case.input)
         assert result == case.expected
+
+
+def test_pp_read_session_tags():
+    xml = b"""<DOKUMENT>
+    <NR>03/4</NR>
+    <TITEL><NR>nested</NR></TITEL>
+    <NR>duplicate</NR>
+    <TEXT>Text <B>bold</B></TEXT>
+    </DOKUMENT>"""
+
+    # Like tree.find, only the first tag below the root is read.
+    assert read_session_tags(io.BytesIO(xml)) == {"NR": "03/4", "TEXT": "Text "}
+
+
+def session_xml(term: int, session: int, text: str) -> str:
+    return (
+        f"<DOKUMENT><WAHLPERIODE>{term}</WAHLPERIODE>"
+        f"<DOKUMENTART>PLENARPROTOKOLL</DOKUMENTART><NR>{term:02}/{session}</NR>"
+        f"<DATUM>05.11.1957</DATUM><TEXT>{text}</TEXT></DOKUMENT>"
+    )
+
+
+def test_pp_split_sessions(tmp_path, monkeypatch):
+    monkeypatch.setattr(path, "RAW_TXT", tmp_path / "txt")
+    monkeypatch.setattr(split_xml, "xml_source_dir", lambda: tmp_path / "zip")
+    (tmp_path / "zip").mkdir()
+    with zipfile.ZipFile(tmp_path / "zip" / "electoral_term_pp01.zip", "w") as archive:
+        text = (
+            "Inhalt\nDie Sitzung wird um 9 Uhr eröffnet.\nRede\n"
+            "(Schluß der Sitzung: 17.53 Uhr.)"
+        )
+        archive.writestr("01004.xml", session_xml(1, 4, text))
+    with zipfile.ZipFile(tmp_path / "zip" / "electoral_term_pp03.zip", "w") as archive:
+        text = "Inhalt\nBeginn: 9.00 Uhr\nRede\n(Schluß der Sitzung: 17.53 Uhr.)"
+        archive.writestr("03004.xml", session_xml(3, 4, text))
+        # without beginning
+        text = "Inhalt\n(Schluß: 17.53 Uhr.)"
+        archive.writestr("03005.xml", session_xml(3, 5, text))
+
+    assert split_sessions((1, 3), workers=1) == 2
+
+    assert list(store_files(tmp_path / "txt")) == [1, 3]
+    # Only the spoken content of the first two electoral terms.
+    assert list(iter_sessions(tmp_path / "txt" / "electoral_term_pp01.parquet")) == [
+        {
+            "session": "01004",
+            "document_number": "01/4",
+            "date": "05.11.1957",
+            "toc": None,
+            "session_content": ".\nRede\n",
+            "appendix": None,
+        }
+    ]
+    assert list(iter_sessions(tmp_path / "txt" / "electoral_term_pp03.parquet")) == [
+        {
+            "session": "03004",
+            "document_number": "03/4",
+            "date": "05.11.1957",
+            "toc": "Inhalt\nBeginn: 9.00 Uhr",
+            "session_content": "\nRede\n",
+            "appendix": "(Schluß der Sitzung: 17.53 Uhr.)\n\nEND OF FILE",
+        }
+    ]
+
+
+def test_pp_split_sessions_missing_tags(tmp_path, monkeypatch):
+    monkeypatch.setattr(path, "RAW_TXT", tmp_path / "txt")
+    monkeypatch.setattr(split_xml, "xml_source_dir", lambda: tmp_path / "zip")
+    (tmp_path / "zip").mkdir()
+    without_term = regex.compile(r"<WAHLPERIODE>.*?</WAHLPERIODE>")
+    with zipfile.ZipFile(tmp_path / "zip" / "electoral_term_pp01.zip", "w") as archive:
+        text = (
+            "Inhalt\nDie Sitzung wird um 9 Uhr eröffnet.\nRede\n"
+            "(Schluß der Sitzung: 17.53 Uhr.)"
+        )
+        # The first two electoral terms don't need WAHLPERIODE.
+        archive.writestr("01004.xml", without_term.sub("", session_xml(1, 4, text)))
+    with zipfile.ZipFile(tmp_path / "zip" / "electoral_term_pp03.zip", "w") as archive:
+        text = "Inhalt\nBeginn: 9.00 Uhr\nRede\n(Schluß der Sitzung: 17.53 Uhr.)"
+        archive.writestr("03004.xml", session_xml(3, 4, text))
+        # Later terms do, the protocol is skipped.
+        archive.writestr("03005.xml", without_term.sub("", session_xml(3, 5, text)))
+
+    assert split_sessions((1, 3), workers=1) == 2
+
+    sessions = iter_sessions(tmp_path / "txt" / "electoral_term_pp01.parquet")
+    assert [session["session_content"] for session in sessions] == [".\nRede\n"]
+    sessions = iter_sessions(tmp_path / "txt" / "electoral_term_pp03.parquet")
+    assert [session["session"] for session in sessions] == ["03004"]
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from open_discourse.helper.protocol_catalog import ProtocolCatalog, parse_listing
+
+# Listing pages of the Bundestag filterlist, three protocols per page, newest first.
+LISTING_DIR = Path(__file__).parent / "data" / "protocol_catalog"
+
+
+def url(session: int) -> str:
+    blob = 1000000 + session
+    return f"https://www.bundestag.de/resource/blob/{blob}/{blob:x}f3a9/20{session}.xml"
+
+
+class RecordedListing:
+    """Serves the recorded listing pages and counts the requested offsets."""
+
+    def __init__(self):
+        self.offsets = []
+
+    def __call__(self, offset: int) -> str:
+        self.offsets.append(offset)
+        return (LISTING_DIR / f"listing_offset_{offset:02}.html").read_text()
+
+
+@pytest.fixture
+def listing():
+    return RecordedListing()
+
+
+def test_parse_listing():
+    protocols = parse_listing((LISTING_DIR / "listing_offset_00.html").read_text())
+
+    # Only the XML links, not the PDF links.
+    assert protocols == [("20215", url(215)), ("20214", url(214)), ("20213", url(213))]
+
+
+def test_parse_listing_empty_page():
+    assert parse_listing((LISTING_DIR / "listing_offset_09.html").read_text()) == []
+
+
+def test_discover_with_empty_catalog(tmp_path, listing):
+    catalog = ProtocolCatalog(tmp_path / "catalog.json")
+
+    protocols = catalog.discover(listing)
+
+    assert protocols == {f"20{session}": url(session) for session in range(207, 216)}
+    assert listing.offsets == [0, 3, 6, 9]
+
+
+def test_discover_stops_at_known_protocols(tmp_path, listing):
+    catalog = ProtocolCatalog(tmp_path / "catalog.json")
+    catalog.update({f"20{session}": url(session) for session in range(207, 213)})
+    catalog.save()
+
+    protocols = ProtocolCatalog(tmp_path / "catalog.json").discover(listing)
+
+    assert protocols == {"20213": url(213), "20214": url(214), "20215": url(215)}
+    # The second page links known protocols, so the third is not requested.
+    assert listing.offsets == [0, 3]
+
+
+def test_discover_finds_changed_urls(tmp_path, listing):
+    catalog = ProtocolCatalog(tmp_path / "catalog.json")
+    catalog.update({f"20{session}": url(session) for session in range(207, 216)})
+    catalog.update({"20214": "https://www.bundestag.de/resource/blob/1/old/20214.xml"})
+
+    assert catalog.discover(listing) == {"20214": url(214)}
+    assert listing.offsets == [0]
+
+
+def test_discover_full(tmp_path, listing):
+    catalog = ProtocolCatalog(tmp_path / "catalog.json")
+    catalog.update({f"20{session}": url(session) for session in range(207, 216)})
+    catalog.update({"20208": "https://www.bundestag.de/resource/blob/1/old/20208.xml"})
+
+    assert catalog.discover(listing, full=True) == {"20208": url(208)}
+    assert listing.offsets == [0, 3, 6, 9]
@@ -9,6 +9,11 @@ from open_discourse.helper.session_file_iterator import (
     session_file_iterator,
     validate_term_session,
 )
+from open_discourse.helper.session_store import (
+    StoredSession,
+    store_file,
+    write_store,
+)
 
 # Definition Named Tuple for test cases, don't name it Testcase!!!
 CaseDataforTest = namedtuple("CaseDataforTest", ["input", "expected", "exception"])
@@ -220,7 +225,7 @@ def prepare_valid_test_files(dynamic_patch_paths):
         elif elem == "RAW_TXT":
             suffix = ".txt"
         elif elem == "SPEECH_CONTENT_STAGE_02":
-            suffix = ".pkl"
+            suffix = ".parquet"
         else:
             suffix = ""
 
@@ -230,10 +235,10 @@ def prepare_valid_test_files(dynamic_patch_paths):
         session_list = sorted([19, 34, 56])
 
         for t in term_list:
-            # create directories based on tmp_path
-            create_dir = Path(test_dir, f"electoral_term_pp{t:02}.zip")
-            create_dir.mkdir(parents=True, exist_ok=True)
             if elem == "RAW_XML" or elem == "SPEECH_CONTENT_STAGE_02":
+                # create directories based on tmp_path
+                create_dir = Path(test_dir, f"electoral_term_pp{t:02}.zip")
+                create_dir.mkdir(parents=True, exist_ok=True)
                 # invalid file
                 sample_file = create_dir / f"x47P13{suffix}"
                 sample_file.write_text("<content>Test</content>")
@@ -241,14 +246,15 @@ def prepare_valid_test_files(dynamic_patch_paths):
                     sample_file = create_dir / f"{t:02}{s:03}{suffix}"
                     sample_file.write_text("<content>Test</content>")
             elif elem == "RAW_TXT":
-                for s in session_list:
-                    # create sub directory
-                    create_dir = Path(
-                        test_dir, f"electoral_term_pp{t:02}.zip", f"{t:02}{s:03}"
-                    )
-                    create_dir.mkdir(parents=True, exist_ok=True)
-                    sample_file = create_dir / "session_content.txt"
-                    sample_file.write_text("<content>Test</content>")
+                # one session store per term
+                test_dir.mkdir(parents=True, exist_ok=True)
+                write_store(
+                    store_file(test_dir, f"electoral_term_pp{t:02}"),
+                    [
+                        {"session": f"{t:02}{s:03}", "session_content": "Test"}
+                        for s in session_list
+                    ],
+                )
 
 
 @pytest.mark.parametrize("case", test_cases)
@@ -270,12 +276,11 @@ def test_session_file_iterator(
         assert len(result_list) == len(case.expected)
         result_short_list = []
         for r in result_list:
-            # special handling of text, due to session_content as filename and
-            # additional sub directory
-            print("test_dir:", test_dir.parts)
+            # special handling of text, the sessions of the session stores
             if set(("01_raw", "txt")).issubset(test_dir.parts):
-                assert r.stem == "session_content"
-                result_short_list.append(r.parent.stem)
+                assert isinstance(r, StoredSession)
+                assert r.read(["session_content"]) == {"session_content": "Test"}
+                result_short_list.append(r.session)
             else:
                 result_short_list.append(r.stem)
         assert sorted(result_short_list) == sorted(case.expected)
@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+from open_discourse.helper.session_index import INDEX_NAME, session_index
+
+
+def make_sessions(source_dir, term, sessions, file_name="{}.xml"):
+    folder_path = source_dir / f"electoral_term_pp{term:02}.zip"
+    for session in sessions:
+        file_path = folder_path / file_name.format(f"{term:02}{session:03}")
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text("<content>Test</content>")
+    return folder_path
+
+
+def test_session_index_of_session_files(tmp_path):
+    make_sessions(tmp_path, 9, [34, 19])
+    make_sessions(tmp_path, 4, [56, 19])
+    (tmp_path / "electoral_term_pp04.zip" / "04019.txt").write_text("")
+    (tmp_path / "other").mkdir()
+
+    index = session_index(tmp_path, "*.xml")
+
+    assert list(index) == [4, 9]
+    assert [path.name for path in index[4]] == ["04019.xml", "04056.xml"]
+    assert [path.name for path in index[9]] == ["09019.xml", "09034.xml"]
+    assert index[4][0] == tmp_path / "electoral_term_pp04.zip" / "04019.xml"
+
+
+def test_session_index_of_session_folders(tmp_path):
+    make_sessions(tmp_path, 15, [56, 19], file_name="{}/session_content.txt")
+    # A session folder without a session_content.txt is no session.
+    (tmp_path / "electoral_term_pp15.zip" / "15034").mkdir()
+
+    index = session_index(tmp_path, "session_content.txt")
+
+    assert [path.parent.name for path in index[15]] == ["15019", "15056"]
+    assert all(path.name == "session_content.txt" for path in index[15])
+
+
+def test_session_index_is_stored(tmp_path):
+    make_sessions(tmp_path, 4, [19])
+    session_index(tmp_path, "*.xml")
+
+    with open(tmp_path / INDEX_NAME) as file:
+        stored = json.load(file)
+    assert stored["file_pattern"] == "*.xml"
+    assert stored["folders"]["electoral_term_pp04.zip"]["sessions"] == ["04019.xml"]
+
+    # An unchanged folder is not scanned again.
+    stored["folders"]["electoral_term_pp04.zip"]["sessions"] = ["04034.xml"]
+    with open(tmp_path / INDEX_NAME, "w") as file:
+        json.dump(stored, file)
+    assert [path.name for path in session_index(tmp_path, "*.xml")[4]] == ["04034.xml"]
+    # Another file pattern is indexed from scratch.
+    assert session_index(tmp_path, "*.parquet") == {4: []}
+
+
+def test_session_index_rescans_changed_folders(tmp_path):
+    folder_path = make_sessions(tmp_path, 4, [19])
+    session_index(tmp_path, "*.xml")
+
+    make_sessions(tmp_path, 4, [34])
+    # Make sure the modification time differs on coarse grained file systems.
+    stat = folder_path.stat()
+    os.utime(folder_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert [path.name for path in session_index(tmp_path, "*.xml")[4]] == [
+        "04019.xml",
+        "04034.xml",
+    ]
+
+
+def test_session_index_skips_invalid_files(tmp_path, caplog):
+    folder_path = make_sessions(tmp_path, 4, [19])
+    (folder_path / "x47P13.xml").write_text("")
+
+    index = session_index(tmp_path, "*.xml")
+
+    assert [path.name for path in index[4]] == ["04019.xml"]
+    assert "x47P13.xml" in caplog.text
+
+
+def test_session_index_inconsistent_term(tmp_path):
+    folder_path = make_sessions(tmp_path, 4, [19])
+    (folder_path / "05001.xml").write_text("")
+
+    with pytest.raises(ValueError):
+        session_index(tmp_path, "*.xml")
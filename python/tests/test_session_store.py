@@ -0,0 +1,72 @@
+import pyarrow.parquet as pq
+import pytest
+
+from open_discourse.helper.session_store import (
+    iter_sessions,
+    read_session,
+    store_file,
+    store_files,
+    store_sessions,
+    write_store,
+)
+
+
+def session(number: str, content: str, toc: str | None = None) -> dict:
+    return {
+        "session": number,
+        "document_number": f"{number[:2]}/{int(number[2:])}",
+        "date": "05.11.1957",
+        "toc": toc,
+        "session_content": content,
+        "appendix": None,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store_path = store_file(tmp_path, "electoral_term_pp05")
+    sessions = [session("05002", "Rede 2", "Inhalt"), session("05001", "Rede 1")]
+    assert write_store(store_path, sessions) == 2
+    return store_path
+
+
+def test_write_store(store):
+    assert store.name == "electoral_term_pp05.parquet"
+    # One row group per session, the footer indexes the sessions.
+    assert pq.ParquetFile(store).num_row_groups == 2
+    assert store_sessions(store) == ["05002", "05001"]
+
+
+def test_read_session(store):
+    assert read_session(store, "05001") == session("05001", "Rede 1")
+    assert read_session(store, "05002", ["session_content"]) == {
+        "session_content": "Rede 2"
+    }
+    with pytest.raises(KeyError):
+        read_session(store, "05003")
+
+
+def test_read_session_of_rewritten_store(store):
+    read_session(store, "05001")
+    write_store(store, [session("05003", "Rede 3")])
+
+    assert store_sessions(store) == ["05003"]
+    assert read_session(store, "05003")["session_content"] == "Rede 3"
+
+
+def test_iter_sessions(store):
+    assert list(iter_sessions(store, ["session", "toc"])) == [
+        {"session": "05002", "toc": "Inhalt"},
+        {"session": "05001", "toc": None},
+    ]
+
+
+def test_store_files(tmp_path, store):
+    write_store(store_file(tmp_path, "electoral_term_pp19"), [])
+    (tmp_path / "02_02.done").touch()
+    (tmp_path / "electoral_term_pp04").mkdir()
+
+    assert store_files(tmp_path) == {
+        5: store,
+        19: tmp_path / "electoral_term_pp19.parquet",
+    }
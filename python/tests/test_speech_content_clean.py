@@ -0,0 +1,38 @@
+import pandas as pd
+
+from open_discourse.helper.position_classifier import PositionClassifier
+from open_discourse.helper.storage import read_frame, write_frame
+from open_discourse.steps.speech_content import clean
+
+FACTIONS = pd.DataFrame({"abbreviation": ["SPD", "CDU/CSU"], "id": [23, 4]})
+
+
+def test_clean_session(tmp_path, monkeypatch):
+    monkeypatch.setattr(clean, "_classifier", PositionClassifier(FACTIONS))
+    input_path = tmp_path / "05001.parquet"
+    write_frame(
+        pd.DataFrame(
+            {
+                "session": ["05001"] * 3,
+                "name_raw": ["Dr. Wolfgang Schäuble", "Lammert", "..."],
+                "position_raw": ["CDU/CSU", "Präsident", "SPD"],
+                "constituency": ["Offenburg", None, None],
+                "speech_content": ["Meine Damen und Herren!\n"] * 3,
+                "span_begin": [0, 10, 20],
+                "span_end": [10, 20, 30],
+            }
+        ),
+        input_path,
+    )
+    save_path = tmp_path / "electoral_term_05"
+    save_path.mkdir()
+
+    clean.clean_session((input_path, save_path))
+    session_df = read_frame(save_path / "05001.parquet")
+
+    assert session_df["acad_title"].to_list() == [["Dr"], [], []]
+    assert session_df["first_name"].to_list() == [["Wolfgang"], [], []]
+    assert session_df["last_name"].to_list() == ["Schäuble", "Lammert", "ERROR"]
+    assert session_df["faction_id"].to_list() == [4, -1, 23]
+    assert "name_raw" not in session_df.columns
+    assert "position_raw" not in session_df.columns
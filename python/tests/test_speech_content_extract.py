@@ -0,0 +1,88 @@
+from open_discourse.helper.session_store import write_store
+from open_discourse.helper.storage import read_frame
+from open_discourse.steps.speech_content.extract import (
+    find_speakers,
+    process_session,
+)
+
+SESSION_CONTENT = """
+Präsident Dr. Gerstenmaier: Die Sitzung ist eröffnet.
+Dr. Hans Müller (Hamburg) (SPD): Meine Damen und Herren,
+wir beraten heute den Haushalt.
+(Beifall bei der SPD)
+Schäffer, Bundesminister der Finanzen: Der Entwurf liegt vor.
+Vizepräsident Dr. Jaeger: Das Wort hat der Abgeordnete Schmidt.
+Schmidt (Hamburg) (FDP): Danke.
+"""
+
+
+def test_process_session(tmp_path):
+    store_path = tmp_path / "electoral_term_pp03.parquet"
+    write_store(store_path, [{"session": "03004", "session_content": SESSION_CONTENT}])
+
+    process_session((store_path, "03004", 3, tmp_path))
+    session_df = read_frame(tmp_path / "03004.parquet")
+
+    assert session_df.columns.to_list() == [
+        "session",
+        "name_raw",
+        "position_raw",
+        "constituency",
+        "speech_content",
+        "span_begin",
+        "span_end",
+    ]
+    assert session_df["session"].to_list() == ["03004"] * 5
+    assert session_df["name_raw"].to_list() == [
+        "Dr. Gerstenmaier",
+        "Dr. Hans Müller",
+        "Schäffer",
+        "Dr. Jaeger",
+        "Schmidt",
+    ]
+    assert session_df["position_raw"].to_list() == [
+        "Präsident",
+        "SPD",
+        "Bundesminister der Finanzen",
+        "Vizepräsident",
+        "FDP",
+    ]
+    assert session_df["constituency"].to_list() == [
+        None,
+        "Hamburg",
+        None,
+        None,
+        "Hamburg",
+    ]
+    assert session_df["speech_content"].to_list() == [
+        "Die Sitzung ist eröffnet.\n",
+        "Meine Damen und Herren,\nwir beraten heute den Haushalt.\n"
+        "(Beifall bei der SPD)\n",
+        "Der Entwurf liegt vor.\n",
+        "Das Wort hat der Abgeordnete Schmidt.\n",
+        "Danke.\n",
+    ]
+    assert session_df["span_begin"].is_monotonic_increasing
+
+
+def test_process_session_without_speakers(tmp_path):
+    store_path = tmp_path / "electoral_term_pp03.parquet"
+    write_store(store_path, [{"session": "03005", "session_content": "Keine Reden.\n"}])
+
+    process_session((store_path, "03005", 3, tmp_path))
+    session_df = read_frame(tmp_path / "03005.parquet")
+
+    assert session_df.empty
+    assert session_df["span_begin"].dtype == "int64"
+
+
+def test_find_speakers_keeps_overlapping_matches():
+    # The president pattern also matches within the position of the minister.
+    session_content = "\nSchäffer, Bundesminister Präsident Müller: Rede\n"
+
+    speakers = find_speakers(session_content, 3)
+
+    assert [(speaker.group("name_raw"), speaker.span()) for speaker in speakers] == [
+        ("Schäffer", (1, 44)),
+        ("Müller", (26, 44)),
+    ]
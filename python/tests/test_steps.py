@@ -7,7 +7,7 @@ import open_discourse.steps
     "task_fnc, expected_number_actions",
     [
         ("task_01_download", 3),
-        ("task_02_preprocessing", 5),
+        ("task_02_preprocessing", 4),
         ("task_03_factions", 2),
         ("task_04_politicians", 3),
         ("task_05_speech_content", 3),
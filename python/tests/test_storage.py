@@ -0,0 +1,96 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from open_discourse.helper.storage import (
+    FrameWriter,
+    count_rows,
+    iter_frames,
+    read_frame,
+    session_file,
+    session_files,
+    write_frame,
+)
+
+
+def speech_content():
+    return pd.DataFrame(
+        {
+            "session": ["05001", "05001", "05002"],
+            "electoral_term": [5, 5, 5],
+            "first_name": [["hans", "peter"], [], ["anna"]],
+            "last_name": ["müller", "", "meyer"],
+            "faction_id": [1, -1, 3],
+            "constituency": [None, "hagen", ""],
+            "speech_content": ["Herr Präsident!", "", "Meine Damen und Herren!"],
+        },
+        index=[2, 0, 1],
+    )
+
+
+def test_write_and_read_frame(tmp_path):
+    df = speech_content()
+    file_path = session_file(tmp_path, "05001")
+
+    write_frame(df, file_path)
+
+    assert file_path.name == "05001.parquet"
+    assert session_files(tmp_path) == [file_path]
+    assert count_rows(file_path) == 3
+    result = read_frame(file_path)
+    pd.testing.assert_frame_equal(result, df)
+    assert isinstance(result["first_name"].iloc[0], list)
+
+
+def test_read_frame_columns_and_filters(tmp_path):
+    file_path = tmp_path / "speech_content.parquet"
+    write_frame(speech_content(), file_path, row_group_size=1)
+
+    result = read_frame(
+        file_path,
+        columns=["session", "last_name"],
+        filters=[("session", "==", "05002")],
+    )
+
+    assert result.columns.tolist() == ["session", "last_name"]
+    assert result["last_name"].tolist() == ["meyer"]
+
+
+def test_frame_writer_appends_frames(tmp_path):
+    file_path = tmp_path / "speech_content.parquet"
+    schema = pa.schema([("id", pa.int64()), ("last_name", pa.string())])
+
+    with FrameWriter(file_path, schema, row_group_size=2) as writer:
+        for last_names in (["müller", "meyer", "kohl"], ["schmidt"]):
+            df = pd.DataFrame({"last_name": last_names, "other": 0})
+            writer.write(df.assign(id=range(writer.rows, writer.rows + len(df))))
+
+    result = read_frame(file_path)
+    assert result.columns.tolist() == ["id", "last_name"]
+    assert result["id"].tolist() == [0, 1, 2, 3]
+    assert result["last_name"].tolist() == ["müller", "meyer", "kohl", "schmidt"]
+
+
+def test_frame_writer_discards_file_on_error(tmp_path):
+    file_path = tmp_path / "speech_content.parquet"
+    schema = pa.schema([("id", pa.int64())])
+
+    with pytest.raises(RuntimeError):
+        with FrameWriter(file_path, schema) as writer:
+            writer.write(pd.DataFrame({"id": [0]}))
+            raise RuntimeError
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_iter_frames(tmp_path):
+    df = speech_content().reset_index(drop=True)
+    file_path = session_file(tmp_path, "05001")
+    write_frame(df, file_path)
+
+    batches = list(iter_frames(file_path, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[0]["first_name"].tolist() == [["hans", "peter"], []]
+    result = pd.concat(batches, ignore_index=True)
+    pd.testing.assert_frame_equal(result, df)
@@ -0,0 +1,37 @@
+import numpy as np
+
+from open_discourse.topic_modelling.upload_data_cubes import flatten_data_cube
+
+
+def test_flatten_data_cube():
+    data_cube = np.arange(12, dtype=float).reshape(2, 3, 2) / 10
+    weight_cube = np.arange(12).reshape(2, 3, 2)
+    dims = {
+        "politician": [("p1",), ("p2",)],
+        "topic": [("Topic_A",), ("topic_b",), ("topic_c",)],
+        "year": [("y1990",), ("y1991",)],
+    }
+
+    tables = dict(flatten_data_cube(data_cube, weight_cube, dims))
+
+    # referenced tables come first
+    assert list(tables) == ["year", "topic", "politician"]
+
+    year = tables["year"]
+    assert year["id"].tolist() == list(range(12))
+    assert year["value"].tolist() == data_cube.ravel().tolist()
+    assert year["n"].tolist() == list(range(12))
+
+    # row i of topic contains the years 2 * i and 2 * i + 1
+    topic = tables["topic"]
+    assert topic.columns.tolist() == ["id", "y1990", "y1991"]
+    assert topic.loc[4].tolist() == [4, 8, 9]
+
+    # the first dimension is identified by its keys, column names are lowercase
+    politician = tables["politician"]
+    assert politician.columns.tolist() == ["id", "topic_a", "topic_b", "topic_c"]
+    assert politician.values.tolist() == [["p1", 0, 1, 2], ["p2", 3, 4, 5]]
+    # every cell is reachable from the first dimension
+    topic_ids = politician.loc[1, ["topic_a", "topic_b", "topic_c"]].tolist()
+    year_ids = topic.loc[topic_ids, ["y1990", "y1991"]].values.ravel()
+    assert year.loc[year_ids, "value"].tolist() == data_cube[1].ravel().tolist()
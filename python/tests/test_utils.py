@@ -1,11 +1,8 @@
 from pathlib import Path
 
-import pyparsing as pp
 import pytest
 
-from open_discourse.helper.utils import get_term_from_path
-
-term_number_parser = pp.Literal("electoral_term") + "_" + pp.Word(pp.nums, exact=2)
+from open_discourse.helper.utils import PathMetadata, get_term_from_path, parse_path
 
 
 @pytest.mark.parametrize(
@@ -22,3 +19,21 @@ term_number_parser = pp.Literal("electoral_term") + "_" + pp.Word(pp.nums, exact
 )
 def test_get_term_from_path(folder_path, expected):
     assert get_term_from_path(folder_path) == expected
+
+
+@pytest.mark.parametrize(
+    "file_path, expected",
+    [
+        (Path("/raw/xml/electoral_term_pp05.zip/05001.xml"), PathMetadata(5, 1)),
+        (
+            Path("/raw/txt/electoral_term_pp19.zip/19239/session_content.txt"),
+            PathMetadata(19, 239),
+        ),
+        ("/stage_02/electoral_term_pp04.zip/04019.parquet", PathMetadata(4, 19)),
+        (Path("/stage_02/electoral_term_pp04.zip"), PathMetadata(4, None)),
+        (Path("/stage_02/electoral_term_pp04.zip/x47P13.xml"), PathMetadata(4, None)),
+        (Path("/some/path/no_term"), PathMetadata(None, None)),
+    ],
+)
+def test_parse_path(file_path, expected):
+    assert parse_path(file_path) == expected